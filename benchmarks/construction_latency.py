@@ -0,0 +1,80 @@
+"""Measures the latency of hashing a short (16-byte) message, including the construction of the hash function,
+and compares it with reusing a single instance.
+
+Usage:
+    python -m benchmarks.construction_latency [--number 2000]
+"""
+import argparse
+import timeit
+from typing import Any, List
+
+from hashbase import (
+    MD2,
+    MD4,
+    MD5,
+    SHA1,
+    SHA224,
+    SHA256,
+    SHA384,
+    SHA512,
+    SHA512_224,
+    SHA512_256,
+    RIPEMD128,
+    RIPEMD160,
+    RIPEMD256,
+    RIPEMD320,
+    CRC8,
+    CRC16,
+)
+
+HASH_FUNCTIONS: List[Any] = [
+    MD2,
+    MD4,
+    MD5,
+    SHA1,
+    SHA224,
+    SHA256,
+    SHA384,
+    SHA512,
+    SHA512_224,
+    SHA512_256,
+    RIPEMD128,
+    RIPEMD160,
+    RIPEMD256,
+    RIPEMD320,
+    CRC8,
+    CRC16,
+]
+
+MESSAGE = b"0123456789abcdef"
+
+
+def best_time_per_call(statement, number: int, repeat: int = 5) -> float:
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'algorithm':<12}{'construct':>14}{'new + hash':>14}{'reuse + hash':>14}")
+    for hash_function in HASH_FUNCTIONS:
+        instance = hash_function()
+        construct = best_time_per_call(hash_function, args.number)
+        new_and_hash = best_time_per_call(
+            lambda: hash_function().generate_hash(MESSAGE), args.number
+        )
+        reuse_and_hash = best_time_per_call(
+            lambda: instance.generate_hash(MESSAGE), args.number
+        )
+        print(
+            f"{hash_function.__name__:<12}"
+            f"{construct * 1e6:>12.2f}us"
+            f"{new_and_hash * 1e6:>12.2f}us"
+            f"{reuse_and_hash * 1e6:>12.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
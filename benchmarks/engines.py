@@ -0,0 +1,46 @@
+"""Compares the throughput of the reference and the unrolled compression functions.
+
+Usage:
+    python -m benchmarks.engines [--size 65536]
+"""
+import argparse
+import time
+from typing import Any, List
+
+from hashbase import MD5, SHA1, SHA224, SHA256, SHA384, SHA512
+
+HASH_FUNCTIONS: List[Any] = [MD5, SHA1, SHA224, SHA256, SHA384, SHA512]
+
+
+def throughput(hash_function: Any, engine: str, message: bytes, repeat: int) -> float:
+    hasher = hash_function(backend="python")
+    hasher.engine = engine
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hasher.generate_hash(message)
+        best = min(best, time.perf_counter() - start)
+    return len(message) / best / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=64 * 1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    message = bytes(range(256)) * (args.size // 256)
+    print(f"{'algorithm':<12}{'reference':>14}{'unrolled':>14}{'speedup':>10}")
+    for hash_function in HASH_FUNCTIONS:
+        reference = throughput(hash_function, "reference", message, args.repeat)
+        unrolled = throughput(hash_function, "unrolled", message, args.repeat)
+        print(
+            f"{hash_function.__name__:<12}"
+            f"{reference:>10.2f}MB/s"
+            f"{unrolled:>10.2f}MB/s"
+            f"{unrolled / reference:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
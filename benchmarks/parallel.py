@@ -0,0 +1,41 @@
+"""Measures the throughput of hashbase.parallel.hash_many with an increasing number of workers.
+
+Usage:
+    python -m benchmarks.parallel [--count 20000] [--size 64] [--backend python] [--executor process]
+"""
+import argparse
+import os
+import time
+from functools import partial
+
+from hashbase import SHA256
+from hashbase.parallel import hash_many
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--backend", default="python")
+    parser.add_argument("--executor", default="process")
+    args = parser.parse_args()
+
+    algorithm = partial(SHA256, backend=args.backend)
+    messages = [
+        index.to_bytes(8, "big") * (args.size // 8) for index in range(args.count)
+    ]
+    print(f"{'workers':<10}{'messages/s':>14}{'speedup':>10}")
+    baseline = 0.0
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        for _ in hash_many(messages, algorithm, workers, args.executor):
+            pass
+        rate = args.count / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"{workers:<10}{rate:>14.0f}{rate / baseline:>9.1f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,83 @@
-from hashbase.md2 import *
-from hashbase.md4 import *
-from hashbase.md5 import *
-from hashbase.sha1 import *
-from hashbase.sha224 import *
-from hashbase.sha256 import *
-from hashbase.sha512 import *
-from hashbase.sha512_224 import *
-from hashbase.sha512_256 import *
-from hashbase.sha384 import *
-from hashbase.ripemd128 import *
-from hashbase.ripemd160 import *
-from hashbase.ripemd256 import *
-from hashbase.ripemd320 import *
-from hashbase.crc8 import *
-from hashbase.crc16 import *
+import sys
+from typing import TYPE_CHECKING, Any, List
+
+# The public names of the package and the submodules that define them. The submodules are imported on first access
+# (PEP 562), so that e.g. `from hashbase import SHA256` only loads `hashbase.sha256` and the modules it depends on,
+# instead of the 16 algorithms, the code generation of 5 compression functions and multiprocessing.
+# Python 3.6 has no module-level __getattr__, so it imports everything eagerly, as do type checkers.
+LAZY_ATTRIBUTES = {
+    "MD2": "hashbase.md2",
+    "MD4": "hashbase.md4",
+    "MD5": "hashbase.md5",
+    "SHA1": "hashbase.sha1",
+    "SHA224": "hashbase.sha224",
+    "SHA256": "hashbase.sha256",
+    "SHA512": "hashbase.sha512",
+    "SHA512_224": "hashbase.sha512_224",
+    "SHA512_256": "hashbase.sha512_256",
+    "SHA512_t": "hashbase.sha512_t",
+    "SHA384": "hashbase.sha384",
+    "RIPEMD128": "hashbase.ripemd128",
+    "RIPEMD160": "hashbase.ripemd160",
+    "RIPEMD256": "hashbase.ripemd256",
+    "RIPEMD320": "hashbase.ripemd320",
+    "CRC": "hashbase.crc",
+    "CRCParameters": "hashbase.crc",
+    "CRC_CATALOGUE": "hashbase.crc",
+    "parallel_crc": "hashbase.crc",
+    "CRC8": "hashbase.crc8",
+    "CRC16": "hashbase.crc16",
+    "Digest": "hashbase.digest",
+    "hash_file": "hashbase.files",
+    "MultiHasher": "hashbase.multi",
+}
+
+__all__ = list(LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING or sys.version_info < (3, 7):
+    from hashbase.md2 import *
+    from hashbase.md4 import *
+    from hashbase.md5 import *
+    from hashbase.sha1 import *
+    from hashbase.sha224 import *
+    from hashbase.sha256 import *
+    from hashbase.sha512 import *
+    from hashbase.sha512_224 import *
+    from hashbase.sha512_256 import *
+    from hashbase.sha512_t import *
+    from hashbase.sha384 import *
+    from hashbase.ripemd128 import *
+    from hashbase.ripemd160 import *
+    from hashbase.ripemd256 import *
+    from hashbase.ripemd320 import *
+    from hashbase.crc import *
+    from hashbase.crc8 import *
+    from hashbase.crc16 import *
+    from hashbase.digest import *
+    from hashbase.files import *
+    from hashbase.multi import *
+else:
+
+    def __getattr__(name: str) -> Any:
+        """Imports the submodule that defines a public name on first access and caches the name in the package.
+
+        Args:
+            name (str): The name of the attribute.
+
+        Returns:
+            Any: The value of the attribute.
+        """
+        if name not in LAZY_ATTRIBUTES:
+            raise AttributeError(f"module 'hashbase' has no attribute '{name}'")
+        # __import__ goes through the C import machinery, which `-X importtime` reports (unlike importlib)
+        value = getattr(__import__(LAZY_ATTRIBUTES[name], fromlist=[name]), name)
+        globals()[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        """Lists the attributes of the package, including the public names that are not imported yet.
+
+        Returns:
+            List[str]: The names of the attributes.
+        """
+        return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
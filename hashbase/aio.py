@@ -0,0 +1,135 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Optional
+
+from hashbase.digest import Digest
+from hashbase.utils import Message, message_to_memoryview
+
+__all__ = ["hash_stream", "hash_async_iter"]
+
+# Hashing of asyncio streams without blocking the event loop. The chunks are hashed as they arrive, either:
+#   - on the event loop, in slices that are small enough to keep the loop responsive, yielding to the other tasks
+#     after every slice (default)
+#   - in an executor (e.g. a ThreadPoolExecutor), where each chunk is hashed while the next one is read
+# Only one chunk is read ahead of the chunk being hashed, so a fast producer is slowed down to the hashing speed
+# (backpressure) and the memory per stream is bounded by 2 chunks.
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# A slice takes about 5 ms with the Python compression functions and less than 1 ms with hashlib
+PYTHON_SLICE_SIZE = 4 * 1024
+ACCELERATED_SLICE_SIZE = 1024 * 1024
+
+
+def default_slice_size(hasher: Any) -> int:
+    """The number of bytes hashed between two yields to the event loop.
+
+    Args:
+        hasher (Any): The hash function.
+
+    Returns:
+        int: The size of the slices in bytes.
+    """
+    if getattr(hasher, "active_backend", "python") == "python":
+        return PYTHON_SLICE_SIZE
+    return ACCELERATED_SLICE_SIZE
+
+
+async def update_in_slices(hasher: Any, chunk: Message, slice_size: int) -> None:
+    """Feed a chunk into a hash function in slices, yielding to the event loop after every slice.
+
+    Args:
+        hasher (Any): The hash function.
+        chunk (Message): The chunk.
+        slice_size (int): The size of the slices in bytes.
+    """
+    view = message_to_memoryview(chunk)
+    for start in range(0, len(view), slice_size):
+        hasher.update(view[start : start + slice_size])
+        await asyncio.sleep(0)
+
+
+async def hash_async_iter(
+    chunks: AsyncIterable[Message],
+    algorithm: Callable[[], Any],
+    executor: Optional[Executor] = None,
+    slice_size: Optional[int] = None,
+) -> Digest:
+    """Generates the hash of the chunks of an async iterable (e.g. an async generator of request body chunks).
+
+    Args:
+        chunks (AsyncIterable[Message]): The chunks of the message.
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`) or a function that creates a hash
+            function.
+        executor (Optional[Executor]): The executor that hashes the chunks, or None to hash them on the event loop.
+        slice_size (Optional[int]): The number of bytes hashed on the event loop between two yields, defaults to
+            4 KiB for the Python backend and 1 MiB for hashlib.
+
+    Returns:
+        Digest: The hash of the message.
+    """
+    hasher = algorithm()
+    if executor is None:
+        slice_size = slice_size or default_slice_size(hasher)
+        async for chunk in chunks:
+            await update_in_slices(hasher, chunk, slice_size)
+        return Digest(hasher.digest())
+
+    loop = asyncio.get_event_loop()
+    pending: Optional[asyncio.Future] = None
+    try:
+        async for chunk in chunks:
+            # The chunks must be hashed in order, so the previous one has to be done before the next is submitted
+            if pending is not None:
+                await pending
+            pending = loop.run_in_executor(executor, hasher.update, chunk)
+        if pending is not None:
+            await pending
+    except BaseException:
+        if pending is not None:
+            pending.cancel()
+        raise
+    return Digest(hasher.digest())
+
+
+async def read_chunks(reader: Any, chunk_size: int) -> AsyncIterator[bytes]:
+    """Reads the chunks of a stream until EOF.
+
+    Args:
+        reader (Any): An `asyncio.StreamReader` or any object with a `read(n)` coroutine.
+        chunk_size (int): The maximum size of the chunks in bytes.
+
+    Yields:
+        bytes: The next chunk.
+    """
+    while True:
+        chunk = await reader.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def hash_stream(
+    reader: Any,
+    algorithm: Callable[[], Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+    slice_size: Optional[int] = None,
+) -> Digest:
+    """Generates the hash of a stream, read until EOF, without blocking the event loop.
+
+    Args:
+        reader (Any): An `asyncio.StreamReader` or any object with a `read(n)` coroutine.
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`) or a function that creates a hash
+            function.
+        chunk_size (int): The maximum number of bytes read at a time.
+        executor (Optional[Executor]): The executor that hashes the chunks, or None to hash them on the event loop.
+        slice_size (Optional[int]): The number of bytes hashed on the event loop between two yields, defaults to
+            4 KiB for the Python backend and 1 MiB for hashlib.
+
+    Returns:
+        Digest: The hash of the stream.
+    """
+    return await hash_async_iter(
+        read_chunks(reader, chunk_size), algorithm, executor, slice_size
+    )
@@ -0,0 +1,86 @@
+import hashlib
+import warnings
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# hashbase is written in pure Python, but most of its algorithms are also provided by the C implementations of the
+# standard library (hashlib/OpenSSL, zlib and binascii). Each hash function selects its backend with `backend`:
+#   - 'auto' (default): the C implementation when the standard library provides it, the Python code otherwise
+#   - 'stdlib': the C implementation, or a ValueError when it is not available
+#   - 'python': always the Python code
+# and reports the implementation in use with `active_backend` ('hashlib', 'zlib', 'binascii' or 'python').
+# Before an accelerated backend is used for the first time, both backends hash the self-check messages below and the
+# accelerated backend is only used if they agree.
+
+BACKENDS = ("auto", "stdlib", "python")
+
+# Messages of 0 to 3 blocks, including the padding boundaries of 64-byte and 128-byte blocks
+SELF_CHECK_MESSAGES = (
+    b"",
+    b"abc",
+    b"123456789",
+    b"a" * 55,
+    b"a" * 56,
+    b"a" * 111,
+    b"a" * 112,
+    bytes(range(256)),
+)
+
+verified_backends: Dict[Hashable, bool] = {}
+
+
+def validate_backend(backend: str) -> None:
+    """Raises a ValueError for an unknown backend.
+
+    Args:
+        backend (str): The name of the backend.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+
+
+@lru_cache(maxsize=None)
+def hashlib_constructor(name: str) -> Optional[Callable[..., Any]]:
+    """Looks up (once per process) whether hashlib provides an algorithm, which depends on the local OpenSSL.
+
+    Args:
+        name (str): The hashlib name of the algorithm.
+
+    Returns:
+        Optional[Callable[..., Any]]: A constructor of hashlib objects of the algorithm, or None if it is not available.
+    """
+    try:
+        hashlib.new(name)
+    except ValueError:
+        return None
+    return lambda *args: hashlib.new(name, *args)
+
+
+def verify_backend(
+    key: Hashable,
+    python_hash: Callable[[bytes], bytes],
+    accelerated_hash: Callable[[bytes], bytes],
+) -> bool:
+    """Checks (once per process and key) that the Python and the accelerated backend of an algorithm agree on the
+    self-check messages.
+
+    Args:
+        key (Hashable): Identifies the algorithm and its parameters.
+        python_hash (Callable[[bytes], bytes]): Hashes a message with the Python backend.
+        accelerated_hash (Callable[[bytes], bytes]): Hashes a message with the accelerated backend.
+
+    Returns:
+        bool: Whether the accelerated backend can be used.
+    """
+    if key not in verified_backends:
+        verified = all(
+            python_hash(message) == accelerated_hash(message)
+            for message in SELF_CHECK_MESSAGES
+        )
+        if not verified:
+            warnings.warn(
+                f"The accelerated backend of {key} disagrees with the Python backend and is disabled",
+                RuntimeWarning,
+            )
+        verified_backends[key] = verified
+    return verified_backends[key]
@@ -0,0 +1,297 @@
+import platform
+import re
+import subprocess
+import sys
+import timeit
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from hashbase import (
+    MD2,
+    MD4,
+    MD5,
+    SHA1,
+    SHA224,
+    SHA256,
+    SHA384,
+    SHA512,
+    SHA512_224,
+    SHA512_256,
+    RIPEMD128,
+    RIPEMD160,
+    RIPEMD256,
+    RIPEMD320,
+    CRC8,
+    CRC16,
+)
+from hashbase.merkle_damgard import MerkleDamgardHash
+from hashbase.utils import message_padding
+
+# Benchmarks of the construction, padding, compression and end-to-end hashing time of every algorithm.
+# Every measurement is the best time per call out of `repeat` runs, where each run makes enough calls to last at
+# least `min_time` seconds. The results are keyed by "<algorithm> <measurement>", e.g. "SHA256 hash 1024B", so that
+# they can be stored as JSON and compared against a baseline with `compare_to_baseline`.
+
+ALGORITHMS: Dict[str, Any] = {
+    "MD2": MD2,
+    "MD4": MD4,
+    "MD5": MD5,
+    "SHA1": SHA1,
+    "SHA224": SHA224,
+    "SHA256": SHA256,
+    "SHA384": SHA384,
+    "SHA512": SHA512,
+    "SHA512_224": SHA512_224,
+    "SHA512_256": SHA512_256,
+    "RIPEMD128": RIPEMD128,
+    "RIPEMD160": RIPEMD160,
+    "RIPEMD256": RIPEMD256,
+    "RIPEMD320": RIPEMD320,
+    "CRC8": CRC8,
+    "CRC16": CRC16,
+}
+
+DEFAULT_SIZES = (0, 64, 1024, 64 * 1024)
+
+# Statements whose import time is measured in a fresh interpreter, from the cheapest to the most expensive
+IMPORT_STATEMENTS = (
+    "import hashbase",
+    "from hashbase import SHA256",
+    "from hashbase import *",
+)
+SIZE_UNITS = {"K": 1024, "M": 1024 * 1024}
+
+
+def parse_size(size: str) -> int:
+    """Parses an input size in bytes, with an optional K/KiB or M/MiB suffix, e.g. "64M" or "1KiB".
+
+    Args:
+        size (str): The input size.
+
+    Returns:
+        int: The size in bytes.
+    """
+    match = re.fullmatch(r"(\d+)\s*([KM]?)(?:I?B)?", size.strip().upper())
+    if match is None:
+        raise ValueError(f"Invalid size: {size}")
+    return int(match.group(1)) * SIZE_UNITS.get(match.group(2), 1)
+
+
+def format_size(size: int) -> str:
+    """Formats an input size in bytes with the largest exact unit, e.g. "64MiB".
+
+    Args:
+        size (int): The size in bytes.
+
+    Returns:
+        str: The formatted size.
+    """
+    for unit, multiple in (("MiB", 1024 * 1024), ("KiB", 1024)):
+        if size and size % multiple == 0:
+            return f"{size // multiple}{unit}"
+    return f"{size}B"
+
+
+def time_per_call(function: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """Measures the best time of a call to a function.
+
+    Args:
+        function (Callable[[], Any]): The function to measure.
+        repeat (int): The number of runs.
+        min_time (float): The minimum duration of a run in seconds.
+
+    Returns:
+        float: The best time per call in seconds.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        best = min(best, timer.timeit(number) / number)
+    return best
+
+
+def benchmark_algorithm(
+    name: str,
+    sizes: Iterable[int],
+    backend: str = "auto",
+    repeat: int = 3,
+    min_time: float = 0.01,
+) -> Dict[str, Dict[str, float]]:
+    """Benchmarks one algorithm: the construction of a hash function, the padding and the compression of a message
+    block by the Python code, and the end-to-end hashing of messages of each size.
+
+    Args:
+        name (str): The name of the algorithm in `ALGORITHMS`.
+        sizes (Iterable[int]): The sizes of the messages in bytes.
+        backend (str): The backend used for the construction and the end-to-end hashing ("auto" or "python").
+        repeat (int): The number of runs of each measurement.
+        min_time (float): The minimum duration of a run in seconds.
+
+    Returns:
+        Dict[str, Dict[str, float]]: The "seconds" per call (and "mb_per_s" when data is hashed) of each measurement.
+    """
+    hash_function = ALGORITHMS[name]
+    results: Dict[str, Dict[str, float]] = {}
+
+    def record(measurement: str, seconds: float, size: Optional[int] = None) -> None:
+        results[f"{name} {measurement}"] = {"seconds": seconds}
+        if size:
+            results[f"{name} {measurement}"]["mb_per_s"] = size / seconds / 1e6
+
+    def construct() -> Any:
+        hasher = hash_function()
+        if getattr(hasher, "backend", backend) != backend:
+            hasher.backend = backend
+        return hasher
+
+    record("construction", time_per_call(construct, repeat, min_time))
+
+    if issubclass(hash_function, MerkleDamgardHash):
+        reference = hash_function(backend="python")
+        record(
+            "padding",
+            time_per_call(
+                lambda: message_padding(
+                    55,
+                    reference.message_length_byteorder,
+                    reference.message_length_padding_bits,
+                    reference.block_size * 8,
+                ),
+                repeat,
+                min_time,
+            ),
+        )
+        process_message_block = reference.get_block_processor()
+        block = memoryview(bytes(range(reference.block_size)))
+        record(
+            "compression",
+            time_per_call(lambda: process_message_block(block), repeat, min_time),
+            reference.block_size,
+        )
+    elif hash_function is MD2:
+        record(
+            "padding",
+            time_per_call(
+                lambda: MD2.apply_message_padding(b"x" * 15), repeat, min_time
+            ),
+        )
+
+    hasher = construct()
+    for size in sizes:
+        message = (bytes(range(256)) * (size // 256 + 1))[:size]
+        record(
+            f"hash {format_size(size)}",
+            time_per_call(lambda: hasher.generate_hash(message), repeat, min_time),
+            size,
+        )
+    return results
+
+
+def parse_import_time(importtime_output: str) -> float:
+    """Sums the cumulative time of the top-level hashbase imports reported by `python -X importtime`, which includes
+    the modules imported by the lazy attributes of the package.
+
+    Args:
+        importtime_output (str): The output of `-X importtime` (stderr).
+
+    Returns:
+        float: The import time in seconds.
+    """
+    microseconds = 0
+    for line in importtime_output.splitlines():
+        fields = line.split("|")
+        # Nested imports are indented by 2 spaces per level
+        if len(fields) == 3 and fields[2].rstrip() == " " + fields[2].strip():
+            if fields[2].strip().split(".")[0] == "hashbase":
+                microseconds += int(fields[1])
+    return microseconds / 1e6
+
+
+def measure_import_time(statement: str, repeat: int = 3) -> float:
+    """Measures the best import time of a statement, each time in a fresh interpreter.
+
+    Args:
+        statement (str): The import statement, e.g. "from hashbase import SHA256".
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The best import time in seconds.
+    """
+    return min(
+        parse_import_time(
+            subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", statement],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+                check=True,
+            ).stderr
+        )
+        for _ in range(repeat)
+    )
+
+
+def run_benchmarks(
+    algorithms: Optional[Iterable[str]] = None,
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    backend: str = "auto",
+    repeat: int = 3,
+    min_time: float = 0.01,
+    imports: bool = True,
+) -> Dict[str, Any]:
+    """Benchmarks the algorithms (and the import time of the package) and collects the results with a description of
+    the environment.
+
+    Args:
+        algorithms (Optional[Iterable[str]]): The names of the algorithms, defaults to all of `ALGORITHMS`.
+        sizes (Iterable[int]): The sizes of the messages in bytes.
+        backend (str): The backend used for the construction and the end-to-end hashing ("auto" or "python").
+        repeat (int): The number of runs of each measurement.
+        min_time (float): The minimum duration of a run in seconds.
+        imports (bool): Whether to measure the import time of `IMPORT_STATEMENTS`.
+
+    Returns:
+        Dict[str, Any]: The JSON-serializable report, with the measurements under "results".
+    """
+    sizes = list(sizes)
+    results: Dict[str, Dict[str, float]] = {}
+    if imports:
+        for statement in IMPORT_STATEMENTS:
+            results[statement] = {"seconds": measure_import_time(statement, repeat)}
+    for name in ALGORITHMS if algorithms is None else algorithms:
+        results.update(benchmark_algorithm(name, sizes, backend, repeat, min_time))
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "backend": backend,
+        "results": results,
+    }
+
+
+def compare_to_baseline(
+    report: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Finds the measurements that are slower than in the baseline by more than the threshold.
+
+    Args:
+        report (Dict[str, Any]): The report of `run_benchmarks`.
+        baseline (Dict[str, Any]): A previous report.
+        threshold (float): The tolerated slowdown, e.g. 0.1 for 10%.
+
+    Returns:
+        List[str]: A description of each regression.
+    """
+    regressions = []
+    for key, result in report["results"].items():
+        if key not in baseline["results"]:
+            continue
+        ratio = result["seconds"] / baseline["results"][key]["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append(f"{key}: {ratio:.2f}x slower than the baseline")
+    return regressions
@@ -0,0 +1,84 @@
+"""Benchmarks the throughput and latency of the hashbase algorithms.
+
+Usage:
+    python -m hashbase.bench [--algorithms SHA256,MD5] [--sizes 0,64,1K,1M,64M] [--backend python]
+                             [--no-imports] [--output results.json] [--baseline baseline.json --threshold 0.1]
+
+Exits with status 1 when a measurement is slower than in the baseline by more than the threshold.
+"""
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from hashbase.bench import (
+    ALGORITHMS,
+    DEFAULT_SIZES,
+    compare_to_baseline,
+    format_size,
+    parse_size,
+    run_benchmarks,
+)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--algorithms", default=",".join(ALGORITHMS))
+    parser.add_argument(
+        "--sizes", default=",".join(format_size(size) for size in DEFAULT_SIZES)
+    )
+    parser.add_argument("--backend", choices=("auto", "python"), default="auto")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time", type=float, default=0.01)
+    parser.add_argument(
+        "--no-imports",
+        action="store_true",
+        help="do not measure the import time of the package",
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare the results to this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="tolerated slowdown compared to the baseline (default: 0.1 = 10%%)",
+    )
+    args = parser.parse_args(argv)
+
+    algorithms = [name.strip() for name in args.algorithms.split(",")]
+    unknown = [name for name in algorithms if name not in ALGORITHMS]
+    if unknown:
+        parser.error(f"unknown algorithms: {', '.join(unknown)}")
+    report = run_benchmarks(
+        algorithms,
+        [parse_size(size) for size in args.sizes.split(",")],
+        args.backend,
+        args.repeat,
+        args.min_time,
+        not args.no_imports,
+    )
+
+    print(f"{'measurement':<32}{'latency':>14}{'throughput':>16}")
+    for key, result in report["results"].items():
+        throughput = f"{result['mb_per_s']:>12.2f}MB/s" if "mb_per_s" in result else ""
+        print(f"{key:<32}{result['seconds'] * 1e6:>12.2f}µs{throughput:>16}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
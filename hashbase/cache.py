@@ -0,0 +1,132 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple
+
+from hashbase.digest import Digest
+from hashbase.utils import Message, message_to_memoryview
+
+__all__ = ["CachedHasher", "CacheInfo"]
+
+
+class CacheInfo(NamedTuple):
+    """The counters and the size of a `CachedHasher`.
+
+    Args:
+        hits (int): The number of digests returned from the cache.
+        misses (int): The number of digests computed.
+        evictions (int): The number of entries evicted to stay within the limits.
+        entries (int): The number of cached entries.
+        bytes (int): The size of the cached messages and digests in bytes.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+class CachedHasher:
+    """Memoizes the hashes of repeated messages (e.g. tokens or paths) in a thread-safe LRU cache.
+    The cache is keyed on the full message bytes, so a cached digest is only returned for exactly the same message.
+    The least recently used entries are evicted when the cache holds more than `max_entries` entries or more than
+    `max_bytes` bytes of messages and digests; messages larger than `max_bytes` are hashed but not cached.
+
+    Args:
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`) or a function that creates a hash
+            function.
+        max_entries (int): The maximum number of cached messages.
+        max_bytes (int): The maximum size of the cached messages and digests in bytes.
+    """
+
+    def __init__(
+        self,
+        algorithm: Callable[[], Any],
+        max_entries: int = 1024,
+        max_bytes: int = 1024 * 1024,
+    ) -> None:
+        self.algorithm = algorithm
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Empty the cache and reset the counters."""
+        with self.lock:
+            self.entries: "OrderedDict[bytes, bytes]" = OrderedDict()
+            self.size = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        """The hit, miss and eviction counters and the size of the cache.
+
+        Returns:
+            CacheInfo: The counters and the size.
+        """
+        with self.lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, len(self.entries), self.size
+            )
+
+    def hash_message(self, message: bytes) -> bytes:
+        """Computes the hash of a message that is not cached.
+
+        Args:
+            message (bytes): The message.
+
+        Returns:
+            bytes: The hash of the message.
+        """
+        hasher = self.algorithm()
+        hasher.update(message)
+        return hasher.digest()
+
+    def generate_digest(self, message: Message) -> Digest:
+        """Generates the hash of the input message, from the cache if the same message was hashed recently.
+
+        Args:
+            message (Message): The input message/text or a bytes-like object.
+
+        Returns:
+            Digest: The hash of the message.
+        """
+        if isinstance(message, bytes):
+            key = message
+        else:
+            key = bytes(message_to_memoryview(message))
+        with self.lock:
+            digest = self.entries.get(key)
+            if digest is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return Digest(digest)
+            self.misses += 1
+
+        # Hash without holding the lock, so that other threads are not blocked by a long message
+        digest = self.hash_message(key)
+        entry_size = len(key) + len(digest)
+        if entry_size > self.max_bytes or self.max_entries < 1:
+            return Digest(digest)
+        with self.lock:
+            if key not in self.entries:
+                self.entries[key] = digest
+                self.size += entry_size
+                while (
+                    len(self.entries) > self.max_entries or self.size > self.max_bytes
+                ):
+                    evicted_key, evicted_digest = self.entries.popitem(last=False)
+                    self.size -= len(evicted_key) + len(evicted_digest)
+                    self.evictions += 1
+        return Digest(digest)
+
+    def generate_hash(self, message: Message) -> str:
+        """Generates the hash of the input message, from the cache if the same message was hashed recently.
+
+        Args:
+            message (Message): The input message/text or a bytes-like object.
+
+        Returns:
+            str: The hash of the message as a hexadecimal string.
+        """
+        return self.generate_digest(message).hex()
@@ -0,0 +1,301 @@
+import struct
+from typing import Callable, List, Sequence, Tuple
+
+# The compression functions of MD5, SHA-1 and SHA-2 are generated as straight-line Python source once, at import
+# time, and compiled with exec. Compared to the reference implementations this removes the round loop, the branches
+# on the round index, the list allocations of `modular_add` and the attribute lookups of the constants:
+#   - the round constants, rotation amounts and message word indices are inlined as literals
+#   - the registers are never shifted (h = g, g = f, ...); instead each round renames the variables
+#   - values are reduced modulo 2^n only before they are right-shifted or stored, since the bits above the word
+#     size do not affect the lower bits of +, ^, &, | and <<
+
+BlockProcessor = Callable[..., None]
+
+
+def rotate_left_expression(x: str, s: int, size: int = 32) -> str:
+    """Source of the (unmasked) circular rotation of x left by s bit positions."""
+    return f"({x} << {s} | {x} >> {size - s})"
+
+
+def rotate_right_expression(x: str, s: int, size: int = 32) -> str:
+    """Source of the (unmasked) circular rotation of x right by s bit positions."""
+    return f"({x} >> {s} | {x} << {size - s})"
+
+
+def compile_block_processor(
+    source_lines: List[str], words_format: str, name: str, registers: Sequence[str]
+) -> BlockProcessor:
+    """Compiles the generated source of a `process_message_words` function, which compresses a block that is already
+    unpacked into 16 words, and wraps it in a `process_message_block` function that unpacks the block first.
+
+    Args:
+        source_lines (List[str]): The lines of the generated function.
+        words_format (str): The struct format used to unpack the message block into 16 words.
+        name (str): The name of the algorithm, used as the filename of the compiled code.
+        registers (Sequence[str]): The names of the register attributes.
+
+    Returns:
+        BlockProcessor: The compiled `process_message_block(self, message_block)` function, with the
+            `process_message_words(self, words)` function, the `words_format` and the `registers` as attributes.
+    """
+    source = "\n".join(source_lines) + "\n"
+    source += (
+        "def process_message_block(self, message_block):\n"
+        "    process_message_words(self, unpack(message_block))\n"
+    )
+    namespace = {"unpack": struct.Struct(words_format).unpack}
+    exec(compile(source, f"<hashbase.codegen {name}>", "exec"), namespace)
+    block_processor = namespace["process_message_block"]
+    block_processor.__doc__ = f"Compress a message block into the registers ({name}, generated unrolled code)."
+    block_processor.process_message_words = namespace["process_message_words"]  # type: ignore
+    block_processor.words_format = words_format  # type: ignore
+    block_processor.registers = tuple(registers)  # type: ignore
+    block_processor.source = source  # type: ignore
+    return block_processor  # type: ignore
+
+
+def function_header(registers: Sequence[str]) -> Tuple[List[str], List[str]]:
+    """The first lines of a generated function: take the 16 message words and load the registers.
+
+    Args:
+        registers (Sequence[str]): The names of the register attributes.
+
+    Returns:
+        Tuple[List[str], List[str]]: The source lines and the names of the working variables.
+    """
+    variables = [f"v{i}" for i in range(len(registers))]
+    lines = [
+        "def process_message_words(self, words):",
+        f"    {', '.join(f'w{i}' for i in range(16))} = words",
+    ]
+    for i, register in enumerate(registers):
+        lines.append(f"    h{i} = v{i} = self.{register}")
+    return lines, variables
+
+
+def function_footer(
+    registers: Sequence[str], variables: List[str], rounds: int, mask: str
+) -> List[str]:
+    """The last lines of a generated function: add the working variables to the registers.
+
+    Args:
+        registers (Sequence[str]): The names of the register attributes.
+        variables (List[str]): The names of the working variables.
+        rounds (int): The number of rounds, which determines the final naming of the working variables.
+        mask (str): The source of the mask that reduces the registers modulo 2^n.
+
+    Returns:
+        List[str]: The source lines.
+    """
+    count = len(registers)
+    return [
+        f"    self.{register} = (h{i} + {variables[(i - rounds) % count]}) & {mask}"
+        for i, register in enumerate(registers)
+    ]
+
+
+def unroll_md5(
+    round_constants: Sequence[int], shifts: Sequence[int], registers: Sequence[str]
+) -> BlockProcessor:
+    """Generates the unrolled MD5 compression function.
+
+    Args:
+        round_constants (Sequence[int]): The 64 constants K.
+        shifts (Sequence[int]): The 64 left rotation amounts.
+        registers (Sequence[str]): The names of the 4 register attributes.
+
+    Returns:
+        BlockProcessor: The compiled `process_message_block` function.
+    """
+    lines, v = function_header(registers)
+    mask = "0xFFFFFFFF"
+    for i in range(64):
+        a, b, c, d = v[(0 - i) % 4], v[(1 - i) % 4], v[(2 - i) % 4], v[(3 - i) % 4]
+        if i < 16:
+            f, g = f"({d} ^ ({b} & ({c} ^ {d})))", i
+        elif i < 32:
+            f, g = f"({c} ^ ({d} & ({b} ^ {c})))", (5 * i + 1) % 16
+        elif i < 48:
+            f, g = f"({b} ^ {c} ^ {d})", (3 * i + 5) % 16
+        else:
+            f, g = f"({c} ^ ({b} | ~{d}))", (7 * i) % 16
+        lines.append(
+            f"    x = ({a} + {f} + {round_constants[i]:#010x} + w{g}) & {mask}"
+        )
+        lines.append(
+            f"    {a} = ({b} + {rotate_left_expression('x', shifts[i])}) & {mask}"
+        )
+    return compile_block_processor(
+        lines + function_footer(registers, v, 64, mask), "<16I", "MD5", registers
+    )
+
+
+def unroll_sha1(registers: Sequence[str]) -> BlockProcessor:
+    """Generates the unrolled SHA-1 compression function.
+
+    Args:
+        registers (Sequence[str]): The names of the 5 register attributes.
+
+    Returns:
+        BlockProcessor: The compiled `process_message_block` function.
+    """
+    lines, v = function_header(registers)
+    mask = "0xFFFFFFFF"
+    for i in range(80):
+        if i >= 16:
+            lines.append(f"    x = w{i - 3} ^ w{i - 8} ^ w{i - 14} ^ w{i - 16}")
+            lines.append(f"    w{i} = {rotate_left_expression('x', 1)} & {mask}")
+        a, b, c, d, e = (v[(j - i) % 5] for j in range(5))
+        if i < 20:
+            f, k = f"({d} ^ ({b} & ({c} ^ {d})))", 0x5A827999
+        elif i < 40:
+            f, k = f"({b} ^ {c} ^ {d})", 0x6ED9EBA1
+        elif i < 60:
+            f, k = f"(({b} & {c}) | ({d} & ({b} | {c})))", 0x8F1BBCDC
+        else:
+            f, k = f"({b} ^ {c} ^ {d})", 0xCA62C1D6
+        lines.append(
+            f"    {e} = ({rotate_left_expression(a, 5)} + {f} + {e} + {k:#010x} + w{i}) & {mask}"
+        )
+        lines.append(f"    {b} = {rotate_left_expression(b, 30)} & {mask}")
+    return compile_block_processor(
+        lines + function_footer(registers, v, 80, mask), ">16I", "SHA-1", registers
+    )
+
+
+def unroll_sha2(
+    round_constants: Sequence[int],
+    word_size: int,
+    big_sigma0: Tuple[int, int, int],
+    big_sigma1: Tuple[int, int, int],
+    small_sigma0: Tuple[int, int, int],
+    small_sigma1: Tuple[int, int, int],
+    registers: Sequence[str],
+) -> BlockProcessor:
+    """Generates the unrolled compression function of SHA-256 (word_size=32) or SHA-512 (word_size=64).
+
+    Args:
+        round_constants (Sequence[int]): The 64 or 80 constants K.
+        word_size (int): The size of the words and registers in bits.
+        big_sigma0 (Tuple[int, int, int]): The 3 right rotations of Σ0.
+        big_sigma1 (Tuple[int, int, int]): The 3 right rotations of Σ1.
+        small_sigma0 (Tuple[int, int, int]): The 2 right rotations and the right shift of σ0.
+        small_sigma1 (Tuple[int, int, int]): The 2 right rotations and the right shift of σ1.
+        registers (Sequence[str]): The names of the 8 register attributes.
+
+    Returns:
+        BlockProcessor: The compiled `process_message_block` function.
+    """
+    words_format = ">16I" if word_size == 32 else ">16Q"
+    lines, v = function_header(registers)
+    mask = "0x" + "F" * (word_size // 4)
+    hex_width = word_size // 4 + 2
+
+    def sigma(x: str, rotations: Tuple[int, int, int], shift: bool = False) -> str:
+        terms = [rotate_right_expression(x, s, word_size) for s in rotations[:2]]
+        terms.append(
+            f"{x} >> {rotations[2]}"
+            if shift
+            else rotate_right_expression(x, rotations[2], word_size)
+        )
+        return f"({' ^ '.join(terms)})"
+
+    for i, k in enumerate(round_constants):
+        if i >= 16:
+            lines.append(
+                f"    w{i} = (w{i - 16} + {sigma(f'w{i - 15}', small_sigma0, shift=True)} + w{i - 7} + "
+                f"{sigma(f'w{i - 2}', small_sigma1, shift=True)}) & {mask}"
+            )
+        a, b, c, d, e, f, g, h = (v[(j - i) % 8] for j in range(8))
+        lines.append(
+            f"    t = {h} + {sigma(e, big_sigma1)} + ({g} ^ ({e} & ({f} ^ {g}))) + {k:#0{hex_width}x} + w{i}"
+        )
+        lines.append(f"    {d} = ({d} + t) & {mask}")
+        lines.append(
+            f"    {h} = (t + {sigma(a, big_sigma0)} + (({a} & {b}) | ({c} & ({a} | {b})))) & {mask}"
+        )
+    return compile_block_processor(
+        lines + function_footer(registers, v, len(round_constants), mask),
+        words_format,
+        f"SHA-{word_size * 8}",
+        registers,
+    )
+
+
+def unroll_crc_slicing_by_8(width: int, reflected: bool) -> Callable[..., int]:
+    """Generates the slicing-by-8 loop of a CRC, which processes 8 message bytes per step with 8 table lookups.
+    The bytes of the register that are XORed into the message bytes are extracted with inlined shifts.
+
+    Args:
+        width (int): The size of the CRC in bits (a multiple of 8, at most 64).
+        reflected (bool): Whether the register is reflected (least significant byte first).
+
+    Returns:
+        Callable[..., int]: The compiled `update_slicing_by_8(crc, view, tables)` function, which returns the new
+            value of the register after feeding the 8 * n bytes of view.
+    """
+    register_bytes = width // 8
+    indexes = []
+    for k in range(8):
+        if k >= register_bytes:
+            indexes.append(f"b{k}")
+            continue
+        shift = 8 * k if reflected else width - 8 - 8 * k
+        register_byte = f"crc >> {shift}" if shift else "crc"
+        if (reflected and k < register_bytes - 1) or (not reflected and k > 0):
+            register_byte = f"({register_byte} & 0xFF)"
+        indexes.append(f"{register_byte} ^ b{k}")
+    lines = [
+        "def update_slicing_by_8(crc, view, tables):",
+        f"    {', '.join(f't{k}' for k in range(8))} = tables",
+        f"    for {', '.join(f'b{k}' for k in range(8))} in zip("
+        f"{', '.join(f'view[{k}::8]' for k in range(8))}):",
+        f"        crc = {' ^ '.join(f't{7 - k}[{index}]' for k, index in enumerate(indexes))}",
+        "    return crc",
+    ]
+    source = "\n".join(lines) + "\n"
+    namespace: dict = {}
+    name = f"CRC-{width}{' reflected' if reflected else ''}"
+    exec(compile(source, f"<hashbase.codegen {name}>", "exec"), namespace)
+    update_slicing_by_8 = namespace["update_slicing_by_8"]
+    update_slicing_by_8.source = source
+    return update_slicing_by_8  # type: ignore
+
+
+def unroll_md2() -> Callable[..., Tuple[Tuple[int, ...], Tuple[int, ...]]]:
+    """Generates the compression loop of MD2, which updates the 16-byte checksum and the 48-byte state block by block.
+    The bytes of the checksum and of the state are local variables, so each of the 18 rounds is 48 inlined S-box
+    lookups instead of a loop over a list.
+
+    Returns:
+        Callable[..., Tuple[Tuple[int, ...], Tuple[int, ...]]]: The compiled `update_md2(state, checksum, view, S)`
+            function, which returns the first 16 bytes of the state and the checksum after feeding the 16 * n bytes
+            of view.
+    """
+    state = [f"x{i}" for i in range(48)]
+    checksum = [f"c{i}" for i in range(16)]
+    lines = [
+        "def update_md2(state, checksum, view, S):",
+        f"    {', '.join(state[:16])} = state",
+        f"    {', '.join(checksum)} = checksum",
+        f"    for {', '.join(state[16:32])} in zip("
+        f"{', '.join(f'view[{k}::16]' for k in range(16))}):",
+        "        l = c15",
+    ]
+    for k in range(16):
+        lines.append(f"        c{k} = l = c{k} ^ S[x{16 + k} ^ l]")
+    for k in range(16):
+        lines.append(f"        x{32 + k} = x{16 + k} ^ x{k}")
+    lines += ["        t = 0", "        for j in range(18):"]
+    for x in state:
+        lines.append(f"            {x} = t = {x} ^ S[t]")
+    lines += [
+        "            t = (t + j) & 0xFF",
+        f"    return ({', '.join(state[:16])}), ({', '.join(checksum)})",
+    ]
+    source = "\n".join(lines) + "\n"
+    namespace: dict = {}
+    exec(compile(source, "<hashbase.codegen MD2>", "exec"), namespace)
+    update_md2 = namespace["update_md2"]
+    update_md2.source = source
+    return update_md2  # type: ignore
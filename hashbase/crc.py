@@ -0,0 +1,662 @@
+import binascii
+import copy
+import os
+import zlib
+from collections import deque
+from functools import lru_cache
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from hashbase.backends import validate_backend, verify_backend
+from hashbase.codegen import unroll_crc_slicing_by_8
+from hashbase.utils import Message, message_to_memoryview
+
+__all__ = ["CRC", "CRCParameters", "CRC_CATALOGUE", "parallel_crc"]
+
+T = TypeVar("T", bound="CRC")
+
+# Table-driven CRC engine, parameterized like the "Rocksoft" model used by the CRC RevEng catalogue
+# (https://reveng.sourceforge.io/crc-catalogue/): width, poly, init, refin, refout and xorout.
+#   - the 256-entry table maps the top (or, for reflected CRCs, the bottom) byte of the register to the value that is
+#     XORed into the rest of the register, so a byte is processed with one lookup instead of 8 shift/XOR steps
+#   - slicing-by-8 uses 8 tables (the contribution of a byte followed by 0-7 more bytes) to process 8 bytes per step
+#   - reflected CRCs keep the register reflected, so that neither the input bytes nor the table index are reversed
+
+
+class CRCParameters(NamedTuple):
+    """The parameters of a CRC algorithm.
+
+    Args:
+        width (int): The size of the CRC in bits.
+        poly (int): The generator polynomial, without the leading x^width term.
+        init (int): The initial value of the register.
+        refin (bool): Whether the bits of each input byte are processed least significant bit first.
+        refout (bool): Whether the final register is reflected before the XOR with `xorout`.
+        xorout (int): The value XORed with the final register.
+        check (int): The CRC of the ASCII string "123456789".
+    """
+
+    width: int
+    poly: int
+    init: int
+    refin: bool
+    refout: bool
+    xorout: int
+    check: int
+
+
+CRC_CATALOGUE: Dict[str, CRCParameters] = {
+    "CRC-8": CRCParameters(8, 0x07, 0x00, False, False, 0x00, 0xF4),
+    "CRC-8/CDMA2000": CRCParameters(8, 0x9B, 0xFF, False, False, 0x00, 0xDA),
+    "CRC-8/DVB-S2": CRCParameters(8, 0xD5, 0x00, False, False, 0x00, 0xBC),
+    "CRC-8/MAXIM-DOW": CRCParameters(8, 0x31, 0x00, True, True, 0x00, 0xA1),
+    "CRC-8/SAE-J1850": CRCParameters(8, 0x1D, 0xFF, False, False, 0xFF, 0x4B),
+    "CRC-16/ARC": CRCParameters(16, 0x8005, 0x0000, True, True, 0x0000, 0xBB3D),
+    "CRC-16/UMTS": CRCParameters(16, 0x8005, 0x0000, False, False, 0x0000, 0xFEE8),
+    "CRC-16/MODBUS": CRCParameters(16, 0x8005, 0xFFFF, True, True, 0x0000, 0x4B37),
+    "CRC-16/USB": CRCParameters(16, 0x8005, 0xFFFF, True, True, 0xFFFF, 0xB4C8),
+    "CRC-16/XMODEM": CRCParameters(16, 0x1021, 0x0000, False, False, 0x0000, 0x31C3),
+    "CRC-16/KERMIT": CRCParameters(16, 0x1021, 0x0000, True, True, 0x0000, 0x2189),
+    "CRC-16/IBM-3740": CRCParameters(16, 0x1021, 0xFFFF, False, False, 0x0000, 0x29B1),
+    "CRC-16/IBM-SDLC": CRCParameters(16, 0x1021, 0xFFFF, True, True, 0xFFFF, 0x906E),
+    "CRC-24/OPENPGP": CRCParameters(
+        24, 0x864CFB, 0xB704CE, False, False, 0x000000, 0x21CF02
+    ),
+    "CRC-32/ISO-HDLC": CRCParameters(
+        32, 0x04C11DB7, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xCBF43926
+    ),
+    "CRC-32/ISCSI": CRCParameters(
+        32, 0x1EDC6F41, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xE3069283
+    ),
+    "CRC-32/BZIP2": CRCParameters(
+        32, 0x04C11DB7, 0xFFFFFFFF, False, False, 0xFFFFFFFF, 0xFC891918
+    ),
+    "CRC-32/MPEG-2": CRCParameters(
+        32, 0x04C11DB7, 0xFFFFFFFF, False, False, 0x00000000, 0x0376E6E7
+    ),
+    "CRC-32/CKSUM": CRCParameters(
+        32, 0x04C11DB7, 0x00000000, False, False, 0xFFFFFFFF, 0x765E7680
+    ),
+    "CRC-64/ECMA-182": CRCParameters(
+        64, 0x42F0E1EBA9EA3693, 0x0, False, False, 0x0, 0x6C40DF5F0B497347
+    ),
+    "CRC-64/XZ": CRCParameters(
+        64,
+        0x42F0E1EBA9EA3693,
+        0xFFFFFFFFFFFFFFFF,
+        True,
+        True,
+        0xFFFFFFFFFFFFFFFF,
+        0x995DC9BBDF1939FA,
+    ),
+    "CRC-64/GO-ISO": CRCParameters(
+        64,
+        0x000000000000001B,
+        0xFFFFFFFFFFFFFFFF,
+        True,
+        True,
+        0xFFFFFFFFFFFFFFFF,
+        0xB90956C775A41001,
+    ),
+}
+# Common alternative names
+CRC_CATALOGUE["CRC-16/CCITT-FALSE"] = CRC_CATALOGUE["CRC-16/IBM-3740"]
+CRC_CATALOGUE["CRC-16/X-25"] = CRC_CATALOGUE["CRC-16/IBM-SDLC"]
+CRC_CATALOGUE["CRC-32"] = CRC_CATALOGUE["CRC-32/ISO-HDLC"]
+CRC_CATALOGUE["CRC-32C"] = CRC_CATALOGUE["CRC-32/ISCSI"]
+CRC_CATALOGUE["CRC-64"] = CRC_CATALOGUE["CRC-64/ECMA-182"]
+
+
+def reflect(value: int, width: int) -> int:
+    """Reverse the order of the lowest `width` bits of value.
+
+    Args:
+        value (int): The input integer.
+        width (int): The number of bits to reverse.
+
+    Returns:
+        int: The reflected value.
+    """
+    return int(format(value, f"0{width}b")[::-1], 2)
+
+
+@lru_cache(maxsize=None)
+def crc_table(width: int, poly: int, refin: bool) -> Tuple[int, ...]:
+    """Computes (once per parameter set) the 256-entry table of the CRC of every byte.
+
+    Args:
+        width (int): The size of the CRC in bits.
+        poly (int): The generator polynomial.
+        refin (bool): Whether the CRC is reflected.
+
+    Returns:
+        Tuple[int, ...]: The CRC register contribution of each byte value.
+    """
+    table = []
+    if refin:
+        poly = reflect(poly, width)
+        for byte in range(256):
+            crc = byte
+            for _ in range(8):
+                crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+            table.append(crc)
+    else:
+        mask = (1 << width) - 1
+        top_bit = 1 << (width - 1)
+        for byte in range(256):
+            crc = byte << (width - 8)
+            for _ in range(8):
+                crc = (crc << 1) ^ poly if crc & top_bit else crc << 1
+            table.append(crc & mask)
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def crc_slicing_tables(
+    width: int, poly: int, refin: bool
+) -> Tuple[Tuple[int, ...], ...]:
+    """Computes (once per parameter set) the 8 tables used by slicing-by-8, where table k holds the CRC register
+    contribution of a byte followed by k zero bytes.
+
+    Args:
+        width (int): The size of the CRC in bits (at most 64).
+        poly (int): The generator polynomial.
+        refin (bool): Whether the CRC is reflected.
+
+    Returns:
+        Tuple[Tuple[int, ...], ...]: The 8 tables.
+    """
+    tables = [crc_table(width, poly, refin)]
+    table = tables[0]
+    mask = (1 << width) - 1
+    shift = width - 8
+    for _ in range(7):
+        previous = tables[-1]
+        if refin:
+            tables.append(tuple(table[crc & 0xFF] ^ (crc >> 8) for crc in previous))
+        else:
+            tables.append(
+                tuple(table[crc >> shift] ^ ((crc << 8) & mask) for crc in previous)
+            )
+    return tuple(tables)
+
+
+@lru_cache(maxsize=None)
+def crc_slicing_processor(width: int, refin: bool) -> Callable[..., int]:
+    """Generates (once per register layout) the slicing-by-8 loop of a CRC.
+
+    Args:
+        width (int): The size of the CRC in bits.
+        refin (bool): Whether the CRC is reflected.
+
+    Returns:
+        Callable[..., int]: The compiled `update_slicing_by_8(crc, view, tables)` function.
+    """
+    return unroll_crc_slicing_by_8(width, refin)
+
+
+def gf2_matrix_times(matrix: Tuple[int, ...], vector: int) -> int:
+    """Multiplies a GF(2) matrix, stored as a tuple of columns, by a vector of bits.
+
+    Args:
+        matrix (Tuple[int, ...]): The columns of the matrix.
+        vector (int): The bits of the vector.
+
+    Returns:
+        int: The bits of the product.
+    """
+    product = 0
+    i = 0
+    while vector:
+        if vector & 1:
+            product ^= matrix[i]
+        vector >>= 1
+        i += 1
+    return product
+
+
+@lru_cache(maxsize=None)
+def crc_zeros_operator(
+    width: int, poly: int, refin: bool, power: int
+) -> Tuple[int, ...]:
+    """Computes (once per parameter set) the GF(2) matrix that feeds 2^power zero bytes into the register, by
+    squaring the matrix of 2^(power - 1) zero bytes, as in zlib's crc32_combine.
+
+    Args:
+        width (int): The size of the CRC in bits.
+        poly (int): The generator polynomial.
+        refin (bool): Whether the CRC is reflected.
+        power (int): The base 2 logarithm of the number of zero bytes.
+
+    Returns:
+        Tuple[int, ...]: The `width` columns of the matrix.
+    """
+    if power > 0:
+        operator = crc_zeros_operator(width, poly, refin, power - 1)
+        return tuple(gf2_matrix_times(operator, column) for column in operator)
+    table = crc_table(width, poly, refin)
+    mask = (1 << width) - 1
+    columns = []
+    for i in range(width):
+        register = 1 << i
+        if refin:
+            columns.append(table[register & 0xFF] ^ (register >> 8))
+        else:
+            columns.append(table[register >> (width - 8)] ^ ((register << 8) & mask))
+    return tuple(columns)
+
+
+def zlib_crc32_update(register: int, view: memoryview) -> int:
+    """Feeds a message into the reflected register of a CRC with the CRC-32 polynomial using zlib.crc32, which
+    inverts the register before and after (init and xorout 0xFFFFFFFF).
+
+    Args:
+        register (int): The value of the register.
+        view (memoryview): The message.
+
+    Returns:
+        int: The new value of the register.
+    """
+    return zlib.crc32(view, register ^ 0xFFFFFFFF) ^ 0xFFFFFFFF
+
+
+def binascii_crc_hqx_update(register: int, view: memoryview) -> int:
+    """Feeds a message into the register of a non-reflected CRC with the CCITT polynomial 0x1021 using
+    binascii.crc_hqx.
+
+    Args:
+        register (int): The value of the register.
+        view (memoryview): The message.
+
+    Returns:
+        int: The new value of the register.
+    """
+    return binascii.crc_hqx(view, register)
+
+
+# The C implementations of the standard library, by (width, poly, refin) of the CRCs they can compute
+STDLIB_CRC_UPDATES = {
+    (32, 0x04C11DB7, True): ("zlib", zlib_crc32_update),
+    (16, 0x1021, False): ("binascii", binascii_crc_hqx_update),
+}
+
+
+class CRC:
+    """A generic table-driven Cyclic Redundancy Check, parameterized like the CRC RevEng catalogue.
+    https://en.wikipedia.org/wiki/Cyclic_redundancy_check
+
+    Args:
+        width (int): The size of the CRC in bits (at least 8).
+        poly (int): The generator polynomial, without the leading x^width term.
+        init (int): The initial value of the register.
+        refin (bool): Whether the bits of each input byte are processed least significant bit first.
+        refout (bool): Whether the final register is reflected before the XOR with `xorout`.
+        xorout (int): The value XORed with the final register.
+        slicing_by_8 (bool): Whether to process 8 bytes per step for messages of at least 8 bytes (only used for
+            CRCs of at most 64 bits whose width is a multiple of 8).
+        backend (Optional[str]): The backend (see `hashbase.backends`), defaults to `selected_backend` ('auto').
+
+    The implementation is selected by `backend`, passed to the constructor or assigned at any time (the register is
+    the same for all the backends, so it takes effect immediately): CRCs with the polynomial of CRC-32 (reflected) or
+    CRC-16/XMODEM (not reflected) are computed by zlib.crc32 or binascii.crc_hqx, whatever their init and xorout,
+    unless `backend` is 'python'.
+    """
+
+    selected_backend: str = "auto"
+
+    def __init__(
+        self,
+        width: int,
+        poly: int,
+        init: int = 0,
+        refin: bool = False,
+        refout: bool = False,
+        xorout: int = 0,
+        slicing_by_8: bool = True,
+        backend: Optional[str] = None,
+    ) -> None:
+        if width < 8:
+            raise ValueError(f"CRCs of less than 8 bits are not supported: {width}")
+        self.width = width
+        self.poly = poly
+        self.init = init
+        self.refin = refin
+        self.refout = refout
+        self.xorout = xorout
+        self.slicing_by_8 = slicing_by_8 and width <= 64 and width % 8 == 0
+        self.digest_size = (width + 7) // 8
+        self.mask = (1 << width) - 1
+        self.table = crc_table(width, poly, refin)
+        self.initial_register = reflect(init, width) if refin else init
+        if self.slicing_by_8:
+            self.slicing_tables = crc_slicing_tables(width, poly, refin)
+        if backend is not None:
+            self.backend = backend
+        self.reset()
+
+    @property
+    def backend(self) -> str:
+        """The selected backend: 'auto', 'stdlib' or 'python'."""
+        return self.selected_backend
+
+    @backend.setter
+    def backend(self, backend: str) -> None:
+        validate_backend(backend)
+        self.selected_backend = backend
+        # Apply the backend now, unless the constructor has not reset the CRC yet
+        if hasattr(self, "crc"):
+            self.active_backend, self.accelerated_update = self.select_backend()
+
+    @staticmethod
+    def from_name(
+        name: str,
+        slicing_by_8: bool = True,
+        backend: Optional[str] = None,
+    ) -> "CRC":
+        """Creates the CRC algorithm with the given name in `CRC_CATALOGUE` (case-insensitive).
+        The result is a `CRC` even when called on a subclass (e.g. `CRC16.from_name`), whose constructor takes
+        different parameters.
+
+        Args:
+            name (str): The name of the CRC algorithm, e.g. "CRC-32" or "CRC-16/MODBUS".
+            slicing_by_8 (bool): Whether to process 8 bytes per step for long messages.
+            backend (Optional[str]): The backend, defaults to 'auto'.
+
+        Returns:
+            CRC: A CRC instance with the parameters of the algorithm.
+        """
+        try:
+            parameters = CRC_CATALOGUE[name.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown CRC algorithm: {name}") from None
+        width, poly, init, refin, refout, xorout = parameters[:6]
+        return CRC(
+            width,
+            poly,
+            init,
+            refin,
+            refout,
+            xorout,
+            slicing_by_8=slicing_by_8,
+            backend=backend,
+        )
+
+    def reset(self) -> None:
+        """Reset the CRC to its initial state, discarding the data fed so far."""
+        self.crc = self.initial_register
+        self.active_backend, self.accelerated_update = self.select_backend()
+
+    def select_backend(self) -> Tuple[str, Optional[Callable[[int, memoryview], int]]]:
+        """Selects the implementation of `update`, as configured by `backend`.
+
+        Returns:
+            Tuple[str, Optional[Callable[[int, memoryview], int]]]: The name of the backend and the function that
+                feeds a message into the register, or None for the Python code.
+        """
+        validate_backend(self.backend)
+        if self.backend == "python":
+            return "python", None
+        key = (self.width, self.poly, self.refin)
+        if key in STDLIB_CRC_UPDATES:
+            name, update = STDLIB_CRC_UPDATES[key]
+            if verify_backend(
+                (
+                    "CRC",
+                    self.width,
+                    self.poly,
+                    self.init,
+                    self.refin,
+                    self.refout,
+                    self.xorout,
+                ),
+                self.python_hash,
+                lambda message: self.register_to_checksum(
+                    update(self.initial_register, memoryview(message))
+                ).to_bytes(self.digest_size, "big"),
+            ):
+                return name, update
+        if self.backend == "stdlib":
+            raise ValueError(
+                f"The standard library does not provide the CRC with width={self.width}, poly={self.poly:#x}"
+            )
+        return "python", None
+
+    def python_hash(self, message: bytes) -> bytes:
+        """Computes the CRC of a message with the Python backend, regardless of `backend`.
+
+        Args:
+            message (bytes): The input message.
+
+        Returns:
+            bytes: The CRC of the message.
+        """
+        crc = copy.copy(self)
+        crc.selected_backend = "python"
+        crc.reset()
+        crc.update(message)
+        return crc.digest()
+
+    def copy(self: T) -> T:
+        """Return a copy of the CRC in its current state.
+
+        Returns:
+            CRC: An independent copy of the CRC.
+        """
+        return copy.copy(self)
+
+    def update(self, message: Message) -> None:
+        """Feed the next chunk of the message into the CRC.
+
+        Args:
+            message (Message): The input message/text or a bytes-like object.
+        """
+        view = message_to_memoryview(message)
+        if self.accelerated_update is not None:
+            self.crc = self.accelerated_update(self.crc, view)
+            return
+        crc = self.crc
+        table = self.table
+        if self.slicing_by_8 and len(view) >= 8:
+            end = len(view) - len(view) % 8
+            # Looked up (cached) on each call: the generated function can't be pickled with the instance
+            slicing_processor = crc_slicing_processor(self.width, self.refin)
+            crc = slicing_processor(crc, view[:end], self.slicing_tables)
+            view = view[end:]
+        if self.refin:
+            for byte in view:
+                crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+        else:
+            shift, mask = self.width - 8, self.mask
+            for byte in view:
+                crc = table[(crc >> shift) ^ byte] ^ ((crc << 8) & mask)
+        self.crc = crc
+
+    def checksum(self) -> int:
+        """Return the CRC of the data fed so far, without changing the state.
+
+        Returns:
+            int: The CRC value.
+        """
+        return self.register_to_checksum(self.crc)
+
+    def register_to_checksum(self, register: int) -> int:
+        """Applies the output reflection and XOR to a register value.
+
+        Args:
+            register (int): The value of the register.
+
+        Returns:
+            int: The CRC value.
+        """
+        if self.refin != self.refout:
+            register = reflect(register, self.width)
+        return register ^ self.xorout
+
+    def checksum_to_register(self, checksum: int) -> int:
+        """Reverts the output XOR and reflection of a CRC value.
+
+        Args:
+            checksum (int): The CRC value.
+
+        Returns:
+            int: The value of the register.
+        """
+        register = checksum ^ self.xorout
+        if self.refin != self.refout:
+            register = reflect(register, self.width)
+        return register
+
+    def feed_zeros(self, register: int, length: int) -> int:
+        """Feeds `length` zero bytes into a register value in O(log(length)) matrix multiplications.
+
+        Args:
+            register (int): The value of the register.
+            length (int): The number of zero bytes.
+
+        Returns:
+            int: The new value of the register.
+        """
+        power = 0
+        while length:
+            if length & 1:
+                register = gf2_matrix_times(
+                    crc_zeros_operator(self.width, self.poly, self.refin, power),
+                    register,
+                )
+            length >>= 1
+            power += 1
+        return register
+
+    def combine(self, crc_a: int, crc_b: int, len_b: int) -> int:
+        """Computes the CRC of the concatenation of two messages A and B from the CRC of each message, like zlib's
+        crc32_combine, without reading the messages.
+
+        Args:
+            crc_a (int): The CRC of message A.
+            crc_b (int): The CRC of message B.
+            len_b (int): The length of message B in bytes.
+
+        Returns:
+            int: The CRC of A followed by B.
+        """
+        # The register is linear in its initial value: feeding B into the register of A gives the register of B
+        # plus the difference between the register of A and the initial register, shifted by len_b zero bytes
+        register_a = self.checksum_to_register(crc_a)
+        register_b = self.checksum_to_register(crc_b)
+        return self.register_to_checksum(
+            self.feed_zeros(register_a ^ self.initial_register, len_b) ^ register_b
+        )
+
+    def digest(self) -> bytes:
+        """Return the CRC of the data fed so far as big-endian bytes.
+
+        Returns:
+            bytes: The `digest_size` bytes of the CRC.
+        """
+        return self.checksum().to_bytes(self.digest_size, "big")
+
+    def hexdigest(self) -> str:
+        """Return the CRC of the data fed so far as a zero-padded hexadecimal string.
+
+        Returns:
+            str: The CRC as a string of 2 * `digest_size` hexadecimal digits.
+        """
+        return self.digest().hex()
+
+    def generate_hash(self, message: Message) -> str:
+        """Generates the CRC of the input message.
+
+        Args:
+            message (Message): The input message/text or a bytes-like object.
+
+        Returns:
+            str: The CRC of the message, formatted with hex().
+        """
+        self.reset()
+        self.update(message)
+        return hex(self.checksum())
+
+
+# The range of chunk sizes that parallel_crc splits a buffer into, unless a chunk size is given: chunks are large
+# enough to amortize the inter-process communication and small enough to bound the memory of the pending chunks
+MIN_PARALLEL_CHUNK_SIZE = 1024 * 1024
+MAX_PARALLEL_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def crc_of_chunk(
+    parameters: Tuple[int, int, int, bool, bool, int], chunk: Message
+) -> int:
+    """Computes the CRC of a chunk in a worker process of `parallel_crc`.
+
+    Args:
+        parameters (Tuple[int, int, int, bool, bool, int]): The width, poly, init, refin, refout and xorout.
+        chunk (Message): The chunk of the buffer.
+
+    Returns:
+        int: The CRC of the chunk.
+    """
+    crc = CRC(*parameters)
+    crc.update(chunk)
+    return crc.checksum()
+
+
+def parallel_crc(
+    buffer: Message,
+    crc: Union[str, CRC] = "CRC-32",
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """Computes the CRC of a large buffer in a pool of processes: the buffer is split into ranges whose CRCs are
+    computed independently and merged in order with `CRC.combine`.
+
+    Args:
+        buffer (Message): The input message/text or a bytes-like object (e.g. an mmap of a file).
+        crc (Union[str, CRC]): The name of the CRC algorithm in `CRC_CATALOGUE` or a CRC instance with its parameters
+            (its state is not used).
+        workers (Optional[int]): The number of processes, defaults to the number of CPUs.
+        chunk_size (Optional[int]): The size of the ranges in bytes, defaults to the size of the buffer divided by
+            the number of workers (between 1 MiB and 16 MiB).
+
+    Returns:
+        int: The CRC of the buffer.
+    """
+    if isinstance(crc, str):
+        crc = CRC.from_name(crc)
+    view = message_to_memoryview(buffer)
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = min(
+            max(-(-len(view) // workers), MIN_PARALLEL_CHUNK_SIZE),
+            MAX_PARALLEL_CHUNK_SIZE,
+        )
+    parameters = (crc.width, crc.poly, crc.init, crc.refin, crc.refout, crc.xorout)
+    # The C implementations of the standard library are faster than copying the chunks to other processes
+    if workers == 1 or len(view) <= chunk_size or crc.accelerated_update is not None:
+        return crc_of_chunk(parameters, view)
+
+    # Imported here because multiprocessing takes longer to import than the rest of hashbase.crc
+    from concurrent.futures import ProcessPoolExecutor
+
+    checksum = crc.register_to_checksum(crc.initial_register)
+    with ProcessPoolExecutor(workers) as executor:
+        # At most 2 chunks per worker are copied and queued at any time
+        pending: Deque = deque()
+        for start in range(0, len(view), chunk_size):
+            if len(pending) == 2 * workers:
+                future, length = pending.popleft()
+                checksum = crc.combine(checksum, future.result(), length)
+            chunk = bytes(view[start : start + chunk_size])
+            pending.append(
+                (executor.submit(crc_of_chunk, parameters, chunk), len(chunk))
+            )
+        for future, length in pending:
+            checksum = crc.combine(checksum, future.result(), length)
+    return checksum
@@ -1,27 +1,22 @@
-class CRC8:
-    """This implementation of CRC-8 is inspired by https://sourceforge.net/projects/crccheck/"""
+from typing import Optional
+
+from hashbase.crc import CRC
+
+__all__ = ["CRC8"]
+
+
+class CRC8(CRC):
+    """This implementation of CRC-8 is inspired by https://sourceforge.net/projects/crccheck/
+    It is the non-reflected 8-bit configuration of the table-driven `CRC` engine.
+    """
 
     def __init__(
-        self, poly: int = 0x07, init_value: int = 0x00, xor_out: int = 0x00
+        self,
+        poly: int = 0x07,
+        init_value: int = 0x00,
+        xor_out: int = 0x00,
+        backend: Optional[str] = None,
     ) -> None:
-        self.poly = poly
+        super().__init__(8, poly, init=init_value, xorout=xor_out, backend=backend)
         self.init_value = init_value
         self.xor_out = xor_out
-
-    def generate_hash(self, message: str) -> str:
-        """Generates a CRC-8 hash of the input message.
-
-        Args:
-            message (str): The input message/text.
-
-        Returns:
-            str: The CRC-8 hash of the message.
-        """
-        message_bytes = bytearray(message, "ascii")
-        crc = self.init_value
-        for byte in message_bytes:
-            crc ^= byte
-            for _ in range(8):
-                crc = (crc << 1) ^ self.poly if crc & 0x80 else crc << 1
-            crc &= 0xFF
-        return hex(crc ^ self.xor_out)
@@ -0,0 +1,62 @@
+import base64
+from typing import Any
+
+__all__ = ["Digest"]
+
+
+class Digest:
+    """An immutable hash value.
+    Only the raw bytes of the hash are stored; the hexadecimal, base64 and integer representations are computed
+    when they are requested, which keeps large collections of digests compact.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: bytes) -> None:
+        self._value = bytes(value)
+
+    def __bytes__(self) -> bytes:
+        return self._value
+
+    def __len__(self) -> int:
+        return len(self._value)
+
+    def __int__(self) -> int:
+        return int.from_bytes(self._value, byteorder="big")
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Digest):
+            return self._value == other._value
+        if isinstance(other, (bytes, bytearray, memoryview)):
+            return self._value == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._value)
+
+    def __repr__(self) -> str:
+        return f"Digest('{self.hex()}')"
+
+    def __str__(self) -> str:
+        return self.hex()
+
+    def hex(self) -> str:
+        """The hash as a hexadecimal string.
+
+        Returns:
+            str: The hexadecimal representation of the hash.
+        """
+        return self._value.hex()
+
+    def base64(self, urlsafe: bool = False) -> str:
+        """The hash as a base64 string.
+
+        Args:
+            urlsafe (bool, optional): Use the URL and filesystem safe alphabet ('-' and '_' instead of '+' and '/'). Defaults to False.
+
+        Returns:
+            str: The base64 representation of the hash.
+        """
+        if urlsafe:
+            return base64.urlsafe_b64encode(self._value).decode("ascii")
+        return base64.b64encode(self._value).decode("ascii")
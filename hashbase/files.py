@@ -0,0 +1,60 @@
+import mmap
+import os
+import stat
+from typing import Any, Callable, Union
+
+from hashbase.digest import Digest
+
+__all__ = ["hash_file"]
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+PathType = Union[str, bytes, "os.PathLike[Any]"]
+
+
+def hash_file(
+    path: PathType,
+    algorithm: Callable[[], Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Digest:
+    """Generates the hash of a file in constant memory.
+    Regular files are memory-mapped and fed to the hash function in slices of `chunk_size` bytes (rounded down to a
+    multiple of the block size, so that no block is buffered), without copying them. Pipes, character devices and
+    files that cannot be mapped are read with `readinto` into a single reusable buffer.
+
+    Args:
+        path (PathType): The path of the file.
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`, `CRC16`) or a function that creates a
+            hash function (e.g. `lambda: CRC.from_name("CRC-32")`).
+        chunk_size (int): The number of bytes fed to the hash function at a time.
+
+    Returns:
+        Digest: The hash of the file.
+    """
+    hasher = algorithm()
+    block_size = getattr(hasher, "block_size", 1)
+    chunk_size = max(chunk_size - chunk_size % block_size, block_size)
+    with open(path, "rb", buffering=0) as f:
+        file_stat = os.fstat(f.fileno())
+        # Files of size 0 may still have contents (e.g. in /proc), so they are read instead of mapped
+        if stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0:
+            try:
+                mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+            else:
+                with mapped_file, memoryview(mapped_file) as view:
+                    for start in range(0, len(view), chunk_size):
+                        with view[start : start + chunk_size] as chunk:
+                            hasher.update(chunk)
+                return Digest(hasher.digest())
+
+        buffer = bytearray(chunk_size)
+        with memoryview(buffer) as view:
+            while True:
+                size = f.readinto(buffer)  # type: ignore
+                if not size:
+                    break
+                with view[:size] as chunk:
+                    hasher.update(chunk)
+    return Digest(hasher.digest())
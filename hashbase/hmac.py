@@ -0,0 +1,140 @@
+import copy
+import hmac as standard_hmac
+from typing import Any, Callable, Optional, TypeVar
+
+from hashbase.digest import Digest
+from hashbase.utils import Message, message_to_memoryview
+
+__all__ = ["HMAC", "new"]
+
+T = TypeVar("T", bound="HMAC")
+
+# Translation tables that XOR every byte of the key with the inner (0x36) and outer (0x5C) padding
+TRANSLATE_INNER = bytes(x ^ 0x36 for x in range(256))
+TRANSLATE_OUTER = bytes(x ^ 0x5C for x in range(256))
+
+
+class HMAC:
+    """Keyed-hash message authentication code (RFC 2104) for the hash functions with a streaming interface (MD2, MD4,
+    MD5, SHA-1, SHA-2 and RIPEMD).
+    The first block of the inner and of the outer hash (the key XOR ipad/opad) only depends on the key, so both are
+    compressed once and the two resulting hash functions (midstates) are copied for every message.
+    https://en.wikipedia.org/wiki/HMAC
+
+    Args:
+        key (Message): The secret key.
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`) or a function that creates a hash
+            function.
+        message (Optional[Message]): The first chunk of the message.
+    """
+
+    def __init__(
+        self,
+        key: Message,
+        algorithm: Callable[[], Any],
+        message: Optional[Message] = None,
+    ) -> None:
+        inner = algorithm()
+        if not hasattr(inner, "block_size") or not hasattr(inner, "update"):
+            raise TypeError(
+                f"HMAC requires a block-based hash function with update(), got {type(inner).__name__}"
+            )
+        self.block_size: int = inner.block_size
+        self.digest_size: int = inner.digest_size
+
+        key_bytes = bytes(message_to_memoryview(key))
+        if len(key_bytes) > self.block_size:
+            key_hasher = algorithm()
+            key_hasher.update(key_bytes)
+            key_bytes = key_hasher.digest()
+        key_bytes = key_bytes.ljust(self.block_size, b"\x00")
+
+        outer = algorithm()
+        inner.update(key_bytes.translate(TRANSLATE_INNER))
+        outer.update(key_bytes.translate(TRANSLATE_OUTER))
+        self.inner_midstate = inner
+        self.outer_midstate = outer
+        self.reset()
+        if message is not None:
+            self.update(message)
+
+    def reset(self) -> None:
+        """Reset the HMAC to the state after the key, discarding the message fed so far."""
+        self.inner = self.inner_midstate.copy()
+
+    def copy(self: T) -> T:
+        """Create an independent copy of the HMAC, including the message fed so far.
+
+        Returns:
+            HMAC: A copy of the HMAC.
+        """
+        clone = copy.copy(self)
+        clone.inner = self.inner.copy()
+        return clone
+
+    def update(self, message: Message) -> None:
+        """Feed the next chunk of the message into the HMAC.
+
+        Args:
+            message (Message): The next chunk of the message as a string (encoded as UTF-8) or a bytes-like object.
+        """
+        self.inner.update(message)
+
+    def digest(self) -> bytes:
+        """Compute the HMAC of the message fed so far, without modifying the state.
+
+        Returns:
+            bytes: The HMAC of the message.
+        """
+        outer = self.outer_midstate.copy()
+        outer.update(self.inner.digest())
+        return outer.digest()
+
+    def hexdigest(self) -> str:
+        """Compute the HMAC of the message fed so far, without modifying the state.
+
+        Returns:
+            str: The HMAC of the message as a hexadecimal string.
+        """
+        return self.digest().hex()
+
+    def generate_digest(self, message: Message) -> Digest:
+        """Generates the HMAC of the input message, starting from the cached midstates of the key.
+
+        Args:
+            message (Message): The input message/text or a bytes-like object.
+
+        Returns:
+            Digest: The HMAC of the message.
+        """
+        self.reset()
+        self.update(message)
+        return Digest(self.digest())
+
+    def verify(self, mac: bytes) -> bool:
+        """Checks in constant time that a MAC is the HMAC of the message fed so far.
+
+        Args:
+            mac (bytes): The MAC to check.
+
+        Returns:
+            bool: Whether the MAC is valid.
+        """
+        return standard_hmac.compare_digest(self.digest(), bytes(mac))
+
+
+def new(
+    key: Message, algorithm: Callable[[], Any], message: Optional[Message] = None
+) -> HMAC:
+    """Creates a new HMAC, like `hmac.new` of the standard library.
+
+    Args:
+        key (Message): The secret key.
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`) or a function that creates a hash
+            function.
+        message (Optional[Message]): The first chunk of the message.
+
+    Returns:
+        HMAC: The HMAC, keyed and ready to hash messages.
+    """
+    return HMAC(key, algorithm, message)
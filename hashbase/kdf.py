@@ -0,0 +1,235 @@
+import hashlib
+import struct
+from operator import itemgetter
+from typing import Any, Callable, Optional
+
+from hashbase.hmac import HMAC
+from hashbase.merkle_damgard import MerkleDamgardHash
+from hashbase.utils import Message, message_padding, message_to_memoryview
+
+__all__ = ["pbkdf2", "hkdf", "hkdf_extract", "hkdf_expand"]
+
+# Key derivation functions built on `hashbase.hmac`, whose inner and outer midstates already contain the compressed
+# key. Every PBKDF2 iteration after the first hashes exactly one digest, so for the generated compression functions
+# (see `hashbase.codegen`) the single final block of the inner and the outer hash is known up to the digest words:
+# the padding words are computed once and each iteration loads the midstate registers, compresses
+# (digest words + padding words) and reads the new digest words straight from the registers.
+
+IterateHMAC = Callable[[bytes, int], bytes]
+
+
+def iterate_hmac(mac: HMAC) -> IterateHMAC:
+    """The generic PBKDF2 inner loop, which works with every hash function accepted by `HMAC`.
+
+    Args:
+        mac (HMAC): The HMAC keyed with the password.
+
+    Returns:
+        IterateHMAC: A function that takes U_1 and the number of remaining iterations and returns U_1 ^ ... ^ U_c.
+    """
+
+    def iterate(u: bytes, count: int) -> bytes:
+        result = int.from_bytes(u, "big")
+        for _ in range(count):
+            mac.reset()
+            mac.update(u)
+            u = mac.digest()
+            result ^= int.from_bytes(u, "big")
+        return result.to_bytes(len(u), "big")
+
+    return iterate
+
+
+def iterate_hmac_words(mac: HMAC) -> Optional[IterateHMAC]:
+    """The PBKDF2 inner loop on the words of the digest, which compresses the precomputed final block of the inner
+    and of the outer hash directly from the midstate registers.
+
+    Args:
+        mac (HMAC): The HMAC keyed with the password.
+
+    Returns:
+        Optional[IterateHMAC]: A function that takes U_1 and the number of remaining iterations and returns
+            U_1 ^ ... ^ U_c, or None if the hash function has no generated compression function, uses hashlib, or
+            its digest does not fit in a single final block.
+    """
+    inner, outer = mac.inner_midstate, mac.outer_midstate
+    if not isinstance(inner, MerkleDamgardHash) or inner.active_backend != "python":
+        return None
+    block_processor = inner.get_block_processor()
+    process_message_words = getattr(block_processor, "process_message_words", None)
+    registers = getattr(block_processor, "registers", None)
+    if process_message_words is None or registers is None:
+        return None
+
+    words_format: str = block_processor.words_format  # type: ignore
+    byteorder, word_type = words_format[0], words_format[-1]
+    word_size = struct.calcsize(word_type)
+    padding = message_padding(
+        inner.block_size + mac.digest_size,
+        inner.message_length_byteorder,
+        inner.message_length_padding_bits,
+        inner.block_size * 8,
+    )
+    if (
+        mac.digest_size % word_size
+        or mac.digest_size + len(padding) != inner.block_size
+    ):
+        return None
+
+    digest_words = mac.digest_size // word_size
+    digest_struct = struct.Struct(f"{byteorder}{digest_words}{word_type}")
+    padding_words = struct.unpack(f"{byteorder}{16 - digest_words}{word_type}", padding)
+    inner_registers = {register: getattr(inner, register) for register in registers}
+    outer_registers = {register: getattr(outer, register) for register in registers}
+    read_digest_words = itemgetter(*registers[:digest_words])
+    # A scratch hash function whose registers are overwritten by every compression
+    scratch = inner.copy()
+    state = scratch.__dict__
+
+    def iterate(u: bytes, count: int) -> bytes:
+        words = digest_struct.unpack(u)
+        result = list(words)
+        for _ in range(count):
+            state.update(inner_registers)
+            process_message_words(scratch, words + padding_words)
+            inner_words = read_digest_words(state)
+            state.update(outer_registers)
+            process_message_words(scratch, inner_words + padding_words)
+            words = read_digest_words(state)
+            result = [a ^ b for a, b in zip(result, words)]
+        return digest_struct.pack(*result)
+
+    return iterate
+
+
+def pbkdf2(
+    algorithm: Callable[[], Any],
+    password: Message,
+    salt: Message,
+    iterations: int,
+    dklen: Optional[int] = None,
+) -> bytes:
+    """Derives a key from a password with PBKDF2-HMAC (RFC 8018), like `hashlib.pbkdf2_hmac` of the standard library.
+    When the hash function uses hashlib (see `hashbase.backends`), the key is derived by hashlib.
+    https://en.wikipedia.org/wiki/PBKDF2
+
+    Args:
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`) or a function that creates a hash
+            function.
+        password (Message): The password.
+        salt (Message): The salt.
+        iterations (int): The number of iterations.
+        dklen (Optional[int]): The length of the derived key in bytes, defaults to the digest size.
+
+    Returns:
+        bytes: The derived key.
+    """
+    if iterations < 1:
+        raise ValueError("iterations must be at least 1")
+    mac = HMAC(password, algorithm)
+    dklen = mac.digest_size if dklen is None else dklen
+    if dklen < 1:
+        raise ValueError("dklen must be at least 1")
+
+    hashlib_name = getattr(mac.inner_midstate, "hashlib_name", None)
+    if (
+        getattr(mac.inner_midstate, "active_backend", None) == "hashlib"
+        and hashlib.new(hashlib_name).digest_size == mac.digest_size  # type: ignore
+    ):
+        return hashlib.pbkdf2_hmac(
+            hashlib_name,  # type: ignore
+            bytes(message_to_memoryview(password)),
+            bytes(message_to_memoryview(salt)),
+            iterations,
+            dklen,
+        )
+
+    iterate = iterate_hmac_words(mac) or iterate_hmac(mac)
+    salt_bytes = bytes(message_to_memoryview(salt))
+    blocks = []
+    for index in range(1, -(-dklen // mac.digest_size) + 1):
+        mac.reset()
+        mac.update(salt_bytes + index.to_bytes(4, "big"))
+        blocks.append(iterate(mac.digest(), iterations - 1))
+    return b"".join(blocks)[:dklen]
+
+
+def hkdf_extract(
+    algorithm: Callable[[], Any], key_material: Message, salt: Message = b""
+) -> bytes:
+    """The extract step of HKDF (RFC 5869): concentrates the input key material into a pseudorandom key.
+
+    Args:
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`) or a function that creates a hash
+            function.
+        key_material (Message): The input key material.
+        salt (Message): The optional salt, defaults to a string of zeros of the digest size.
+
+    Returns:
+        bytes: The pseudorandom key.
+    """
+    salt_bytes = bytes(message_to_memoryview(salt))
+    if not salt_bytes:
+        salt_bytes = bytes(algorithm().digest_size)
+    return HMAC(salt_bytes, algorithm, key_material).digest()
+
+
+def hkdf_expand(
+    algorithm: Callable[[], Any],
+    pseudorandom_key: Message,
+    length: int,
+    info: Message = b"",
+) -> bytes:
+    """The expand step of HKDF (RFC 5869): derives an output key of any length from a pseudorandom key.
+    The midstates of the pseudorandom key are computed once and copied for every output block.
+
+    Args:
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`) or a function that creates a hash
+            function.
+        pseudorandom_key (Message): The pseudorandom key, usually the output of `hkdf_extract`.
+        length (int): The length of the output key in bytes, at most 255 times the digest size.
+        info (Message): The optional context and application specific information.
+
+    Returns:
+        bytes: The output key.
+    """
+    mac = HMAC(pseudorandom_key, algorithm)
+    if not 0 < length <= 255 * mac.digest_size:
+        raise ValueError(
+            f"length must be between 1 and {255 * mac.digest_size} bytes, got {length}"
+        )
+    info_bytes = bytes(message_to_memoryview(info))
+    block = b""
+    blocks = []
+    for index in range(1, -(-length // mac.digest_size) + 1):
+        mac.reset()
+        mac.update(block + info_bytes + bytes([index]))
+        block = mac.digest()
+        blocks.append(block)
+    return b"".join(blocks)[:length]
+
+
+def hkdf(
+    algorithm: Callable[[], Any],
+    key_material: Message,
+    length: int,
+    salt: Message = b"",
+    info: Message = b"",
+) -> bytes:
+    """Derives a key with HKDF (RFC 5869), the HMAC-based extract-and-expand key derivation function.
+    https://en.wikipedia.org/wiki/HKDF
+
+    Args:
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`) or a function that creates a hash
+            function.
+        key_material (Message): The input key material.
+        length (int): The length of the output key in bytes, at most 255 times the digest size.
+        salt (Message): The optional salt, defaults to a string of zeros of the digest size.
+        info (Message): The optional context and application specific information.
+
+    Returns:
+        bytes: The output key.
+    """
+    return hkdf_expand(
+        algorithm, hkdf_extract(algorithm, key_material, salt), length, info
+    )
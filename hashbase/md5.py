@@ -1,46 +1,57 @@
 from math import floor, sin
+import struct
 from typing import List
 
-from hashbase.utils import rotate_left, modular_add, apply_message_padding
+from hashbase.codegen import unroll_md5
+from hashbase.merkle_damgard import MerkleDamgardHash
+from hashbase.utils import Message, rotate_left, modular_add
 
+__all__ = ["MD5"]
 
-class MD5:
+
+K = tuple(floor(abs(sin(i) * pow(2, 32))) for i in range(1, 65))
+
+SHIFTS = (
+    ((7, 12, 17, 22) * 4)
+    + ((5, 9, 14, 20) * 4)
+    + ((4, 11, 16, 23) * 4)
+    + ((6, 10, 15, 21) * 4)
+)
+
+
+class MD5(MerkleDamgardHash):
     """The MD5 algorithm is a cryptographic hashing function used to produce a 128-bit hash.
     https://en.wikipedia.org/wiki/MD5
     """
 
-    def __init__(self) -> None:
-        self.a: int = 0x67452301
-        self.b: int = 0xEFCDAB89
-        self.c: int = 0x98BADCFE
-        self.d: int = 0x10325476
-        self.K: List[int] = [floor(abs(sin(i) * pow(2, 32))) for i in range(1, 65)]
-        self.SHIFTS: List[int] = (
-            ([7, 12, 17, 22] * 4)
-            + ([5, 9, 14, 20] * 4)
-            + ([4, 11, 16, 23] * 4)
-            + ([6, 10, 15, 21] * 4)
-        )
+    message_length_byteorder = "little"
+    digest_size = 16
+    hashlib_name = "md5"
+    registers = ("a", "b", "c", "d")
+    initial_register_values = (
+        0x67452301,
+        0xEFCDAB89,
+        0x98BADCFE,
+        0x10325476,
+    )
+    unrolled_process_message_block = unroll_md5(K, SHIFTS, registers)
+
+    def reset(self) -> None:
+        """Reset the hash function to its initial state, discarding the data fed so far."""
+        super().reset()
+        (self.a, self.b, self.c, self.d) = self.initial_register_values
 
     @staticmethod
-    def split_message_block_into_words(
-        message_block: bytearray, word_length_in_bytes: int = 4
-    ) -> List[int]:
-        """Split the 64-byte message block into 16 4-byte words.
+    def split_message_block_into_words(message_block: memoryview) -> List[int]:
+        """Split the 64-byte message block into 16 4-byte (little endian) words.
 
         Args:
-            message_block (bytearray): The 512-bytes message block.
-            word_length_in_bytes (int, optional): The length of each word in the block. Defaults to 4.
+            message_block (memoryview): The 512-bit message block.
 
         Returns:
             List[int]: A List of 4-byte words created by splitting the message block.
         """
-        return [
-            int.from_bytes(
-                message_block[4 * i : 4 * i + word_length_in_bytes], byteorder="little"
-            )
-            for i in range(len(message_block) // word_length_in_bytes)
-        ]
+        return list(struct.unpack("<16I", message_block))
 
     @staticmethod
     def F(x: int, y: int, z: int) -> int:
@@ -62,71 +73,66 @@ class MD5:
         """I(x, y, z) = y XOR (x OR NOT z)"""
         return y ^ (x | ~z)
 
-    def register_values_to_hex_string(self) -> str:
-        """Read the values of the 4 registers and convert them to a hexadecimal string.
+    def register_values_to_bytes(self) -> bytes:
+        """Pack the values of the 4 registers into the 16-byte digest.
 
         Returns:
-            str: The hexadecimal string represented by the 4 registers.
+            bytes: The digest represented by the 4 registers.
+        """
+        return struct.pack("<4I", self.a, self.b, self.c, self.d)
+
+    def process_message_block(self, message_block: memoryview) -> None:
+        """Compress a 64-byte message block into the 4 registers.
+
+        Args:
+            message_block (memoryview): The 512-bit message block.
         """
-        # Create the message digest from the final values of the 4 registers (a, b, c, d)
-        digest = sum(
-            register_value << (32 * i)
-            for i, register_value in enumerate([self.a, self.b, self.c, self.d])
-        )
-        # Convert the digest to a hexadecimal string
-        return digest.to_bytes(16, byteorder="little").hex()
-
-    def generate_hash(self, message: str) -> str:
+        message_words = self.split_message_block_into_words(message_block)
+        curr_a, curr_b, curr_c, curr_d = self.a, self.b, self.c, self.d
+
+        # 4 rounds of 16 operations
+        for i in range(64):
+            # Round 1
+            if 0 <= i < 16:
+                f = self.F(curr_b, curr_c, curr_d)
+                g = i
+
+            # Round 2
+            elif 16 <= i < 32:
+                f = self.G(curr_b, curr_c, curr_d)
+                g = ((5 * i) + 1) % 16
+
+            # Round 3
+            elif 32 <= i < 48:
+                f = self.H(curr_b, curr_c, curr_d)
+                g = ((3 * i) + 5) % 16
+
+            # Round 4
+            elif 48 <= i < 64:
+                f = self.I(curr_b, curr_c, curr_d)
+                g = (7 * i) % 16
+
+            f = modular_add([f, curr_a, K[i], message_words[g]])
+
+            curr_a = curr_d
+            curr_d = curr_c
+            curr_c = curr_b
+            curr_b += rotate_left(f, SHIFTS[i])
+
+        self.a = modular_add([self.a, curr_a])
+        self.b = modular_add([self.b, curr_b])
+        self.c = modular_add([self.c, curr_c])
+        self.d = modular_add([self.d, curr_d])
+
+    def generate_hash(self, message: Message) -> str:
         """Generates a 128-bit MD5 hash of the input message.
 
         Args:
-            message (str): The input message/text.
+            message (Message): The input message/text or a bytes-like object.
 
         Returns:
             str: The 128-bit MD5 hash of the message.
         """
-        message_in_bytes = bytearray(message, "ascii")
-        message_chunk = apply_message_padding(message_in_bytes, "little")
-
-        # Loop through each 64-byte message block
-        for block in range(len(message_chunk) // 64):
-            message_words = self.split_message_block_into_words(
-                message_chunk[block * 64 : block * 64 + 64]
-            )
-            curr_a, curr_b, curr_c, curr_d = self.a, self.b, self.c, self.d
-
-            # 4 rounds of 16 operations
-            for i in range(64):
-                # Round 1
-                if 0 <= i < 16:
-                    f = self.F(curr_b, curr_c, curr_d)
-                    g = i
-
-                # Round 2
-                elif 16 <= i < 32:
-                    f = self.G(curr_b, curr_c, curr_d)
-                    g = ((5 * i) + 1) % 16
-
-                # Round 3
-                elif 32 <= i < 48:
-                    f = self.H(curr_b, curr_c, curr_d)
-                    g = ((3 * i) + 5) % 16
-
-                # Round 4
-                elif 48 <= i < 64:
-                    f = self.I(curr_b, curr_c, curr_d)
-                    g = (7 * i) % 16
-
-                f = modular_add([f, curr_a, self.K[i], message_words[g]])
-
-                curr_a = curr_d
-                curr_d = curr_c
-                curr_c = curr_b
-                curr_b += rotate_left(f, self.SHIFTS[i])
-
-            self.a = modular_add([self.a, curr_a])
-            self.b = modular_add([self.b, curr_b])
-            self.c = modular_add([self.c, curr_c])
-            self.d = modular_add([self.d, curr_d])
-
-        return self.register_values_to_hex_string()
+        self.reset()
+        self.update(message)
+        return self.hexdigest()
@@ -0,0 +1,345 @@
+import copy
+from typing import Any, Callable, NamedTuple, Optional, Tuple, Type, TypeVar
+
+from hashbase.backends import hashlib_constructor, validate_backend, verify_backend
+from hashbase.codegen import BlockProcessor
+from hashbase.digest import Digest
+from hashbase.utils import Message, message_padding, message_to_memoryview
+
+T = TypeVar("T", bound="MerkleDamgardHash")
+
+ENGINES = ("unrolled", "reference")
+
+
+class Midstate(NamedTuple):
+    """The exported state of a Merkle-Damgård hash function after a prefix of the message: the values of the
+    registers, the buffered tail (shorter than a block) and the number of bytes fed so far.
+    """
+
+    algorithm: str
+    digest_size: int
+    register_values: Tuple[int, ...]
+    buffer: bytes
+    message_length: int
+
+
+class MerkleDamgardHash:
+    """Base class of the hash functions built on the Merkle-Damgård construction (MD4, MD5, SHA-1, SHA-2 and RIPEMD).
+    The input is consumed incrementally: full message blocks are read straight from a memoryview of the input and
+    compressed as soon as they arrive, and only the incomplete tail is buffered, so hashing a message of any size
+    needs one block of memory and no copy of the input.
+    https://en.wikipedia.org/wiki/Merkle%E2%80%93Damg%C3%A5rd_construction
+
+    Subclasses implement `reset` (loading `initial_register_values` into the attributes named by `registers`),
+    `process_message_block` (the compression function) and `register_values_to_bytes`.
+
+    The compression function used is selected by `engine`, per class or per instance:
+        - 'unrolled' (default): the straight-line code generated by `hashbase.codegen`, when the algorithm has one
+        - 'reference': the readable `process_message_block` implementation
+
+    The implementation is selected by `backend` (see `hashbase.backends`), passed to the constructor (e.g.
+    `SHA256(backend="python")`) or assigned before any data is fed; it takes effect immediately:
+        - 'auto' (default): hashlib when it provides the algorithm (`hashlib_name`), the Python code otherwise
+        - 'stdlib': always hashlib
+        - 'python': always the Python code, with the compression function selected by `engine`
+
+    Args:
+        backend (Optional[str]): The backend, defaults to `selected_backend` ('auto').
+    """
+
+    block_size: int = 64
+    digest_size: int = 0
+    message_length_byteorder: str = "big"
+    message_length_padding_bits: int = 64
+    registers: Tuple[str, ...] = ()
+    initial_register_values: Tuple[int, ...] = ()
+    engine: str = "unrolled"
+    unrolled_process_message_block: Optional[BlockProcessor] = None
+    hashlib_name: Optional[str] = None
+    selected_backend: str = "auto"
+    accelerator: Optional[Any]
+
+    def __init__(self, backend: Optional[str] = None) -> None:
+        if backend is not None:
+            self.backend = backend
+        self.reset()
+
+    @property
+    def backend(self) -> str:
+        """The selected backend: 'auto', 'stdlib' or 'python'."""
+        return self.selected_backend
+
+    @backend.setter
+    def backend(self, backend: str) -> None:
+        validate_backend(backend)
+        if getattr(self, "message_length", 0):
+            raise ValueError(
+                f"The backend of {type(self).__name__} cannot be changed after data was fed, call reset() first"
+            )
+        self.selected_backend = backend
+        # Apply the backend now, unless the constructor has not reset the hash function yet
+        if hasattr(self, "accelerator"):
+            self.accelerator = self.new_accelerator()
+
+    def reset(self) -> None:
+        """Reset the hash function to its initial state, discarding the data fed so far."""
+        self.buffer: bytearray = bytearray()
+        self.message_length: int = 0
+        self.accelerator = self.new_accelerator()
+
+    @property
+    def active_backend(self) -> str:
+        """The backend that hashes the data: 'hashlib' or 'python'."""
+        return "python" if self.accelerator is None else "hashlib"
+
+    def new_accelerator(self) -> Optional[Any]:
+        """Creates the hashlib object that replaces the Python code, as selected by `backend`.
+
+        Returns:
+            Optional[Any]: A new hashlib object, or None if the Python code is used.
+        """
+        validate_backend(self.backend)
+        if self.backend == "python":
+            return None
+        constructor = hashlib_constructor(self.hashlib_name or "")
+        if constructor is not None and verify_backend(
+            (type(self).__name__, self.digest_size),
+            self.python_hash,
+            lambda message: constructor(message).digest()[: self.digest_size],
+        ):
+            return constructor()
+        if self.backend == "stdlib":
+            raise ValueError(f"hashlib does not provide {type(self).__name__}")
+        return None
+
+    def python_hash(self, message: bytes) -> bytes:
+        """Hashes a message with the Python backend, regardless of `backend`.
+
+        Args:
+            message (bytes): The input message.
+
+        Returns:
+            bytes: The hash of the message.
+        """
+        hasher = copy.copy(self)
+        hasher.selected_backend = "python"
+        hasher.reset()
+        hasher.update(message)
+        return hasher.digest()
+
+    def process_message_block(self, message_block: memoryview) -> None:
+        """Compress a single message block into the registers.
+
+        Args:
+            message_block (memoryview): A message block of `block_size` bytes.
+        """
+        raise NotImplementedError
+
+    def get_block_processor(self) -> Callable[[memoryview], None]:
+        """The compression function selected by `engine`.
+
+        Returns:
+            Callable[[memoryview], None]: A function that compresses a message block into the registers.
+        """
+        if self.engine not in ENGINES:
+            raise ValueError(
+                f"Unknown engine '{self.engine}', expected one of {ENGINES}"
+            )
+        if self.engine == "unrolled" and self.unrolled_process_message_block:
+            return self.unrolled_process_message_block  # type: ignore
+        return self.process_message_block
+
+    def register_values_to_bytes(self) -> bytes:
+        """Pack the values of the registers into the digest.
+
+        Returns:
+            bytes: The digest represented by the registers.
+        """
+        raise NotImplementedError
+
+    def register_values_to_hex_string(self) -> str:
+        """Read the values of the registers and convert them to a hexadecimal string.
+
+        Returns:
+            str: The hexadecimal string represented by the registers.
+        """
+        return self.register_values_to_bytes().hex()
+
+    def update(self, message: Message) -> None:
+        """Feed the next chunk of the message into the hash function.
+
+        Args:
+            message (Message): The next chunk of the message as a string (encoded as UTF-8) or a bytes-like object.
+        """
+        message_view = message_to_memoryview(message)
+        self.message_length += len(message_view)
+        if self.accelerator is not None:
+            self.accelerator.update(message_view)
+            return
+        process_message_block = self.get_block_processor()
+
+        # Complete the block buffered by the previous call
+        start = 0
+        if self.buffer:
+            start = self.block_size - len(self.buffer)
+            self.buffer += message_view[:start]
+            if len(self.buffer) < self.block_size:
+                return
+            process_message_block(memoryview(self.buffer))
+            self.buffer = bytearray()
+
+        # Compress all the complete blocks and buffer only the incomplete tail
+        end = start + (len(message_view) - start) // self.block_size * self.block_size
+        for block in range(start, end, self.block_size):
+            process_message_block(message_view[block : block + self.block_size])
+        self.buffer += message_view[end:]
+
+    def copy(self: T) -> T:
+        """Create an independent copy of the hash function, including the data fed so far.
+
+        Returns:
+            MerkleDamgardHash: A copy of the hash function.
+        """
+        clone = copy.copy(self)
+        clone.buffer = bytearray(self.buffer)
+        if self.accelerator is not None:
+            clone.accelerator = self.accelerator.copy()
+        return clone
+
+    def __deepcopy__(self: T, memo: dict) -> T:
+        return self.copy()
+
+    def __getstate__(self) -> dict:
+        """The picklable state of the hash function. The hashlib object is dropped and created again on load, which
+        is only possible before any data is fed to it.
+
+        Returns:
+            dict: The attributes of the hash function, without the hashlib object.
+        """
+        state = self.__dict__.copy()
+        if state.get("accelerator") is not None:
+            if self.message_length:
+                raise TypeError(
+                    f"Cannot pickle {type(self).__name__} with the hashlib backend after data was fed to it, create the hash function with {type(self).__name__}(backend='python')"
+                )
+            del state["accelerator"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the pickled state of the hash function, creating the hashlib object again if it was dropped.
+
+        Args:
+            state (dict): The attributes returned by `__getstate__`.
+        """
+        self.__dict__.update(state)
+        if "accelerator" not in state:
+            self.accelerator = self.new_accelerator()
+
+    def export_midstate(self) -> Midstate:
+        """Export the state of the hash function after the data fed so far, e.g. a common prefix of many messages.
+        The midstate is a compact, picklable tuple that can be imported in any process with `from_midstate`.
+        Only the Python backend exposes its registers, so the hash function must be created with
+        `backend="python"`, e.g. `SHA256(backend="python")`.
+
+        Returns:
+            Midstate: The state of the hash function.
+        """
+        if self.accelerator is not None:
+            raise ValueError(
+                f"The state of the hashlib backend cannot be exported, create the hash function with {type(self).__name__}(backend='python')"
+            )
+        return Midstate(
+            type(self).__name__,
+            self.digest_size,
+            tuple(getattr(self, register) for register in self.registers),
+            bytes(self.buffer),
+            self.message_length,
+        )
+
+    def import_midstate(self, midstate: Midstate) -> None:
+        """Resume hashing from an exported state, discarding the data fed so far. The hash function continues with
+        the Python backend, since the state cannot be loaded into hashlib.
+
+        Args:
+            midstate (Midstate): A state exported by a hash function of the same algorithm.
+        """
+        algorithm, digest_size, register_values, buffer, message_length = midstate
+        if (algorithm, digest_size) != (type(self).__name__, self.digest_size):
+            raise ValueError(
+                f"Cannot import a midstate of {algorithm} ({digest_size * 8} bits) into {type(self).__name__} "
+                f"({self.digest_size * 8} bits)"
+            )
+        if (
+            len(register_values) != len(self.registers)
+            or len(buffer) >= self.block_size
+        ):
+            raise ValueError(f"Invalid midstate of {algorithm}")
+        for register, value in zip(self.registers, register_values):
+            setattr(self, register, value)
+        self.buffer = bytearray(buffer)
+        self.message_length = message_length
+        self.selected_backend = "python"
+        self.accelerator = None
+
+    @classmethod
+    def from_midstate(cls: Type[T], midstate: Midstate) -> T:
+        """Create a hash function that resumes hashing from an exported state.
+
+        Args:
+            midstate (Midstate): A state exported by a hash function of this class (created without arguments).
+
+        Returns:
+            MerkleDamgardHash: The hash function, with the Python backend.
+        """
+        hasher = cls()
+        hasher.import_midstate(midstate)
+        return hasher
+
+    def _finalize(self) -> None:
+        """Pad the buffered tail of the message and compress the final block(s)."""
+        self.buffer += message_padding(
+            self.message_length,
+            self.message_length_byteorder,
+            self.message_length_padding_bits,
+            self.block_size * 8,
+        )
+        process_message_block = self.get_block_processor()
+        final_blocks = memoryview(self.buffer)
+        for block in range(0, len(final_blocks), self.block_size):
+            process_message_block(final_blocks[block : block + self.block_size])
+        final_blocks.release()
+        self.buffer = bytearray()
+
+    def digest(self) -> bytes:
+        """Compute the hash of the data fed so far, without modifying the state of the hash function.
+
+        Returns:
+            bytes: The hash of the data.
+        """
+        if self.accelerator is not None:
+            return self.accelerator.digest()[: self.digest_size]
+        final = self.copy()
+        final._finalize()
+        return final.register_values_to_bytes()
+
+    def hexdigest(self) -> str:
+        """Compute the hash of the data fed so far, without modifying the state of the hash function.
+
+        Returns:
+            str: The hash of the data as a hexadecimal string.
+        """
+        return self.digest().hex()
+
+    def generate_digest(self, message: Message) -> Digest:
+        """Generates the hash of the input message as a `Digest`, which stores the raw bytes of the hash and only
+        formats them (hex, base64, int) when asked.
+
+        Args:
+            message (Message): The input message/text or a bytes-like object.
+
+        Returns:
+            Digest: The hash of the message.
+        """
+        self.reset()
+        self.update(message)
+        return Digest(self.digest())
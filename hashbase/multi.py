@@ -0,0 +1,181 @@
+import copy
+import struct
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple, TypeVar, Union
+
+from hashbase.digest import Digest
+from hashbase.merkle_damgard import MerkleDamgardHash
+from hashbase.utils import Message, message_to_memoryview
+
+__all__ = ["MultiHasher"]
+
+T = TypeVar("T", bound="MultiHasher")
+
+Algorithms = Union[Iterable[Callable[[], Any]], Mapping[str, Callable[[], Any]]]
+
+
+class MultiHasher:
+    """Computes the hashes of several algorithms (e.g. MD5, SHA-1, SHA-256 and a CRC) in a single pass over the data.
+    Every chunk is converted to a memoryview once and fed to all the hash functions. The hash functions that run
+    generated Python compression functions (see `hashbase.codegen`) with the same block size and byte order share
+    the slicing of the message into blocks and the unpacking of each block into words.
+
+    Args:
+        algorithms (Algorithms): The hash function classes or functions that create hash functions, named after
+            their class, or a mapping from names to them.
+    """
+
+    def __init__(self, algorithms: Algorithms) -> None:
+        if isinstance(algorithms, Mapping):
+            self.hashers = {name: algorithm() for name, algorithm in algorithms.items()}
+        else:
+            self.hashers = {}
+            for algorithm in algorithms:
+                hasher = algorithm()
+                name = type(hasher).__name__
+                if name in self.hashers:
+                    raise ValueError(
+                        f"Duplicate algorithm name '{name}', pass a mapping of names to algorithms instead"
+                    )
+                self.hashers[name] = hasher
+        self.group_hashers()
+
+    def group_hashers(self) -> None:
+        """Groups the hash functions that can share block slicing and word unpacking by (block size, words format).
+        Only the hash functions that have been fed the same data so far (the same buffered tail and message length,
+        e.g. fresh ones) are grouped, since the blocks are sliced once for the whole group; a function that creates
+        a hash function may return one that already has data (e.g. `SHA256.from_midstate`).
+        The backend and engine of the hash functions are read here, so this must be called again after changing them.
+        """
+        groups: Dict[Tuple[int, str, int, bytes], List[MerkleDamgardHash]] = {}
+        self.separate_hashers: List[Any] = []
+        for hasher in self.hashers.values():
+            block_processor = None
+            if (
+                isinstance(hasher, MerkleDamgardHash)
+                and hasher.active_backend == "python"
+            ):
+                block_processor = hasher.get_block_processor()
+            words_format = getattr(block_processor, "words_format", None)
+            if words_format is None:
+                self.separate_hashers.append(hasher)
+            else:
+                key = (
+                    hasher.block_size,
+                    words_format,
+                    hasher.message_length,
+                    bytes(hasher.buffer),
+                )
+                groups.setdefault(key, []).append(hasher)
+
+        self.shared_groups: List[
+            Tuple[List[MerkleDamgardHash], Callable[..., Tuple[int, ...]], List[Any]]
+        ] = []
+        for (_, words_format, _, _), hashers in groups.items():
+            if len(hashers) == 1:
+                self.separate_hashers.append(hashers[0])
+                continue
+            words_processors = [
+                hasher.get_block_processor().process_message_words.__get__(hasher)  # type: ignore
+                for hasher in hashers
+            ]
+            self.shared_groups.append(
+                (hashers, struct.Struct(words_format).unpack, words_processors)
+            )
+
+    def reset(self) -> None:
+        """Reset all the hash functions to their initial state, discarding the data fed so far."""
+        for hasher in self.hashers.values():
+            hasher.reset()
+        self.group_hashers()
+
+    def copy(self: T) -> T:
+        """Create an independent copy of the hash functions, including the data fed so far.
+
+        Returns:
+            MultiHasher: A copy of the hash functions.
+        """
+        clone = copy.copy(self)
+        clone.hashers = {name: hasher.copy() for name, hasher in self.hashers.items()}
+        clone.group_hashers()
+        return clone
+
+    def update(self, message: Message) -> None:
+        """Feed the next chunk of the message into all the hash functions.
+
+        Args:
+            message (Message): The next chunk of the message as a string (encoded as UTF-8) or a bytes-like object.
+        """
+        message_view = message_to_memoryview(message)
+        for hasher in self.separate_hashers:
+            hasher.update(message_view)
+        for hashers, unpack, words_processors in self.shared_groups:
+            self.update_shared_group(hashers, unpack, words_processors, message_view)
+
+    @staticmethod
+    def update_shared_group(
+        hashers: List[MerkleDamgardHash],
+        unpack: Callable[..., Tuple[int, ...]],
+        words_processors: List[Any],
+        message_view: memoryview,
+    ) -> None:
+        """Feed a chunk into hash functions with the same block size and byte order: each block is unpacked once and
+        the words are compressed by every hash function. The hash functions have been fed the same data, so they
+        have the same buffered tail and message length.
+
+        Args:
+            hashers (List[MerkleDamgardHash]): The hash functions.
+            unpack (Callable[..., Tuple[int, ...]]): Unpacks a block into 16 words.
+            words_processors (List[Any]): The compression function of each hash function, taking the words.
+            message_view (memoryview): The chunk.
+        """
+        block_size = hashers[0].block_size
+        buffer = hashers[0].buffer
+        start = 0
+        if buffer:
+            start = block_size - len(buffer)
+            buffer = buffer + message_view[:start]
+            if len(buffer) == block_size:
+                words = unpack(buffer)
+                for process_message_words in words_processors:
+                    process_message_words(words)
+                buffer = bytearray()
+
+        end = start + (len(message_view) - start) // block_size * block_size
+        for block in range(start, end, block_size):
+            words = unpack(message_view[block : block + block_size])
+            for process_message_words in words_processors:
+                process_message_words(words)
+
+        tail = message_view[max(start, end) :]
+        for hasher in hashers:
+            hasher.buffer = buffer + tail
+            hasher.message_length += len(message_view)
+
+    def digests(self) -> Dict[str, Digest]:
+        """Compute the hashes of the data fed so far, without modifying the state of the hash functions.
+
+        Returns:
+            Dict[str, Digest]: The hash of each algorithm, by name.
+        """
+        return {name: Digest(hasher.digest()) for name, hasher in self.hashers.items()}
+
+    def hexdigests(self) -> Dict[str, str]:
+        """Compute the hashes of the data fed so far, without modifying the state of the hash functions.
+
+        Returns:
+            Dict[str, str]: The hash of each algorithm as a hexadecimal string, by name.
+        """
+        return {name: digest.hex() for name, digest in self.digests().items()}
+
+    def generate_digests(self, message: Message) -> Dict[str, Digest]:
+        """Generates the hashes of the input message with all the algorithms.
+
+        Args:
+            message (Message): The input message/text or a bytes-like object.
+
+        Returns:
+            Dict[str, Digest]: The hash of each algorithm, by name.
+        """
+        self.reset()
+        self.update(message)
+        return self.digests()
@@ -0,0 +1,165 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+
+from hashbase.digest import Digest
+from hashbase.utils import Message, message_to_memoryview
+
+__all__ = ["hash_many"]
+
+# Hashing of many independent messages in a pool of processes (or threads, since hashlib releases the GIL for large
+# messages). The messages are sent to the workers in batches, whose size adapts so that each batch takes about
+# `TARGET_BATCH_SECONDS`: long enough to amortize the cost of the inter-process communication, short enough to keep
+# the workers balanced. At most 2 batches per worker are in flight, and their total size is capped, so the input can
+# be an unbounded iterator.
+
+EXECUTORS = ("process", "thread")
+
+INITIAL_BATCH_SIZE = 64
+MAX_BATCH_SIZE = 64 * 1024
+TARGET_BATCH_SECONDS = 0.05
+DEFAULT_MAX_IN_FLIGHT_BYTES = 64 * 1024 * 1024
+
+
+def hash_batch(
+    algorithm: Callable[[], Any], messages: List[Message]
+) -> Tuple[List[bytes], float]:
+    """Computes the hashes of a batch of messages in a worker of `hash_many`.
+
+    Args:
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`).
+        messages (List[Message]): The messages.
+
+    Returns:
+        Tuple[List[bytes], float]: The hash of each message and the time it took in seconds.
+    """
+    start = perf_counter()
+    initial_hasher = algorithm()
+    digests = []
+    for message in messages:
+        hasher = initial_hasher.copy()
+        hasher.update(message)
+        digests.append(hasher.digest())
+    return digests, perf_counter() - start
+
+
+def adapt_batch_size(message_count: int, seconds: float) -> int:
+    """The number of messages of the next batch, so that it takes about `TARGET_BATCH_SECONDS`.
+
+    Args:
+        message_count (int): The number of messages of a finished batch.
+        seconds (float): The time it took to hash the finished batch.
+
+    Returns:
+        int: The size of the next batch.
+    """
+    seconds_per_message = max(seconds / message_count, 1e-9)
+    return min(max(int(TARGET_BATCH_SECONDS / seconds_per_message), 1), MAX_BATCH_SIZE)
+
+
+def hash_many(
+    messages: Iterable[Message],
+    algorithm: Callable[[], Any],
+    workers: Optional[int] = None,
+    executor: str = "process",
+    max_in_flight_bytes: int = DEFAULT_MAX_IN_FLIGHT_BYTES,
+) -> Iterator[Digest]:
+    """Generates the hashes of many independent messages in a pool of workers, in the order of the input.
+    The hashes are yielded as soon as the batches in front of them are done, so the messages can be streamed.
+
+    Args:
+        messages (Iterable[Message]): The messages, e.g. a list or a generator of records.
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`) or a function that creates a hash
+            function with `update()` and `copy()`; it must be picklable for the process executor.
+        workers (Optional[int]): The number of workers, defaults to the number of CPUs.
+        executor (str): 'process' (the Python compression functions run in parallel) or 'thread' (hashlib releases
+            the GIL while hashing messages longer than 2 KiB).
+        max_in_flight_bytes (int): The maximum total size of the messages sent to the workers and not yet hashed.
+
+    Returns:
+        Iterator[Digest]: The hash of each message.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS}")
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return hash_many_inline(messages, algorithm)
+    return hash_many_in_pool(
+        messages, algorithm, workers, executor, max(max_in_flight_bytes, 1)
+    )
+
+
+def hash_many_inline(
+    messages: Iterable[Message], algorithm: Callable[[], Any]
+) -> Iterator[Digest]:
+    """The generator of `hash_many` with a single worker, which hashes the messages in the calling thread.
+
+    Args:
+        messages (Iterable[Message]): The messages.
+        algorithm (Callable[[], Any]): The hash function class.
+
+    Yields:
+        Digest: The hash of each message.
+    """
+    initial_hasher = algorithm()
+    for message in messages:
+        hasher = initial_hasher.copy()
+        hasher.update(message)
+        yield Digest(hasher.digest())
+
+
+def hash_many_in_pool(
+    messages: Iterable[Message],
+    algorithm: Callable[[], Any],
+    workers: int,
+    executor: str,
+    max_in_flight_bytes: int,
+) -> Iterator[Digest]:
+    """The generator of `hash_many` with a pool of workers.
+
+    Args:
+        messages (Iterable[Message]): The messages.
+        algorithm (Callable[[], Any]): The hash function class.
+        workers (int): The number of workers.
+        executor (str): 'process' or 'thread'.
+        max_in_flight_bytes (int): The maximum total size of the messages in flight.
+
+    Yields:
+        Digest: The hash of each message.
+    """
+    max_batches = 2 * workers
+    max_batch_bytes = max(max_in_flight_bytes // max_batches, 1)
+    executor_class = (
+        ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    )
+    with executor_class(workers) as pool:
+        pending: Deque = deque()
+        try:
+            batch: List[Message] = []
+            batch_bytes = 0
+            batch_size = INITIAL_BATCH_SIZE
+            for message in messages:
+                view = message_to_memoryview(message)
+                # memoryviews cannot be pickled, and the workers must not see later changes to mutable buffers
+                batch.append(message if isinstance(message, bytes) else bytes(view))
+                batch_bytes += len(view)
+                if len(batch) < batch_size and batch_bytes < max_batch_bytes:
+                    continue
+                # Wait when the pipeline is full, and collect the batches that are already done in any case
+                while pending and (len(pending) == max_batches or pending[0].done()):
+                    digests, seconds = pending.popleft().result()
+                    batch_size = adapt_batch_size(len(digests), seconds)
+                    yield from map(Digest, digests)
+                pending.append(pool.submit(hash_batch, algorithm, batch))
+                batch, batch_bytes = [], 0
+            if batch:
+                pending.append(pool.submit(hash_batch, algorithm, batch))
+            while pending:
+                digests, _ = pending.popleft().result()
+                yield from map(Digest, digests)
+        finally:
+            # The consumer stopped early or a batch failed: do not start the batches that are still queued
+            for future in pending:
+                future.cancel()
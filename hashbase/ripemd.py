@@ -0,0 +1,187 @@
+import struct
+from typing import Callable, Optional, Sequence, Tuple
+
+from hashbase.merkle_damgard import MerkleDamgardHash
+
+# The compression function shared by RIPEMD-128, RIPEMD-160, RIPEMD-256 and RIPEMD-320. Each of them runs two
+# parallel lines of 16-step rounds over the same message block, with the boolean functions in opposite orders:
+#   - RIPEMD-128/256: 4 rounds per line and 4 registers per line
+#   - RIPEMD-160/320: 5 rounds per line and 5 registers per line, where every step also rotates c by 10 and adds e
+# RIPEMD-128/160 combine both lines into one set of registers at the end of the block, while the double-width
+# RIPEMD-256/320 keep a set of registers per line and exchange one register between the lines after every round.
+# The boolean function, the constant and the word order of a round are bound once per round, instead of being
+# looked up for every step.
+
+MASK = 0xFFFFFFFF
+
+unpack_words = struct.Struct("<16I").unpack
+
+R = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8, 3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12, 1, 9, 11, 10, 0, 8, 12, 4, 13, 3, 7, 15, 14, 5, 6, 2, 4, 0, 5, 9, 7, 12, 2, 10, 14, 1, 3, 8, 11, 6, 15, 13)  # type: ignore
+
+R_C = (5, 14, 7, 0, 9, 2, 11, 4, 13, 6, 15, 8, 1, 10, 3, 12, 6, 11, 3, 7, 0, 13, 5, 10, 14, 15, 8, 12, 4, 9, 1, 2, 15, 5, 1, 3, 7, 14, 6, 9, 11, 8, 12, 2, 10, 0, 4, 13, 8, 6, 4, 1, 3, 11, 15, 0, 5, 12, 2, 13, 9, 7, 10, 14, 12, 15, 10, 4, 1, 5, 8, 7, 6, 2, 13, 14, 0, 3, 9, 11)  # type: ignore
+
+SHIFTS = (11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8, 7, 6, 8, 13, 11, 9, 7, 15, 7, 12, 15, 9, 11, 7, 13, 12, 11, 13, 6, 7, 14, 9, 13, 15, 14, 8, 13, 6, 5, 12, 7, 5, 11, 12, 14, 15, 14, 15, 9, 8, 9, 14, 5, 6, 8, 6, 5, 12, 9, 15, 5, 11, 6, 8, 13, 12, 5, 12, 13, 14, 11, 8, 5, 6)  # type: ignore
+
+SHIFTS_C = (8, 9, 9, 11, 13, 15, 15, 5, 7, 7, 8, 11, 14, 14, 12, 6, 9, 13, 15, 7, 12, 8, 9, 11, 7, 7, 12, 7, 6, 15, 13, 11, 9, 7, 15, 11, 8, 6, 6, 14, 12, 13, 5, 14, 13, 13, 7, 5, 15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8, 8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11)  # type: ignore
+
+# The constants of each round of the left line
+K = (0x00000000, 0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xA953FD4E)
+
+# The constants of each round of the right line, for 4 rounds (RIPEMD-128/256) and 5 rounds (RIPEMD-160/320)
+K_C_4_ROUNDS = (0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x00000000)
+K_C_5_ROUNDS = (0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x7A6D76E9, 0x00000000)
+
+# The (message word index, shift) pairs of the 16 steps of each round of the left and the right line
+STEPS = tuple(
+    tuple(zip(R[16 * i : 16 * i + 16], SHIFTS[16 * i : 16 * i + 16])) for i in range(5)
+)
+STEPS_C = tuple(
+    tuple(zip(R_C[16 * i : 16 * i + 16], SHIFTS_C[16 * i : 16 * i + 16]))
+    for i in range(5)
+)
+
+Line = Tuple[int, ...]
+BooleanFunction = Callable[[int, int, int], int]
+Steps = Sequence[Tuple[int, int]]
+
+
+def f1(x: int, y: int, z: int) -> int:
+    return x ^ y ^ z
+
+
+def f2(x: int, y: int, z: int) -> int:
+    return (x & y) | (z & ~x)
+
+
+def f3(x: int, y: int, z: int) -> int:
+    return (~y | x) ^ z
+
+
+def f4(x: int, y: int, z: int) -> int:
+    return (x & z) | (y & ~z)
+
+
+def f5(x: int, y: int, z: int) -> int:
+    return x ^ (y | ~z)
+
+
+# The boolean function of each round of the left line; the right line uses them in the reverse order
+BOOLEAN_FUNCTIONS = (f1, f2, f3, f4, f5)
+
+
+def round_4_registers(
+    line: Line, f: BooleanFunction, k: int, steps: Steps, words: Sequence[int]
+) -> Line:
+    """Run the 16 steps of a round of RIPEMD-128/256 on the 4 registers of a line.
+
+    Args:
+        line (Line): The registers (a, b, c, d) of the line.
+        f (BooleanFunction): The boolean function of the round.
+        k (int): The constant of the round.
+        steps (Steps): The (message word index, shift) pair of each step.
+        words (Sequence[int]): The 16 words of the message block.
+
+    Returns:
+        Line: The registers of the line after the round.
+    """
+    a, b, c, d = line
+    for i, s in steps:
+        t = (a + f(b, c, d) + words[i] + k) & MASK
+        a, d, c, b = d, c, b, (t << s | t >> 32 - s) & MASK
+    return a, b, c, d
+
+
+def round_5_registers(
+    line: Line, f: BooleanFunction, k: int, steps: Steps, words: Sequence[int]
+) -> Line:
+    """Run the 16 steps of a round of RIPEMD-160/320 on the 5 registers of a line.
+
+    Args:
+        line (Line): The registers (a, b, c, d, e) of the line.
+        f (BooleanFunction): The boolean function of the round.
+        k (int): The constant of the round.
+        steps (Steps): The (message word index, shift) pair of each step.
+        words (Sequence[int]): The 16 words of the message block.
+
+    Returns:
+        Line: The registers of the line after the round.
+    """
+    a, b, c, d, e = line
+    for i, s in steps:
+        t = (a + f(b, c, d) + words[i] + k) & MASK
+        a, e, d, c, b = (
+            e,
+            d,
+            (c << 10 | c >> 22) & MASK,
+            b,
+            ((t << s | t >> 32 - s) + e) & MASK,
+        )
+    return a, b, c, d, e
+
+
+class RIPEMD(MerkleDamgardHash):
+    """The compression function of the RIPEMD family, configured by the subclasses with:
+        - `registers`: 4 or 5 registers per line, twice as many for the double-width variants
+        - `rounds`: the number of rounds per line (4 or 5)
+        - `exchanges`: the index of the register exchanged between the lines after each round, or None to combine
+          the lines at the end of the block
+    https://homes.esat.kuleuven.be/~bosselae/ripemd160.html
+    """
+
+    message_length_byteorder = "little"
+    rounds = 5
+    exchanges: Optional[Tuple[int, ...]] = None
+
+    def reset(self) -> None:
+        """Reset the hash function to its initial state, discarding the data fed so far."""
+        super().reset()
+        for register, value in zip(self.registers, self.initial_register_values):
+            setattr(self, register, value)
+
+    def register_values_to_bytes(self) -> bytes:
+        """Pack the values of the registers into the digest (little endian).
+
+        Returns:
+            bytes: The digest represented by the registers.
+        """
+        return struct.pack(
+            f"<{len(self.registers)}I",
+            *(getattr(self, register) for register in self.registers),
+        )
+
+    def process_message_block(self, message_block: memoryview) -> None:
+        """Compress a 64-byte message block into the registers.
+
+        Args:
+            message_block (memoryview): The 512-bit message block.
+        """
+        words = unpack_words(message_block)
+        h = tuple(getattr(self, register) for register in self.registers)
+        rounds, exchanges = self.rounds, self.exchanges
+        step_round = round_4_registers if rounds == 4 else round_5_registers
+        k_c = K_C_4_ROUNDS if rounds == 4 else K_C_5_ROUNDS
+        n = len(h) if exchanges is None else len(h) // 2
+        left, right = h[:n], h[-n:]
+
+        for i in range(rounds):
+            left = step_round(left, BOOLEAN_FUNCTIONS[i], K[i], STEPS[i], words)
+            right = step_round(
+                right, BOOLEAN_FUNCTIONS[rounds - 1 - i], k_c[i], STEPS_C[i], words
+            )
+            if exchanges is not None:
+                j = exchanges[i]
+                left, right = (
+                    left[:j] + right[j : j + 1] + left[j + 1 :],
+                    right[:j] + left[j : j + 1] + right[j + 1 :],
+                )
+
+        if exchanges is None:
+            # h0 = h1 + c + d', h1 = h2 + d + e', ... (with the registers a, b, c, d, e of the left and right line)
+            h = tuple(
+                (h[(i + 1) % n] + left[(i + 2) % n] + right[(i + 3) % n]) & MASK
+                for i in range(n)
+            )
+        else:
+            h = tuple((x + y) & MASK for x, y in zip(h, left + right))
+        for register, value in zip(self.registers, h):
+            setattr(self, register, value)
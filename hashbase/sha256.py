@@ -1,124 +1,198 @@
-from typing import List
+import struct
+from typing import Any, Iterable, List, Optional, TypeVar
 
-from hashbase.utils import modular_add, apply_message_padding, rotate_right, shift_right
+from hashbase.codegen import unroll_sha2
+from hashbase.merkle_damgard import MerkleDamgardHash
+from hashbase.utils import Message, rotate_right, shift_right
 
+__all__ = ["SHA256"]
 
-class SHA256:
+T = TypeVar("T", bound="SHA256")
+
+MASK = 0xFFFFFFFF
+
+unpack_words = struct.Struct(">16I").unpack
+
+
+K = (
+    0x428A2F98,
+    0x71374491,
+    0xB5C0FBCF,
+    0xE9B5DBA5,
+    0x3956C25B,
+    0x59F111F1,
+    0x923F82A4,
+    0xAB1C5ED5,
+    0xD807AA98,
+    0x12835B01,
+    0x243185BE,
+    0x550C7DC3,
+    0x72BE5D74,
+    0x80DEB1FE,
+    0x9BDC06A7,
+    0xC19BF174,
+    0xE49B69C1,
+    0xEFBE4786,
+    0x0FC19DC6,
+    0x240CA1CC,
+    0x2DE92C6F,
+    0x4A7484AA,
+    0x5CB0A9DC,
+    0x76F988DA,
+    0x983E5152,
+    0xA831C66D,
+    0xB00327C8,
+    0xBF597FC7,
+    0xC6E00BF3,
+    0xD5A79147,
+    0x06CA6351,
+    0x14292967,
+    0x27B70A85,
+    0x2E1B2138,
+    0x4D2C6DFC,
+    0x53380D13,
+    0x650A7354,
+    0x766A0ABB,
+    0x81C2C92E,
+    0x92722C85,
+    0xA2BFE8A1,
+    0xA81A664B,
+    0xC24B8B70,
+    0xC76C51A3,
+    0xD192E819,
+    0xD6990624,
+    0xF40E3585,
+    0x106AA070,
+    0x19A4C116,
+    0x1E376C08,
+    0x2748774C,
+    0x34B0BCB5,
+    0x391C0CB3,
+    0x4ED8AA4A,
+    0x5B9CCA4F,
+    0x682E6FF3,
+    0x748F82EE,
+    0x78A5636F,
+    0x84C87814,
+    0x8CC70208,
+    0x90BEFFFA,
+    0xA4506CEB,
+    0xBEF9A3F7,
+    0xC67178F2,
+)
+
+
+class SHA256(MerkleDamgardHash):
     """The SHA-256 algorithm is a cryptographic hashing function used to produce a 256-bit hash.
+    The compression function is shared by SHA-224, which only differs in the initial register values and the output
+    digest size (`output_bits`).
     https://en.wikipedia.org/wiki/SHA-2
     """
 
-    def __init__(self) -> None:
-        self.h0: int = 0x6A09E667
-        self.h1: int = 0xBB67AE85
-        self.h2: int = 0x3C6EF372
-        self.h3: int = 0xA54FF53A
-        self.h4: int = 0x510E527F
-        self.h5: int = 0x9B05688C
-        self.h6: int = 0x1F83D9AB
-        self.h7: int = 0x5BE0CD19
-        self.K: List[int] = [
-            0x428A2F98,
-            0x71374491,
-            0xB5C0FBCF,
-            0xE9B5DBA5,
-            0x3956C25B,
-            0x59F111F1,
-            0x923F82A4,
-            0xAB1C5ED5,
-            0xD807AA98,
-            0x12835B01,
-            0x243185BE,
-            0x550C7DC3,
-            0x72BE5D74,
-            0x80DEB1FE,
-            0x9BDC06A7,
-            0xC19BF174,
-            0xE49B69C1,
-            0xEFBE4786,
-            0x0FC19DC6,
-            0x240CA1CC,
-            0x2DE92C6F,
-            0x4A7484AA,
-            0x5CB0A9DC,
-            0x76F988DA,
-            0x983E5152,
-            0xA831C66D,
-            0xB00327C8,
-            0xBF597FC7,
-            0xC6E00BF3,
-            0xD5A79147,
-            0x06CA6351,
-            0x14292967,
-            0x27B70A85,
-            0x2E1B2138,
-            0x4D2C6DFC,
-            0x53380D13,
-            0x650A7354,
-            0x766A0ABB,
-            0x81C2C92E,
-            0x92722C85,
-            0xA2BFE8A1,
-            0xA81A664B,
-            0xC24B8B70,
-            0xC76C51A3,
-            0xD192E819,
-            0xD6990624,
-            0xF40E3585,
-            0x106AA070,
-            0x19A4C116,
-            0x1E376C08,
-            0x2748774C,
-            0x34B0BCB5,
-            0x391C0CB3,
-            0x4ED8AA4A,
-            0x5B9CCA4F,
-            0x682E6FF3,
-            0x748F82EE,
-            0x78A5636F,
-            0x84C87814,
-            0x8CC70208,
-            0x90BEFFFA,
-            0xA4506CEB,
-            0xBEF9A3F7,
-            0xC67178F2,
-        ]
-
-    @staticmethod
-    def break_message_block_into_words(message_block: bytearray) -> List[int]:
-        """Split and extend the 64-byte message block into 64 4-byte words.
+    hashlib_name = "sha256"
+    registers = ("h0", "h1", "h2", "h3", "h4", "h5", "h6", "h7")
+    initial_register_values = (
+        0x6A09E667,
+        0xBB67AE85,
+        0x3C6EF372,
+        0xA54FF53A,
+        0x510E527F,
+        0x9B05688C,
+        0x1F83D9AB,
+        0x5BE0CD19,
+    )
+    unrolled_process_message_block = unroll_sha2(
+        K,
+        32,
+        (2, 13, 22),
+        (6, 11, 25),
+        (7, 18, 3),
+        (17, 19, 10),
+        registers,
+    )
+
+    def __init__(self, output_bits=256, backend: Optional[str] = None) -> None:
+        self.output_bits = output_bits
+        self.digest_size = output_bits // 8
+        super().__init__(backend)
+
+    def reset(self) -> None:
+        """Reset the hash function to its initial state, discarding the data fed so far."""
+        super().reset()
+        (
+            self.h0,
+            self.h1,
+            self.h2,
+            self.h3,
+            self.h4,
+            self.h5,
+            self.h6,
+            self.h7,
+        ) = self.initial_register_values
+        # The message schedule is allocated once and overwritten by every message block
+        self.schedule = [0] * 64
+
+    def copy(self: T) -> T:
+        """Create an independent copy of the hash function, including the data fed so far.
+
+        Returns:
+            SHA256: A copy of the hash function.
+        """
+        clone = super().copy()
+        clone.schedule = [0] * 64
+        return clone
+
+    def extend_message_schedule(self, message_block: memoryview) -> List[int]:
+        """Split and extend the 64-byte message block into the 64 4-byte words of the message schedule.
 
         Args:
-            message_block (bytearray): The 512-bytes message block.
+            message_block (memoryview): The 512-bit message block.
 
         Returns:
-            List[int]: A List of 64 4-byte words created by splitting the message block.
+            List[int]: The message schedule, a list of 64 4-byte words.
         """
-        w = list(range(64))
-        for i in range(64):
-            if 0 <= i < 16:
-                w[i] = int.from_bytes(message_block[4 * i : 4 * i + 4], byteorder="big")
-            else:
-                s0 = (
-                    rotate_right(w[i - 15], 7)
-                    ^ rotate_right(w[i - 15], 18)
-                    ^ shift_right(w[i - 15], 3)
-                )
-                s1 = (
-                    rotate_right(w[i - 2], 17)
-                    ^ rotate_right(w[i - 2], 19)
-                    ^ shift_right(w[i - 2], 10)
-                )
-                w[i] = modular_add([w[i - 16], s0, w[i - 7], s1])
+        w = self.schedule
+        w[:16] = unpack_words(message_block)
+        for i in range(16, 64):
+            s0 = (
+                rotate_right(w[i - 15], 7)
+                ^ rotate_right(w[i - 15], 18)
+                ^ shift_right(w[i - 15], 3)
+            )
+            s1 = (
+                rotate_right(w[i - 2], 17)
+                ^ rotate_right(w[i - 2], 19)
+                ^ shift_right(w[i - 2], 10)
+            )
+            w[i] = (w[i - 16] + s0 + w[i - 7] + s1) & MASK
         return w
 
-    def register_values_to_hex_string(self) -> str:
-        """Read the values of the 8 registers and convert them to a hexadecimal string.
+    def register_values_to_bytes(self) -> bytes:
+        """Pack the values of the 8 registers into the digest, truncated to `output_bits`.
 
         Returns:
-            str: The hexadecimal string represented by the 8 registers.
+            bytes: The digest represented by the 8 registers.
         """
-        return "%08x%08x%08x%08x%08x%08x%08x%08x" % (
+        return struct.pack(
+            ">8I",
+            self.h0,
+            self.h1,
+            self.h2,
+            self.h3,
+            self.h4,
+            self.h5,
+            self.h6,
+            self.h7,
+        )[: self.digest_size]
+
+    def process_message_block(self, message_block: memoryview) -> None:
+        """Compress a 64-byte message block into the 8 registers.
+
+        Args:
+            message_block (memoryview): The 512-bit message block.
+        """
+        w = self.extend_message_schedule(message_block)
+        a, b, c, d, e, f, g, h = (
             self.h0,
             self.h1,
             self.h2,
@@ -129,59 +203,67 @@ class SHA256:
             self.h7,
         )
 
-    def generate_hash(self, message: str) -> str:
-        """Generates a 256-bit SHA-256 hash of the input message.
+        for i in range(64):
+            s1 = rotate_right(e, 6) ^ rotate_right(e, 11) ^ rotate_right(e, 25)
+            ch = (e & f) ^ (~e & g)
+            temp1 = h + s1 + ch + K[i] + w[i]
+
+            s0 = rotate_right(a, 2) ^ rotate_right(a, 13) ^ rotate_right(a, 22)
+            maj = (a & b) ^ (a & c) ^ (b & c)
+
+            h = g
+            g = f
+            f = e
+            e = (d + temp1) & MASK
+            d = c
+            c = b
+            b = a
+            a = (temp1 + s0 + maj) & MASK
+
+        self.h0 = (self.h0 + a) & MASK
+        self.h1 = (self.h1 + b) & MASK
+        self.h2 = (self.h2 + c) & MASK
+        self.h3 = (self.h3 + d) & MASK
+        self.h4 = (self.h4 + e) & MASK
+        self.h5 = (self.h5 + f) & MASK
+        self.h6 = (self.h6 + g) & MASK
+        self.h7 = (self.h7 + h) & MASK
+
+    @classmethod
+    def hash_many(cls, messages: Iterable[Message]) -> Any:
+        """Generates the hashes of many messages at once, with vectorized NumPy operations over all the messages.
+        The digests are truncated to the `output_bits` of the algorithm (SHA-224).
+        Requires NumPy (pip install hashbase[numpy]).
 
         Args:
-            message (str): The input message/text.
+            messages (Iterable[Message]): The input messages.
 
         Returns:
-            str: The 256-bit SHA-256 hash of the message.
+            numpy.ndarray: An (N, output_bits // 8) uint8 array with the hash of the i-th message in row i.
         """
-        message_in_bytes = bytearray(message, "ascii")
-        message_chunk = apply_message_padding(message_in_bytes, "big")
+        from hashbase.vectorized import sha2_hash_many
 
-        # Loop through each 64-byte message block
-        for block in range(len(message_chunk) // 64):
-            w = self.break_message_block_into_words(
-                message_chunk[block * 64 : block * 64 + 64]
-            )
-            a, b, c, d, e, f, g, h = (
-                self.h0,
-                self.h1,
-                self.h2,
-                self.h3,
-                self.h4,
-                self.h5,
-                self.h6,
-                self.h7,
-            )
+        return sha2_hash_many(
+            messages,
+            K,
+            32,
+            (2, 13, 22),
+            (6, 11, 25),
+            (7, 18, 3),
+            (17, 19, 10),
+            cls.initial_register_values,
+            cls().digest_size,
+        )
+
+    def generate_hash(self, message: Message) -> str:
+        """Generates a SHA-256 (or SHA-224) hash of the input message.
+
+        Args:
+            message (Message): The input message/text or a bytes-like object.
 
-            for i in range(64):
-                s1 = rotate_right(e, 6) ^ rotate_right(e, 11) ^ rotate_right(e, 25)
-                ch = (e & f) ^ (~e & g)
-                temp1 = modular_add([h, s1, ch, self.K[i], w[i]])
-
-                s0 = rotate_right(a, 2) ^ rotate_right(a, 13) ^ rotate_right(a, 22)
-                maj = (a & b) ^ (a & c) ^ (b & c)
-                temp2 = modular_add([s0, maj])
-
-                h = g
-                g = f
-                f = e
-                e = modular_add([d, temp1])
-                d = c
-                c = b
-                b = a
-                a = modular_add([temp1, temp2])
-
-            self.h0 = modular_add([self.h0, a])
-            self.h1 = modular_add([self.h1, b])
-            self.h2 = modular_add([self.h2, c])
-            self.h3 = modular_add([self.h3, d])
-            self.h4 = modular_add([self.h4, e])
-            self.h5 = modular_add([self.h5, f])
-            self.h6 = modular_add([self.h6, g])
-            self.h7 = modular_add([self.h7, h])
-
-        return self.register_values_to_hex_string()
+        Returns:
+            str: The hash of the message as a hexadecimal string.
+        """
+        self.reset()
+        self.update(message)
+        return self.hexdigest()
@@ -1,4 +1,8 @@
-from hashbase import SHA512
+from typing import Optional
+
+from hashbase.sha512 import SHA512
+
+__all__ = ["SHA512_256"]
 
 
 class SHA512_256(SHA512):
@@ -7,13 +11,17 @@ class SHA512_256(SHA512):
     https://en.wikipedia.org/wiki/SHA-2
     """
 
-    def __init__(self) -> None:
-        super().__init__(output_bits=256)
-        self.h0: int = 0x22312194FC2BF72C
-        self.h1: int = 0x9F555FA3C84C64C2
-        self.h2: int = 0x2393B86B6F53B151
-        self.h3: int = 0x963877195940EABD
-        self.h4: int = 0x96283EE2A88EFFE3
-        self.h5: int = 0xBE5E1E2553863992
-        self.h6: int = 0x2B0199FC2C85B8AA
-        self.h7: int = 0x0EB72DDC81C52CA2
+    hashlib_name = "sha512_256"
+    initial_register_values = (
+        0x22312194FC2BF72C,
+        0x9F555FA3C84C64C2,
+        0x2393B86B6F53B151,
+        0x963877195940EABD,
+        0x96283EE2A88EFFE3,
+        0xBE5E1E2553863992,
+        0x2B0199FC2C85B8AA,
+        0x0EB72DDC81C52CA2,
+    )
+
+    def __init__(self, backend: Optional[str] = None) -> None:
+        super().__init__(output_bits=256, backend=backend)
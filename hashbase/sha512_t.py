@@ -0,0 +1,91 @@
+import re
+import struct
+from functools import lru_cache
+from typing import Optional, Tuple, Type
+
+from hashbase.sha512 import SHA512
+
+__all__ = ["SHA512_t"]
+
+# The initial register values of SHA-512 XORed with 0xa5a5a5a5a5a5a5a5, used to derive the IVs of SHA-512/t
+IV_GENERATION_MASK = 0xA5A5A5A5A5A5A5A5
+
+
+@lru_cache(maxsize=None)
+def sha512_t_initial_register_values(t: int) -> Tuple[int, ...]:
+    """Derives the initial register values of SHA-512/t with the IV generation function of FIPS 180-4 (5.3.6):
+    the SHA-512 hash of the string "SHA-512/t", computed from the SHA-512 IV XORed with 0xa5a5a5a5a5a5a5a5.
+    The IVs are cached, so the extra compression only runs once per t and process.
+
+    Args:
+        t (int): The size of the digest in bits.
+
+    Returns:
+        Tuple[int, ...]: The 8 initial register values.
+    """
+    # hashlib cannot start from a different IV
+    hasher = SHA512(backend="python")
+    hasher.initial_register_values = tuple(
+        value ^ IV_GENERATION_MASK for value in SHA512.initial_register_values
+    )
+    hasher.reset()
+    hasher.update(f"SHA-512/{t}".encode("ascii"))
+    return struct.unpack(">8Q", hasher.digest())
+
+
+@lru_cache(maxsize=None)
+def SHA512_t(t: int) -> Type[SHA512]:
+    """Creates the SHA-512/t algorithm, a cryptographic hashing function used to produce a t-bit hash.
+    The algorithm is identical to SHA-512, except the initial register values (derived from t) and the output digest
+    size. The classes are cached, so `SHA512_t(192)` always returns the same class.
+    https://en.wikipedia.org/wiki/SHA-2
+
+    Args:
+        t (int): The size of the digest in bits, a multiple of 8 smaller than 512 (except 384).
+
+    Returns:
+        Type[SHA512]: The SHA-512/t hash function class.
+    """
+    if not 0 < t < 512 or t % 8 or t == 384:
+        raise ValueError(
+            f"t must be a multiple of 8 between 8 and 504 (except 384), got {t}"
+        )
+
+    class SHA512_T(SHA512):
+        __doc__ = f"""The SHA-512/{t} algorithm is a cryptographic hashing function used to produce a {t}-bit hash.
+        The algorithm is identical to SHA-512, except the initial register values and output digest size.
+        https://en.wikipedia.org/wiki/SHA-2
+        """
+
+        # hashlib only provides SHA-512/224 and SHA-512/256
+        hashlib_name = f"sha512_{t}" if t in (224, 256) else None
+        initial_register_values = sha512_t_initial_register_values(t)
+
+        def __init__(self, backend: Optional[str] = None) -> None:
+            super().__init__(output_bits=t, backend=backend)
+
+    # The class is found as an attribute of this module, so that it and its instances can be pickled (e.g. to be
+    # sent to the worker processes of `hash_many`); see also `__getattr__`, for processes that did not create it
+    name = f"SHA512_{t}"
+    SHA512_T.__name__ = SHA512_T.__qualname__ = name
+    globals()[name] = SHA512_T
+    return SHA512_T
+
+
+def __getattr__(name: str) -> Type[SHA512]:
+    """Creates the SHA-512/t class named `SHA512_{t}` on first access, which is how pickle finds it in a process that
+    has not called `SHA512_t(t)` yet.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        Type[SHA512]: The SHA-512/t hash function class.
+    """
+    match = re.fullmatch(r"SHA512_([1-9][0-9]*)", name)
+    if match is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    try:
+        return SHA512_t(int(match.group(1)))
+    except ValueError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
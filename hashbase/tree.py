@@ -0,0 +1,354 @@
+import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
+
+from hashbase.digest import Digest
+from hashbase.utils import Message, message_to_memoryview
+
+__all__ = ["TreeHasher"]
+
+T = TypeVar("T", bound="TreeHasher")
+
+# Merkle tree hashing of large objects, as defined by RFC 6962 (Certificate Transparency):
+#   - the object is split into leaves of `leaf_size` bytes (the last one may be shorter)
+#   - a leaf is hashed as HASH(0x00 || leaf) and an inner node as HASH(0x01 || left || right), so that a leaf can
+#     never be mistaken for a node (domain separation)
+#   - a tree of n > 1 leaves is split into a left subtree of the largest power of 2 smaller than n leaves and a right
+#     subtree of the remaining leaves; the root of an empty object is HASH("")
+# Appended leaves are merged into perfect subtrees like a binary counter, so only the roots of at most log2(n)
+# subtrees (the frontier) are kept in memory.
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+DEFAULT_LEAF_SIZE = 1024 * 1024
+
+
+def largest_power_of_2_below(n: int) -> int:
+    """The largest power of 2 smaller than n, the number of leaves of the left subtree of a tree of n > 1 leaves.
+
+    Args:
+        n (int): The number of leaves.
+
+    Returns:
+        int: The largest power of 2 smaller than n.
+    """
+    return 1 << (n - 1).bit_length() - 1
+
+
+def hash_leaf(algorithm: Callable[[], Any], leaf: Message) -> bytes:
+    """Computes the hash of a leaf, HASH(0x00 || leaf).
+
+    Args:
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`).
+        leaf (Message): The data of the leaf.
+
+    Returns:
+        bytes: The hash of the leaf.
+    """
+    hasher = algorithm()
+    hasher.update(LEAF_PREFIX)
+    hasher.update(leaf)
+    return hasher.digest()
+
+
+def hash_node(algorithm: Callable[[], Any], left: bytes, right: bytes) -> bytes:
+    """Computes the hash of an inner node, HASH(0x01 || left || right).
+
+    Args:
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`).
+        left (bytes): The hash of the left child.
+        right (bytes): The hash of the right child.
+
+    Returns:
+        bytes: The hash of the node.
+    """
+    hasher = algorithm()
+    hasher.update(NODE_PREFIX + left + right)
+    return hasher.digest()
+
+
+def hash_leaves(algorithm: Callable[[], Any], leaves: List[bytes]) -> List[bytes]:
+    """Computes the hashes of a batch of leaves in a worker process of `TreeHasher`.
+
+    Args:
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`).
+        leaves (List[bytes]): The data of the leaves.
+
+    Returns:
+        List[bytes]: The hash of each leaf.
+    """
+    return [hash_leaf(algorithm, leaf) for leaf in leaves]
+
+
+class TreeHasher:
+    """Computes the Merkle tree hash (RFC 6962) of an object fed incrementally, and generates and verifies inclusion
+    proofs of single leaves. The complete leaves are hashed in a pool of processes, at most 2 leaves per worker at a
+    time, unless the hash function uses a C backend (see `hashbase.backends`), which is faster than copying the leaves
+    to other processes.
+    https://datatracker.ietf.org/doc/html/rfc6962#section-2.1
+
+    Args:
+        algorithm (Callable[[], Any]): The hash function class (e.g. `SHA256`); it must be picklable to be sent to the
+            worker processes.
+        leaf_size (int): The size of the leaves in bytes.
+        workers (Optional[int]): The number of processes, defaults to the number of CPUs.
+    """
+
+    def __init__(
+        self,
+        algorithm: Callable[[], Any],
+        leaf_size: int = DEFAULT_LEAF_SIZE,
+        workers: Optional[int] = None,
+    ) -> None:
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be at least 1")
+        hasher = algorithm()
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.digest_size: int = hasher.digest_size
+        self.workers = workers or os.cpu_count() or 1
+        if getattr(hasher, "active_backend", "python") != "python":
+            self.workers = 1
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset the tree to an empty object, discarding the data fed so far."""
+        self.leaf_count = 0
+        self.frontier: List[bytes] = []
+        self.pending_leaves: List[bytes] = []
+        self.buffer = bytearray()
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self: T) -> T:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def copy(self: T) -> T:
+        """Create an independent copy of the tree, including the data fed so far. The copy starts its own worker
+        processes when it needs them.
+
+        Returns:
+            TreeHasher: A copy of the tree.
+        """
+        self.flush_pending_leaves()
+        clone = copy.copy(self)
+        clone.frontier = list(self.frontier)
+        clone.pending_leaves = []
+        clone.buffer = bytearray(self.buffer)
+        clone.executor = None
+        return clone
+
+    def append_leaf_hash(self, leaf_hash: bytes) -> None:
+        """Append the hash of the next leaf to the tree, merging the perfect subtrees of equal size on the frontier.
+
+        Args:
+            leaf_hash (bytes): The hash of the leaf.
+        """
+        count = self.leaf_count
+        while count & 1:
+            leaf_hash = hash_node(self.algorithm, self.frontier.pop(), leaf_hash)
+            count >>= 1
+        self.frontier.append(leaf_hash)
+        self.leaf_count += 1
+
+    def hash_leaves(self, leaves: List[bytes]) -> List[bytes]:
+        """Computes the hashes of leaves, split into one batch per worker process.
+
+        Args:
+            leaves (List[bytes]): The data of the leaves.
+
+        Returns:
+            List[bytes]: The hash of each leaf, in order.
+        """
+        if self.workers == 1 or len(leaves) < 2:
+            return hash_leaves(self.algorithm, leaves)
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(self.workers)
+        batch_size = -(-len(leaves) // self.workers)
+        batches = [
+            leaves[start : start + batch_size]
+            for start in range(0, len(leaves), batch_size)
+        ]
+        return [
+            leaf_hash
+            for batch_hashes in self.executor.map(
+                hash_leaves, [self.algorithm] * len(batches), batches
+            )
+            for leaf_hash in batch_hashes
+        ]
+
+    def flush_pending_leaves(self) -> None:
+        """Hash the complete leaves that are waiting for the worker processes and append them to the tree."""
+        if self.pending_leaves:
+            for leaf_hash in self.hash_leaves(self.pending_leaves):
+                self.append_leaf_hash(leaf_hash)
+            self.pending_leaves = []
+
+    def update(self, message: Message) -> None:
+        """Feed the next chunk of the object into the tree.
+
+        Args:
+            message (Message): The next chunk of the object as a string (encoded as UTF-8) or a bytes-like object.
+        """
+        message_view = message_to_memoryview(message)
+        start = 0
+        while start < len(message_view):
+            end = start + self.leaf_size - len(self.buffer)
+            self.buffer += message_view[start:end]
+            start = end
+            if len(self.buffer) < self.leaf_size:
+                break
+            self.pending_leaves.append(bytes(self.buffer))
+            self.buffer = bytearray()
+            if len(self.pending_leaves) >= 2 * self.workers:
+                self.flush_pending_leaves()
+
+    def digest(self) -> bytes:
+        """Compute the root hash of the data fed so far; the incomplete last leaf (if any) is hashed as a leaf.
+
+        Returns:
+            bytes: The root hash of the tree.
+        """
+        self.flush_pending_leaves()
+        if not self.leaf_count and not self.buffer:
+            return self.algorithm().digest()
+        subtree_roots = list(self.frontier)
+        if self.buffer:
+            subtree_roots.append(hash_leaf(self.algorithm, self.buffer))
+        # The subtrees on the frontier shrink from left to right, so merging them from the right builds the same
+        # left-heavy tree as splitting at the largest power of 2
+        root = subtree_roots.pop()
+        while subtree_roots:
+            root = hash_node(self.algorithm, subtree_roots.pop(), root)
+        return root
+
+    def hexdigest(self) -> str:
+        """Compute the root hash of the data fed so far.
+
+        Returns:
+            str: The root hash of the tree as a hexadecimal string.
+        """
+        return self.digest().hex()
+
+    def generate_digest(self, message: Message) -> Digest:
+        """Generates the root hash of the Merkle tree of the input message.
+
+        Args:
+            message (Message): The input message/text or a bytes-like object.
+
+        Returns:
+            Digest: The root hash of the tree.
+        """
+        self.reset()
+        self.update(message)
+        return Digest(self.digest())
+
+    def leaf_hashes(self, message: Message) -> List[bytes]:
+        """Computes the hashes of all the leaves of a complete object, which `inclusion_proof` needs.
+
+        Args:
+            message (Message): The complete object.
+
+        Returns:
+            List[bytes]: The hash of each leaf, in order.
+        """
+        view = message_to_memoryview(message)
+        leaves = [
+            bytes(view[start : start + self.leaf_size])
+            for start in range(0, len(view), self.leaf_size)
+        ]
+        return self.hash_leaves(leaves)
+
+    def subtree_root(self, leaf_hashes: Sequence[bytes]) -> bytes:
+        """Computes the root hash of the tree of a non-empty range of leaves.
+
+        Args:
+            leaf_hashes (Sequence[bytes]): The hashes of the leaves.
+
+        Returns:
+            bytes: The root hash of the subtree.
+        """
+        if len(leaf_hashes) == 1:
+            return leaf_hashes[0]
+        split = largest_power_of_2_below(len(leaf_hashes))
+        return hash_node(
+            self.algorithm,
+            self.subtree_root(leaf_hashes[:split]),
+            self.subtree_root(leaf_hashes[split:]),
+        )
+
+    def inclusion_proof(self, leaf_hashes: Sequence[bytes], index: int) -> List[bytes]:
+        """Generates the audit path of a leaf (RFC 6962, section 2.1.1): the hashes of the sibling subtrees from the
+        leaf up to the root.
+
+        Args:
+            leaf_hashes (Sequence[bytes]): The hashes of all the leaves of the object (see `leaf_hashes`).
+            index (int): The index of the leaf.
+
+        Returns:
+            List[bytes]: The audit path, from the bottom of the tree to the top.
+        """
+        if not 0 <= index < len(leaf_hashes):
+            raise IndexError(
+                f"Leaf index {index} out of range for {len(leaf_hashes)} leaves"
+            )
+        proof: List[bytes] = []
+        while len(leaf_hashes) > 1:
+            split = largest_power_of_2_below(len(leaf_hashes))
+            if index < split:
+                proof.append(self.subtree_root(leaf_hashes[split:]))
+                leaf_hashes = leaf_hashes[:split]
+            else:
+                proof.append(self.subtree_root(leaf_hashes[:split]))
+                leaf_hashes = leaf_hashes[split:]
+                index -= split
+        return proof[::-1]
+
+    def verify_inclusion(
+        self,
+        leaf: Message,
+        index: int,
+        leaf_count: int,
+        proof: Sequence[bytes],
+        root: bytes,
+    ) -> bool:
+        """Checks that a leaf is part of an object with the given root hash, without the rest of the object
+        (RFC 9162, section 2.1.3.2).
+
+        Args:
+            leaf (Message): The data of the leaf.
+            index (int): The index of the leaf.
+            leaf_count (int): The number of leaves of the object.
+            proof (Sequence[bytes]): The audit path of the leaf (see `inclusion_proof`).
+            root (bytes): The root hash of the object.
+
+        Returns:
+            bool: Whether the proof is valid.
+        """
+        if not 0 <= index < leaf_count:
+            return False
+        node_index, last_index = index, leaf_count - 1
+        node_hash = hash_leaf(self.algorithm, leaf)
+        for sibling in proof:
+            if last_index == 0:
+                return False
+            if node_index & 1 or node_index == last_index:
+                node_hash = hash_node(self.algorithm, sibling, node_hash)
+                while not node_index & 1 and node_index:
+                    node_index >>= 1
+                    last_index >>= 1
+            else:
+                node_hash = hash_node(self.algorithm, node_hash, sibling)
+            node_index >>= 1
+            last_index >>= 1
+        return last_index == 0 and node_hash == bytes(root)
@@ -1,4 +1,25 @@
-from typing import List, Any
+from typing import List, Any, Union
+
+# The input of the hash functions: a string (encoded as UTF-8) or any object that supports the buffer protocol
+# (bytes, bytearray, memoryview, mmap, array, ...)
+Message = Union[str, bytes, bytearray, memoryview]
+
+
+def message_to_memoryview(message: Message) -> memoryview:
+    """Exposes the input message as a flat memoryview of bytes, without copying buffers.
+
+    Args:
+        message (Message): The input message/text or a bytes-like object.
+
+    Returns:
+        memoryview: A 1-dimensional, unsigned byte view of the message.
+    """
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+    view = memoryview(message)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    return view
 
 
 def rotate_left(x: int, s: int, size: int = 32) -> int:
@@ -95,21 +116,43 @@ def apply_message_padding(
     Returns:
         bytearray: The pre-processed message in bytes.
     """
-    # Store the length of the message in bits
-    original_message_length_in_bits = len(message) * 8
+    message += message_padding(
+        len(message),
+        message_length_byteorder,
+        message_length_padding_bits,
+        message_chunk_size_bits,
+    )
+    return message
 
-    # Pad a trailing '1'
-    message.append(0x80)
 
-    # Pad 0s to assert a block length of (message_chunk_size_bits-message_length_padding_bits) bits
-    while (
-        len(message) * 8 + message_length_padding_bits
-    ) % message_chunk_size_bits != 0:
-        message.append(0)
+def message_padding(
+    message_length: int,
+    message_length_byteorder: Any,
+    message_length_padding_bits: int = 64,
+    message_chunk_size_bits: int = 512,
+) -> bytes:
+    """Computes the padding that completes the final message chunk(s).
+    A trailing '1', followed by 0s and the message length in little or big endian.
 
-    # Pad the last message_length_padding_bits bits that indicate the message length in the specified endian format
-    message += (original_message_length_in_bits).to_bytes(
-        message_length_padding_bits // 8, byteorder=message_length_byteorder
-    )
+    Args:
+        message_length (int): The length of the entire message in bytes.
+        message_length_byteorder (str): Can be either 'big' or 'little', indicating if the last 64 bits of the message (message length) are in the big or little endian convention.
+        message_length_padding_bits (int): The number of bits to be appended at the end of the message chunk to indicate the length of the original message.
+        message_chunk_size_bits (int): The size of the message chunk in bits.
 
-    return message
+    Returns:
+        bytes: The padding to be appended to the message.
+    """
+    message_length_padding_bytes = message_length_padding_bits // 8
+    zero_padding_bytes = -(message_length + 1 + message_length_padding_bytes) % (
+        message_chunk_size_bits // 8
+    )
+    # The message length is stored modulo 2^message_length_padding_bits
+    message_length_in_bits = (message_length * 8) % (1 << message_length_padding_bits)
+    return (
+        b"\x80"
+        + bytes(zero_padding_bytes)
+        + message_length_in_bits.to_bytes(
+            message_length_padding_bytes, byteorder=message_length_byteorder
+        )
+    )
@@ -0,0 +1,151 @@
+from typing import Any, Iterable, List, Sequence, Tuple
+
+from hashbase.utils import Message, message_padding, message_to_memoryview
+
+# Multi-buffer ("lane parallel") implementation of the SHA-2 compression functions on top of NumPy.
+# N messages are packed into an (N, blocks, 16) array of 32-bit (SHA-256) or 64-bit (SHA-512) words and every step of the message schedule and of the
+# rounds is a single vectorized operation over all the messages (lanes) that still have a block left.
+# NumPy is an optional dependency: pip install hashbase[numpy]
+
+
+def import_numpy() -> Any:
+    """Imports NumPy, which is only needed by the batch hashing functions.
+
+    Returns:
+        module: The numpy module.
+    """
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "Hashing messages in batches requires NumPy, install it with 'pip install hashbase[numpy]'"
+        ) from error
+    return numpy
+
+
+def pack_message_blocks(
+    messages: Iterable[Message], block_size: int, length_padding_bits: int
+) -> Any:
+    """Pads the messages and packs them into a 2-D array of message blocks, one row per message.
+
+    Args:
+        messages (Iterable[Message]): The input messages.
+        block_size (int): The size of a message block in bytes.
+        length_padding_bits (int): The number of bits used to append the message length.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The (N, blocks * block_size) uint8 array of padded messages and the
+            number of blocks of each message.
+    """
+    np = import_numpy()
+    padded_messages: List[bytes] = []
+    for message in messages:
+        message_view = message_to_memoryview(message)
+        padded_messages.append(
+            bytes(message_view)
+            + message_padding(
+                len(message_view), "big", length_padding_bits, block_size * 8
+            )
+        )
+    block_counts = np.array(
+        [len(m) // block_size for m in padded_messages], dtype=np.int64
+    )
+    max_blocks = int(block_counts.max()) if len(padded_messages) else 0
+    message_blocks = np.zeros(
+        (len(padded_messages), max_blocks * block_size), dtype=np.uint8
+    )
+    for i, padded_message in enumerate(padded_messages):
+        message_blocks[i, : len(padded_message)] = np.frombuffer(
+            padded_message, dtype=np.uint8
+        )
+    return message_blocks, block_counts
+
+
+def sha2_hash_many(
+    messages: Iterable[Message],
+    round_constants: Sequence[int],
+    word_size: int,
+    big_sigma0: Tuple[int, int, int],
+    big_sigma1: Tuple[int, int, int],
+    small_sigma0: Tuple[int, int, int],
+    small_sigma1: Tuple[int, int, int],
+    initial_register_values: Sequence[int],
+    digest_size: int,
+) -> Any:
+    """Computes the SHA-256 (word_size=32) or SHA-512 (word_size=64) hash of every message in a single pass over
+    uint32 or uint64 arrays. The truncated variants (SHA-224, SHA-384, SHA-512/t) only differ in their initial
+    register values and digest size.
+
+    Args:
+        messages (Iterable[Message]): The input messages.
+        round_constants (Sequence[int]): The 64 or 80 constants K.
+        word_size (int): The size of the words and registers in bits.
+        big_sigma0 (Tuple[int, int, int]): The 3 right rotations of Σ0.
+        big_sigma1 (Tuple[int, int, int]): The 3 right rotations of Σ1.
+        small_sigma0 (Tuple[int, int, int]): The 2 right rotations and the right shift of σ0.
+        small_sigma1 (Tuple[int, int, int]): The 2 right rotations and the right shift of σ1.
+        initial_register_values (Sequence[int]): The 8 initial register values.
+        digest_size (int): The size of the digest in bytes (the registers are truncated to this size).
+
+    Returns:
+        numpy.ndarray: A C-contiguous (N, digest_size) uint8 array with the digest of the i-th message in row i.
+    """
+    np = import_numpy()
+    word_type = np.uint32 if word_size == 32 else np.uint64
+    word_bytes = word_size // 8
+    block_size = 16 * word_bytes
+    message_blocks, block_counts = pack_message_blocks(
+        messages, block_size, 2 * word_size
+    )
+    count = len(block_counts)
+    if count == 0:
+        return np.empty((0, digest_size), dtype=np.uint8)
+    K = np.array(round_constants, dtype=word_type)
+    rounds = len(round_constants)
+
+    # Sort the lanes by their number of blocks (longest first), so the lanes that still have a block to process
+    # always form a prefix and finished lanes are masked out by slicing instead of being recomputed
+    order = np.argsort(-block_counts, kind="stable")
+    words = (
+        message_blocks[order]
+        .view(f">u{word_bytes}")
+        .astype(word_type)
+        .reshape(count, -1, 16)
+    )
+    block_counts = block_counts[order]
+    registers = np.tile(
+        np.array(initial_register_values, dtype=word_type)[:, None], (1, count)
+    )
+    shifts = {s: word_type(s) for s in range(word_size)}
+
+    def rotate_right(x: Any, s: int) -> Any:
+        return (x >> shifts[s]) | (x << shifts[word_size - s])
+
+    def sigma(x: Any, rotations: Tuple[int, int, int], shift: bool = False) -> Any:
+        last = x >> shifts[rotations[2]] if shift else rotate_right(x, rotations[2])
+        return rotate_right(x, rotations[0]) ^ rotate_right(x, rotations[1]) ^ last
+
+    w = np.empty((rounds, count), dtype=word_type)
+    for block in range(words.shape[1]):
+        lanes = int(np.count_nonzero(block_counts > block))
+        w[:16, :lanes] = words[:lanes, block, :].T
+        for i in range(16, rounds):
+            s0 = sigma(w[i - 15, :lanes], small_sigma0, shift=True)
+            s1 = sigma(w[i - 2, :lanes], small_sigma1, shift=True)
+            w[i, :lanes] = w[i - 16, :lanes] + s0 + w[i - 7, :lanes] + s1
+
+        a, b, c, d, e, f, g, h = registers[:, :lanes]
+        for i in range(rounds):
+            temp1 = h + sigma(e, big_sigma1) + (g ^ (e & (f ^ g))) + K[i] + w[i, :lanes]
+            temp2 = sigma(a, big_sigma0) + ((a & b) | (c & (a | b)))
+            h, g, f, e, d, c, b, a = g, f, e, d + temp1, c, b, a, temp1 + temp2
+        registers[:, :lanes] += np.stack([a, b, c, d, e, f, g, h])
+
+    digests = np.empty((count, 8 * word_bytes), dtype=np.uint8)
+    digests[order] = (
+        np.ascontiguousarray(registers.T)
+        .astype(f">u{word_bytes}")
+        .view(np.uint8)
+        .reshape(count, 8 * word_bytes)
+    )
+    return np.ascontiguousarray(digests[:, :digest_size])
@@ -8,7 +8,7 @@ with open(os.path.join(repository_dir, "README.md")) as fh:
 
 setup(
     name="hashbase",
-    version="1.1.5",
+    version="1.2.0",
     packages=find_packages(exclude="tests"),
     description="A collection of cryptographic hashing algorithms implemented in Python",
     long_description=long_description,
@@ -30,4 +30,5 @@ setup(
     ],
     keywords="python, hashing, hashing-algorithms, hash-functions, cryptography",
     python_requires=">=3.6",
+    extras_require={"numpy": ["numpy"]},
 )
@@ -0,0 +1,78 @@
+import asyncio
+import hashlib
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from hashbase import SHA1, SHA256, CRC16
+from hashbase.aio import hash_async_iter, hash_stream
+
+
+async def async_chunks(data, chunk_size):
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
+
+
+class TestAio(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def test_hash_stream(self):
+        data = bytes(range(256)) * 1000
+
+        async def hash_data(executor):
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            reader.feed_eof()
+            return await hash_stream(reader, SHA256, 10000, executor)
+
+        with ThreadPoolExecutor(2) as executor:
+            for pool in (None, executor):
+                with self.subTest(executor=pool):
+                    self.assertEqual(
+                        self.loop.run_until_complete(hash_data(pool)),
+                        hashlib.sha256(data).digest(),
+                    )
+
+    def test_hash_async_iter(self):
+        data = b"The quick brown fox jumps over the lazy dog" * 100
+        crc = CRC16()
+        crc.update(data)
+        self.assertEqual(
+            self.loop.run_until_complete(hash_async_iter(async_chunks(data, 7), CRC16)),
+            crc.digest(),
+        )
+        self.assertEqual(
+            self.loop.run_until_complete(hash_async_iter(async_chunks(b"", 7), SHA1)),
+            hashlib.sha1().digest(),
+        )
+
+    def test_concurrent_streams_keep_the_loop_responsive(self):
+        messages = [bytes([i]) * 20000 for i in range(4)]
+        ticks = []
+
+        async def ticker():
+            while len(ticks) < 1000:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def hash_all():
+            tick_task = asyncio.ensure_future(ticker())
+            digests = await asyncio.gather(
+                *(
+                    hash_async_iter(
+                        async_chunks(message, 20000), partial(SHA256, backend="python")
+                    )
+                    for message in messages
+                )
+            )
+            tick_task.cancel()
+            return digests
+
+        digests = self.loop.run_until_complete(hash_all())
+        self.assertEqual(
+            digests, [hashlib.sha256(message).digest() for message in messages]
+        )
+        # The streams yield after each 4 KiB slice, so the ticker runs between the 5 slices of every message
+        self.assertGreaterEqual(len(ticks), 5)
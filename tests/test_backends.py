@@ -0,0 +1,165 @@
+import unittest
+import copy
+import hashlib
+import json
+import pickle
+import warnings
+from unittest import mock
+
+from hashbase import (
+    CRC,
+    CRC_CATALOGUE,
+    CRC16,
+    MD4,
+    MD5,
+    SHA1,
+    SHA224,
+    SHA256,
+    SHA384,
+    SHA512,
+    SHA512_224,
+    SHA512_256,
+    RIPEMD128,
+    RIPEMD160,
+    RIPEMD256,
+    RIPEMD320,
+)
+from hashbase import backends
+
+HASH_FUNCTIONS = {
+    "MD4": MD4,
+    "MD5": MD5,
+    "SHA1": SHA1,
+    "SHA224": SHA224,
+    "SHA256": SHA256,
+    "SHA384": SHA384,
+    "SHA512": SHA512,
+    "SHA512_224": SHA512_224,
+    "SHA512_256": SHA512_256,
+    "RIPEMD128": RIPEMD128,
+    "RIPEMD160": RIPEMD160,
+    "RIPEMD256": RIPEMD256,
+    "RIPEMD320": RIPEMD320,
+}
+
+
+class TestBackends(unittest.TestCase):
+    def test_backends_match_test_cases(self):
+        with open("tests/test_cases.json", "r") as f:
+            test_cases = json.load(f)
+
+        for name, hash_function in HASH_FUNCTIONS.items():
+            for backend in ("auto", "python"):
+                hasher = hash_function(backend=backend)
+                for test_case in test_cases:
+                    self.assertEqual(
+                        hasher.generate_hash(test_case["message"]),
+                        test_case["expected"][name],
+                    )
+                if backend == "python":
+                    self.assertEqual(hasher.active_backend, "python")
+
+    def test_active_backend(self):
+        self.assertEqual(RIPEMD320().active_backend, "python")
+        if "sha256" in hashlib.algorithms_available:
+            self.assertEqual(SHA256().active_backend, "hashlib")
+        self.assertEqual(CRC.from_name("CRC-32").active_backend, "zlib")
+        self.assertEqual(CRC.from_name("CRC-16/XMODEM").active_backend, "binascii")
+        self.assertEqual(CRC.from_name("CRC-16/MODBUS").active_backend, "python")
+        with self.assertRaises(ValueError):
+            RIPEMD320(backend="stdlib")
+        with self.assertRaises(ValueError):
+            SHA256(backend="openssl")
+        with self.assertRaises(ValueError):
+            SHA256().backend = "openssl"
+
+    def test_backend_argument_and_assignment(self):
+        for hash_function in (MD5, SHA1, SHA224, SHA384, SHA512_256, RIPEMD160):
+            self.assertEqual(
+                hash_function(backend="python").active_backend, "python", hash_function
+            )
+            # An assigned backend takes effect immediately, not at the next reset
+            hasher = hash_function()
+            hasher.backend = "python"
+            self.assertEqual(hasher.active_backend, "python")
+            hasher.update("abc")
+            self.assertEqual(hasher.hexdigest(), hash_function().generate_hash("abc"))
+        # The state of one backend cannot be moved to the other
+        hasher = SHA256(backend="python")
+        hasher.update("abc")
+        with self.assertRaises(ValueError):
+            hasher.backend = "auto"
+        hasher.reset()
+        hasher.backend = "auto"
+        self.assertEqual(hasher.backend, "auto")
+        # The register of a CRC is shared by its backends, so they can be switched at any time
+        crc = CRC.from_name("CRC-32", backend="python")
+        self.assertEqual(crc.active_backend, "python")
+        crc.update("1234")
+        crc.backend = "auto"
+        self.assertEqual(crc.active_backend, "zlib")
+        crc.update("56789")
+        self.assertEqual(int(crc.hexdigest(), 16), CRC_CATALOGUE["CRC-32"].check)
+        self.assertEqual(CRC16(backend="python").active_backend, "python")
+
+    def test_streaming_and_copy(self):
+        message = bytes(range(256)) * 3
+        for hash_function in (SHA1, SHA384, SHA512_256):
+            hasher = hash_function()
+            hasher.update(message[:100])
+            copy = hasher.copy()
+            hasher.update(message[100:])
+            self.assertEqual(hasher.digest(), hash_function().python_hash(message))
+            self.assertEqual(copy.digest(), hash_function().python_hash(message[:100]))
+
+    def test_pickle_and_deepcopy(self):
+        message = bytes(range(256)) * 3
+        for hash_function in (SHA256, SHA512, RIPEMD160):
+            with self.subTest(hash_function=hash_function):
+                hasher = pickle.loads(pickle.dumps(hash_function()))
+                self.assertEqual(hasher.active_backend, hash_function().active_backend)
+                hasher.update(message[:100])
+                clone = copy.deepcopy(hasher)
+                hasher.update(message[100:])
+                clone.update(message[100:])
+                self.assertEqual(clone.digest(), hasher.digest())
+                self.assertEqual(hasher.digest(), hash_function().python_hash(message))
+
+                python_hasher = hash_function(backend="python")
+                python_hasher.update(message[:100])
+                restored = pickle.loads(pickle.dumps(python_hasher))
+                restored.update(message[100:])
+                self.assertEqual(restored.digest(), hasher.digest())
+                if hasher.active_backend == "hashlib":
+                    with self.assertRaises(TypeError):
+                        pickle.dumps(hasher)
+
+    def test_crc_backends(self):
+        message = bytes(range(256)) * 3
+        for name in CRC_CATALOGUE:
+            crc = CRC.from_name(name)
+            crc.update(message[:10])
+            crc.update(message[10:])
+            self.assertEqual(crc.digest(), crc.python_hash(message))
+            self.assertEqual(
+                crc.generate_hash("123456789"), hex(CRC_CATALOGUE[name].check)
+            )
+        # zlib.crc32 and binascii.crc_hqx serve any init and xorout of their polynomial
+        for crc in (
+            CRC(32, 0x04C11DB7, 0x1234, True, False, 0x0),
+            CRC(16, 0x1021, 0x1D0F, False, True, 0xFFFF),
+        ):
+            self.assertNotEqual(crc.active_backend, "python")
+            self.assertEqual(
+                int(crc.generate_hash(message), 16),
+                int.from_bytes(crc.python_hash(message), "big"),
+            )
+
+    def test_disagreeing_backend_is_disabled(self):
+        with mock.patch.dict(backends.verified_backends, clear=True):
+            with mock.patch.object(MD5, "python_hash", lambda self, message: b""):
+                with warnings.catch_warnings(record=True) as caught:
+                    warnings.simplefilter("always")
+                    self.assertEqual(MD5().active_backend, "python")
+                self.assertEqual(caught[0].category, RuntimeWarning)
+        self.assertEqual(MD5().generate_hash("abc"), "900150983cd24fb0d6963f7d28e17f72")
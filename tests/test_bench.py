@@ -0,0 +1,98 @@
+import unittest
+import contextlib
+import io
+import json
+import os
+import tempfile
+
+from hashbase.bench import (
+    compare_to_baseline,
+    parse_import_time,
+    parse_size,
+    run_benchmarks,
+)
+from hashbase.bench.__main__ import main
+
+
+class TestBench(unittest.TestCase):
+    def test_run_benchmarks(self):
+        report = run_benchmarks(
+            ["SHA256", "MD2", "CRC16"], [0, 100], repeat=1, min_time=0, imports=False
+        )
+        results = report["results"]
+        for key in (
+            "SHA256 construction",
+            "SHA256 padding",
+            "SHA256 compression",
+            "MD2 padding",
+            "CRC16 hash 100B",
+        ):
+            self.assertGreater(results[key]["seconds"], 0)
+        self.assertIn("mb_per_s", results["SHA256 hash 100B"])
+        self.assertNotIn("mb_per_s", results["SHA256 hash 0B"])
+        self.assertNotIn("CRC16 compression", results)
+        json.dumps(report)
+
+    def test_compare_to_baseline(self):
+        baseline = {"results": {"A": {"seconds": 1.0}, "B": {"seconds": 1.0}}}
+        report = {
+            "results": {
+                "A": {"seconds": 1.05},
+                "B": {"seconds": 1.5},
+                "C": {"seconds": 9.0},
+            }
+        }
+        self.assertEqual(len(compare_to_baseline(report, baseline, 0.1)), 1)
+        self.assertEqual(compare_to_baseline(report, baseline, 0.6), [])
+
+    def test_import_time(self):
+        output = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:      3000 |      13000 |   typing",
+                "import time:      2000 |      15000 | hashbase",
+                "import time:       100 |        100 |   hashbase.utils",
+                "import time:       500 |        600 | struct",
+                "import time:      1000 |       4000 | hashbase.sha256",
+            ]
+        )
+        self.assertAlmostEqual(parse_import_time(output), 0.019)
+        report = run_benchmarks([], [], repeat=1)
+        self.assertEqual(
+            list(report["results"]),
+            [
+                "import hashbase",
+                "from hashbase import SHA256",
+                "from hashbase import *",
+            ],
+        )
+        self.assertGreater(report["results"]["import hashbase"]["seconds"], 0)
+
+    def test_parse_size(self):
+        self.assertEqual(parse_size("64M"), 64 * 1024 * 1024)
+        self.assertEqual(parse_size("1KiB"), 1024)
+        self.assertEqual(parse_size("100"), 100)
+        with self.assertRaises(ValueError):
+            parse_size("1G")
+
+    def test_main_fails_on_regression(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            arguments = [
+                "--algorithms",
+                "MD5",
+                "--sizes",
+                "64",
+                "--repeat",
+                "1",
+                "--min-time",
+                "0",
+                "--no-imports",
+            ]
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(arguments + ["--output", output]), 0)
+                with contextlib.redirect_stderr(io.StringIO()):
+                    # A negative threshold turns any measurement into a regression
+                    self.assertEqual(
+                        main(arguments + ["--baseline", output, "--threshold", "-1"]), 1
+                    )
@@ -0,0 +1,87 @@
+import array
+import hashlib
+import mmap
+import unittest
+
+from hashbase import (
+    MD2,
+    MD4,
+    MD5,
+    SHA1,
+    SHA224,
+    SHA256,
+    SHA384,
+    SHA512,
+    SHA512_224,
+    SHA512_256,
+    RIPEMD128,
+    RIPEMD160,
+    RIPEMD256,
+    RIPEMD320,
+    CRC8,
+    CRC16,
+)
+from hashbase.utils import apply_message_padding
+
+HASH_FUNCTIONS = [
+    MD2,
+    MD4,
+    MD5,
+    SHA1,
+    SHA224,
+    SHA256,
+    SHA384,
+    SHA512,
+    SHA512_224,
+    SHA512_256,
+    RIPEMD128,
+    RIPEMD160,
+    RIPEMD256,
+    RIPEMD320,
+    CRC8,
+    CRC16,
+]
+
+
+class TestBufferInput(unittest.TestCase):
+    def test_bytes_like_input(self):
+        message = "The quick brown fox jumps over the lazy dog" * 3
+        message_bytes = message.encode("ascii")
+        with mmap.mmap(-1, len(message_bytes)) as message_mmap:
+            message_mmap.write(message_bytes)
+            for hash_function in HASH_FUNCTIONS:
+                expected = hash_function().generate_hash(message)
+                for message_buffer in (
+                    message_bytes,
+                    bytearray(message_bytes),
+                    memoryview(message_bytes),
+                    array.array("B", message_bytes),
+                    message_mmap,
+                ):
+                    self.assertEqual(
+                        hash_function().generate_hash(message_buffer), expected
+                    )
+
+    def test_multi_byte_items(self):
+        words = array.array("I", range(100))
+        self.assertEqual(
+            SHA256().generate_hash(words), hashlib.sha256(words.tobytes()).hexdigest()
+        )
+
+    def test_utf8_and_binary_input(self):
+        self.assertEqual(
+            SHA256().generate_hash("ünïcödé"),
+            hashlib.sha256("ünïcödé".encode("utf-8")).hexdigest(),
+        )
+        message = bytes(range(256)) * 3
+        self.assertEqual(MD5().generate_hash(message), hashlib.md5(message).hexdigest())
+        self.assertEqual(
+            SHA512().generate_hash(message), hashlib.sha512(message).hexdigest()
+        )
+
+    def test_apply_message_padding(self):
+        for length in (0, 55, 56, 63, 64, 119, 120):
+            padded = apply_message_padding(bytearray(length), "big")
+            self.assertEqual(len(padded) % 64, 0)
+            self.assertEqual(padded[length], 0x80)
+            self.assertEqual(int.from_bytes(padded[-8:], "big"), length * 8)
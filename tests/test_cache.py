@@ -0,0 +1,75 @@
+import hashlib
+import threading
+import unittest
+
+from hashbase import MD5, SHA256
+from hashbase.cache import CachedHasher
+
+
+class TestCachedHasher(unittest.TestCase):
+    def test_hits_and_misses(self):
+        cache = CachedHasher(SHA256)
+        for message in ("token", b"token", bytearray(b"token"), b"other"):
+            self.assertEqual(
+                cache.generate_digest(message),
+                hashlib.sha256(
+                    message.encode() if isinstance(message, str) else message
+                ).digest(),
+            )
+        info = cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.entries), (2, 2, 2))
+        self.assertEqual(info.bytes, 2 * (5 + 32))
+        self.assertEqual(
+            cache.generate_hash(b"token"), hashlib.sha256(b"token").hexdigest()
+        )
+
+    def test_mutated_buffer_is_not_stale(self):
+        cache = CachedHasher(MD5)
+        buffer = bytearray(b"abc")
+        cache.generate_digest(buffer)
+        buffer[0:1] = b"x"
+        self.assertEqual(cache.generate_digest(buffer), hashlib.md5(b"xbc").digest())
+
+    def test_lru_eviction(self):
+        cache = CachedHasher(MD5, max_entries=2)
+        cache.generate_digest(b"a")
+        cache.generate_digest(b"b")
+        cache.generate_digest(b"a")
+        cache.generate_digest(b"c")
+        self.assertEqual(list(cache.entries), [b"a", b"c"])
+        self.assertEqual(cache.cache_info().evictions, 1)
+
+        cache = CachedHasher(MD5, max_bytes=3 * (10 + 16))
+        for i in range(5):
+            cache.generate_digest(b"%010d" % i)
+        info = cache.cache_info()
+        self.assertEqual((info.entries, info.evictions, info.bytes), (3, 2, 3 * 26))
+        # Messages larger than the budget are not cached
+        cache.generate_digest(bytes(100))
+        self.assertEqual(cache.cache_info().entries, 3)
+        cache.clear()
+        self.assertEqual(cache.cache_info(), (0, 0, 0, 0, 0))
+
+    def test_thread_safety(self):
+        cache = CachedHasher(SHA256, max_entries=50)
+        messages = [b"%d" % i for i in range(100)]
+        errors = []
+
+        def worker():
+            for _ in range(5):
+                for message in messages:
+                    if (
+                        cache.generate_digest(message)
+                        != hashlib.sha256(message).digest()
+                    ):
+                        errors.append(message)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        info = cache.cache_info()
+        self.assertEqual(info.hits + info.misses, 4 * 5 * 100)
+        self.assertLessEqual(info.entries, 50)
@@ -0,0 +1,115 @@
+import unittest
+import binascii
+import pickle
+import zlib
+
+from hashbase import CRC, CRC_CATALOGUE, CRC8, CRC16, parallel_crc
+
+MESSAGE = bytes(range(256)) * 4 + b"tail"
+
+
+class TestCRC(unittest.TestCase):
+    def test_catalogue_check_values(self):
+        for name, parameters in CRC_CATALOGUE.items():
+            for slicing_by_8 in (True, False):
+                crc = CRC.from_name(name, slicing_by_8=slicing_by_8)
+                self.assertEqual(crc.generate_hash("123456789"), hex(parameters.check))
+                self.assertEqual(crc.checksum(), parameters.check)
+
+    def test_slicing_by_8_matches_table(self):
+        for name in CRC_CATALOGUE:
+            for length in (0, 7, 8, 9, 63, len(MESSAGE)):
+                self.assertEqual(
+                    CRC.from_name(name).generate_hash(MESSAGE[:length]),
+                    CRC.from_name(name, slicing_by_8=False).generate_hash(
+                        MESSAGE[:length]
+                    ),
+                )
+
+    def test_widths_not_multiple_of_8(self):
+        for width in (10, 12, 21):
+            for reflected in (True, False):
+                crc = CRC(width, 0x233, 0x3, reflected, reflected, 0x1)
+                self.assertFalse(crc.slicing_by_8)
+                self.assertLessEqual(int(crc.generate_hash(MESSAGE), 16), crc.mask)
+
+    def test_standard_library(self):
+        self.assertEqual(
+            CRC.from_name("CRC-32").generate_hash(MESSAGE), hex(zlib.crc32(MESSAGE))
+        )
+        self.assertEqual(
+            CRC.from_name("CRC-16/XMODEM").generate_hash(MESSAGE),
+            hex(binascii.crc_hqx(MESSAGE, 0)),
+        )
+
+    def test_streaming(self):
+        crc = CRC.from_name("CRC-64/XZ")
+        for i in range(0, len(MESSAGE), 13):
+            crc.update(MESSAGE[i : i + 13])
+        copy = crc.copy()
+        copy.update(b"more")
+        self.assertEqual(
+            crc.checksum(), int(CRC.from_name("CRC-64/XZ").generate_hash(MESSAGE), 16)
+        )
+        self.assertEqual(crc.hexdigest(), crc.digest().hex())
+        self.assertEqual(len(crc.digest()), 8)
+        self.assertNotEqual(copy.checksum(), crc.checksum())
+        crc.reset()
+        self.assertEqual(crc.checksum(), 0)
+
+    def test_pickle(self):
+        for crc in (CRC.from_name("CRC-64/XZ"), CRC8(), CRC16(backend="python")):
+            crc.update(MESSAGE[:100])
+            restored = pickle.loads(pickle.dumps(crc))
+            restored.update(MESSAGE[100:])
+            crc.update(MESSAGE[100:])
+            self.assertEqual(restored.checksum(), crc.checksum())
+
+    def test_crc8_crc16_parameters(self):
+        self.assertEqual(CRC8().generate_hash("123456789"), hex(0xF4))
+        self.assertEqual(CRC16().generate_hash("123456789"), hex(0xFEE8))
+        self.assertEqual(CRC16(poly=0x1021, init_value=0xFFFF).init_value, 0xFFFF)
+        self.assertIsInstance(CRC16(), CRC)
+        # from_name is inherited, but builds a CRC from the catalogue parameters
+        modbus = CRC16.from_name("CRC-16/MODBUS")
+        self.assertEqual(int(modbus.generate_hash("123456789"), 16), 0x4B37)
+        self.assertEqual(CRC8.from_name("CRC-8").generate_hash("123456789"), hex(0xF4))
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            CRC.from_name("CRC-33")
+        with self.assertRaises(ValueError):
+            CRC(5, 0x15)
+        self.assertEqual(
+            CRC.from_name("crc-16/modbus").checksum(),
+            CRC.from_name("CRC-16/MODBUS").checksum(),
+        )
+
+    def test_combine(self):
+        crcs = [CRC.from_name(name) for name in CRC_CATALOGUE]
+        crcs.append(CRC(12, 0x80F, 0x5, True, False, 0x3))
+        for crc in crcs:
+            for split in (0, 1, 100, len(MESSAGE)):
+                a, b = MESSAGE[:split], MESSAGE[split:]
+                self.assertEqual(
+                    crc.combine(
+                        int(crc.generate_hash(a), 16),
+                        int(crc.generate_hash(b), 16),
+                        len(b),
+                    ),
+                    int(crc.generate_hash(MESSAGE), 16),
+                )
+
+    def test_parallel_crc(self):
+        message = MESSAGE * 20
+        self.assertEqual(parallel_crc(message), zlib.crc32(message))
+        for workers in (1, 2):
+            self.assertEqual(
+                parallel_crc(message, "CRC-32", workers=workers, chunk_size=3000),
+                zlib.crc32(message),
+            )
+        crc = CRC.from_name("CRC-16/MODBUS")
+        self.assertEqual(
+            parallel_crc(memoryview(message), crc, workers=2, chunk_size=1000),
+            int(crc.generate_hash(message), 16),
+        )
@@ -0,0 +1,43 @@
+import base64
+import hashlib
+import unittest
+
+from hashbase import Digest, MD5, SHA224, SHA256, SHA384, SHA512_224, RIPEMD160
+
+
+class TestDigest(unittest.TestCase):
+    def test_digest_bytes(self):
+        for hash_function, name in (
+            (MD5, "md5"),
+            (SHA224, "sha224"),
+            (SHA256, "sha256"),
+            (SHA384, "sha384"),
+            (SHA512_224, "sha512_224"),
+        ):
+            hasher = hash_function()
+            hasher.update("password")
+            expected = hashlib.new(name, b"password").digest()
+            self.assertEqual(hasher.digest(), expected)
+            self.assertEqual(len(hasher.digest()), hasher.digest_size)
+
+    def test_generate_digest(self):
+        digest = RIPEMD160().generate_digest("password")
+        expected = bytes.fromhex("2c08e8f5884750a7b99f6f2f342fc638db25ff31")
+        self.assertIsInstance(digest, Digest)
+        self.assertEqual(bytes(digest), expected)
+        self.assertEqual(digest.hex(), expected.hex())
+        self.assertEqual(str(digest), expected.hex())
+        self.assertEqual(digest.base64(), base64.b64encode(expected).decode())
+        self.assertEqual(
+            digest.base64(urlsafe=True), base64.urlsafe_b64encode(expected).decode()
+        )
+        self.assertEqual(int(digest), int(expected.hex(), 16))
+        self.assertEqual(len(digest), 20)
+
+    def test_equality_and_hashing(self):
+        first = SHA256().generate_digest("a")
+        second = SHA256().generate_digest("a")
+        self.assertEqual(first, second)
+        self.assertEqual(first, bytes(second))
+        self.assertNotEqual(first, SHA256().generate_digest("b"))
+        self.assertEqual(len({first, second}), 1)
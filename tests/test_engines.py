@@ -0,0 +1,53 @@
+import unittest
+import json
+
+from hashbase import MD4, MD5, SHA1, SHA224, SHA256, SHA384, SHA512, SHA512_224
+
+UNROLLED_HASH_FUNCTIONS = {
+    "MD5": MD5,
+    "SHA1": SHA1,
+    "SHA224": SHA224,
+    "SHA256": SHA256,
+    "SHA384": SHA384,
+    "SHA512": SHA512,
+    "SHA512_224": SHA512_224,
+}
+
+
+class TestEngines(unittest.TestCase):
+    # The engines are only used by the Python backend
+    def test_engines_match_test_cases(self):
+        with open("tests/test_cases.json", "r") as f:
+            test_cases = json.load(f)
+
+        for name, hash_function in UNROLLED_HASH_FUNCTIONS.items():
+            self.assertIsNotNone(hash_function.unrolled_process_message_block)
+            for engine in ("reference", "unrolled"):
+                hasher = hash_function(backend="python")
+                hasher.engine = engine
+                for test_case in test_cases:
+                    self.assertEqual(
+                        hasher.generate_hash(test_case["message"]),
+                        test_case["expected"][name],
+                    )
+
+    def test_engines_match_long_messages(self):
+        message = bytes(range(256)) * 5
+        for hash_function in UNROLLED_HASH_FUNCTIONS.values():
+            reference = hash_function(backend="python")
+            reference.engine = "reference"
+            for length in (0, 55, 64, 111, 128, 1000, 1280):
+                self.assertEqual(
+                    hash_function(backend="python").generate_hash(message[:length]),
+                    reference.generate_hash(message[:length]),
+                )
+
+    def test_fallback_to_reference(self):
+        self.assertIsNone(MD4.unrolled_process_message_block)
+        self.assertEqual(MD4().generate_hash("abc"), "a448017aaf21d8525fc10ae87aa6729d")
+
+    def test_unknown_engine(self):
+        hasher = SHA256(backend="python")
+        hasher.engine = "assembly"
+        with self.assertRaises(ValueError):
+            hasher.update("abc")
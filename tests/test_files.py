@@ -0,0 +1,68 @@
+import unittest
+import hashlib
+import os
+import tempfile
+import zlib
+
+from hashbase import CRC, CRC16, MD2, SHA256, SHA512, hash_file
+
+
+class TestHashFile(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.data = bytes(range(256)) * 1000 + b"\xff\xfe non-ASCII tail"
+        self.path = os.path.join(directory.name, "data.bin")
+        with open(self.path, "wb") as f:
+            f.write(self.data)
+        self.empty_path = os.path.join(directory.name, "empty.bin")
+        open(self.empty_path, "wb").close()
+
+    def test_mmap(self):
+        for chunk_size in (1, 100, 4096, 10**7):
+            self.assertEqual(
+                bytes(hash_file(self.path, SHA256, chunk_size)),
+                hashlib.sha256(self.data).digest(),
+            )
+        self.assertEqual(
+            bytes(hash_file(self.path, SHA512)), hashlib.sha512(self.data).digest()
+        )
+        self.assertEqual(hash_file(self.empty_path, SHA256), hashlib.sha256().digest())
+
+    def test_python_backend(self):
+        def python_sha256():
+            return SHA256(backend="python")
+
+        self.assertEqual(
+            hash_file(self.path, python_sha256, 1000).hex(),
+            hashlib.sha256(self.data).hexdigest(),
+        )
+
+    def test_crc_and_md2(self):
+        self.assertEqual(
+            int(hash_file(self.path, lambda: CRC.from_name("CRC-32"))),
+            zlib.crc32(self.data),
+        )
+        self.assertEqual(
+            int(hash_file(self.path, CRC16, 333)),
+            int(CRC16().generate_hash(self.data), 16),
+        )
+        self.assertEqual(
+            hash_file(self.empty_path, MD2).hex(), MD2().generate_hash(b"")
+        )
+        for chunk_size in (1, 100, 4096):
+            self.assertEqual(
+                hash_file(self.path, MD2, chunk_size).hex(),
+                MD2().generate_hash(self.data),
+            )
+
+    @unittest.skipUnless(os.path.isdir("/dev/fd"), "/dev/fd is not available")
+    def test_pipe(self):
+        read_fd, write_fd = os.pipe()
+        with open(write_fd, "wb") as f:
+            f.write(self.data[:4000])
+        self.assertEqual(
+            bytes(hash_file(f"/dev/fd/{read_fd}", SHA256, 1000)),
+            hashlib.sha256(self.data[:4000]).digest(),
+        )
+        os.close(read_fd)
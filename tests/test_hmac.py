@@ -0,0 +1,91 @@
+import unittest
+import hashlib
+import hmac as standard_hmac
+
+from hashbase import (
+    MD2,
+    MD5,
+    SHA1,
+    SHA224,
+    SHA256,
+    SHA384,
+    SHA512,
+    RIPEMD128,
+    RIPEMD160,
+    CRC16,
+)
+from hashbase import hmac
+
+HASH_FUNCTIONS = {
+    "md5": MD5,
+    "sha1": SHA1,
+    "sha224": SHA224,
+    "sha256": SHA256,
+    "sha384": SHA384,
+    "sha512": SHA512,
+}
+
+
+class TestHMAC(unittest.TestCase):
+    def test_standard_library(self):
+        message = bytes(range(256)) * 3
+        for key in (b"", b"key", b"k" * 64, b"k" * 200):
+            for name, hash_function in HASH_FUNCTIONS.items():
+                expected = standard_hmac.new(key, message, name).digest()
+                self.assertEqual(
+                    hmac.new(key, hash_function, message).digest(), expected
+                )
+                mac = hmac.new(key, hash_function)
+                mac.update(message[:100])
+                mac.update(message[100:])
+                self.assertEqual(mac.digest(), expected)
+                self.assertTrue(mac.verify(expected))
+                self.assertFalse(mac.verify(bytes(len(expected))))
+
+    def test_ripemd(self):
+        # RFC 2286 test case 1
+        key = b"\x0b" * 20
+        self.assertEqual(
+            hmac.new(key[:16], RIPEMD128, "Hi There").hexdigest(),
+            "fbf61f9492aa4bbf81c172e84e0734db",
+        )
+        self.assertEqual(
+            hmac.new(key, RIPEMD160, "Hi There").hexdigest(),
+            "24cb4bd67d20fc1a5d2ed7732dcc39377f0a5668",
+        )
+
+    def test_midstates_are_reused(self):
+        mac = hmac.new(b"secret", SHA256)
+        for message in (b"first", b"second", b""):
+            self.assertEqual(
+                mac.generate_digest(message),
+                standard_hmac.new(b"secret", message, hashlib.sha256).digest(),
+            )
+        mac.update(b"partial")
+        clone = mac.copy()
+        clone.update(b" message")
+        self.assertEqual(
+            mac.digest(), standard_hmac.new(b"secret", b"partial", "sha256").digest()
+        )
+        self.assertEqual(
+            clone.digest(),
+            standard_hmac.new(b"secret", b"partial message", "sha256").digest(),
+        )
+
+    def test_md2(self):
+        # The standard library accepts any constructor of a hash function with the hashlib interface as digestmod
+        def md2_constructor(data=b""):
+            hasher = MD2()
+            hasher.update(data)
+            return hasher
+
+        message = bytes(range(256))
+        for key in (b"key", b"k" * 40):
+            self.assertEqual(
+                hmac.new(key, MD2, message).digest(),
+                standard_hmac.new(key, message, md2_constructor).digest(),
+            )
+
+    def test_unsupported_algorithm(self):
+        with self.assertRaises(TypeError):
+            hmac.new(b"key", CRC16)
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+import unittest
+
+import hashbase
+
+
+def loaded_modules(statement):
+    """The hashbase modules loaded by an import statement in a fresh interpreter."""
+    return set(
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"import sys\n{statement}\n"
+                "print(' '.join(m for m in sys.modules if m.startswith('hashbase')))",
+            ],
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        ).stdout.split()
+    )
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "Python 3.6 imports the package eagerly")
+class TestLazyImports(unittest.TestCase):
+    def test_import_package_loads_no_algorithm(self):
+        self.assertEqual(loaded_modules("import hashbase"), {"hashbase"})
+
+    def test_import_one_algorithm(self):
+        self.assertEqual(
+            loaded_modules("from hashbase import SHA256"),
+            {
+                "hashbase",
+                "hashbase.backends",
+                "hashbase.codegen",
+                "hashbase.digest",
+                "hashbase.merkle_damgard",
+                "hashbase.sha256",
+                "hashbase.utils",
+            },
+        )
+        self.assertNotIn(
+            "hashbase.sha256", loaded_modules("from hashbase import SHA384")
+        )
+        self.assertNotIn(
+            "multiprocessing", loaded_modules("from hashbase import CRC16")
+        )
+
+    def test_public_names(self):
+        for name in hashbase.__all__:
+            self.assertIs(getattr(hashbase, name), getattr(hashbase, name))
+            self.assertIn(name, dir(hashbase))
+        self.assertIs(hashbase.SHA384.__mro__[1], hashbase.SHA512)
+        with self.assertRaises(AttributeError):
+            hashbase.SHA3
+
+    def test_submodules(self):
+        from hashbase import hmac
+
+        self.assertEqual(hmac.new(b"key", hashbase.MD5).digest_size, 16)
@@ -0,0 +1,73 @@
+import hashlib
+import unittest
+from functools import partial
+
+from hashbase import MD5, SHA1, SHA256, SHA384, SHA512, SHA512_224
+from hashbase.kdf import hkdf, pbkdf2
+
+
+class TestKDF(unittest.TestCase):
+    def test_pbkdf2_matches_hashlib(self):
+        for algorithm, name in (
+            (MD5, "md5"),
+            (SHA1, "sha1"),
+            (SHA256, "sha256"),
+            (SHA384, "sha384"),
+            (SHA512, "sha512"),
+        ):
+            for backend in ("auto", "python"):
+                for iterations, dklen in ((1, None), (3, None), (10, 100), (7, 5)):
+                    with self.subTest(
+                        name, backend=backend, iterations=iterations, dklen=dklen
+                    ):
+                        self.assertEqual(
+                            pbkdf2(
+                                partial(algorithm, backend=backend),
+                                b"password",
+                                b"salt",
+                                iterations,
+                                dklen,
+                            ),
+                            hashlib.pbkdf2_hmac(
+                                name, b"password", b"salt", iterations, dklen
+                            ),
+                        )
+
+    def test_pbkdf2_generic_loop(self):
+        # The 28-byte digest of SHA-512/224 is not a whole number of 64-bit words
+        python_sha512_224 = partial(SHA512_224, backend="python")
+        key = pbkdf2(python_sha512_224, "pass\x00word", "sa\x00lt", 5, 40)
+        if "sha512_224" in hashlib.algorithms_available:
+            self.assertEqual(
+                key,
+                hashlib.pbkdf2_hmac("sha512_224", b"pass\x00word", b"sa\x00lt", 5, 40),
+            )
+        self.assertEqual(len(key), 40)
+
+    def test_pbkdf2_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            pbkdf2(SHA256, b"password", b"salt", 0)
+        with self.assertRaises(ValueError):
+            pbkdf2(SHA256, b"password", b"salt", 1, 0)
+
+    def test_hkdf(self):
+        # RFC 5869, test case 1
+        for backend in ("auto", "python"):
+            with self.subTest(backend=backend):
+                self.assertEqual(
+                    hkdf(
+                        partial(SHA256, backend=backend),
+                        bytes([0x0B] * 22),
+                        42,
+                        salt=bytes(range(0x0D)),
+                        info=bytes(range(0xF0, 0xFA)),
+                    ).hex(),
+                    "3cb25f25faacd57a90434f64d0362f2a2d2d0a90cf1a5a4c5db02d56ecc4c5bf34007208d5b887185865",
+                )
+        # RFC 5869, test case 7 (SHA-1, no salt and no info)
+        self.assertEqual(
+            hkdf(SHA1, bytes([0x0C] * 22), 42).hex(),
+            "2c91117204d745f3500d636a62f64f0ab3bae548aa53d423b0d1f27ebba6f5e5673a081d70cce7acfc48",
+        )
+        with self.assertRaises(ValueError):
+            hkdf(SHA256, b"key", 255 * 32 + 1)
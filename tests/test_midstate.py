@@ -0,0 +1,79 @@
+import pickle
+import unittest
+
+from hashbase import (
+    MD4,
+    MD5,
+    SHA1,
+    SHA224,
+    SHA256,
+    SHA384,
+    SHA512,
+    SHA512_256,
+    RIPEMD128,
+    RIPEMD160,
+    RIPEMD256,
+    RIPEMD320,
+)
+
+ALGORITHMS = (
+    MD4,
+    MD5,
+    SHA1,
+    SHA224,
+    SHA256,
+    SHA384,
+    SHA512,
+    SHA512_256,
+    RIPEMD128,
+    RIPEMD160,
+    RIPEMD256,
+    RIPEMD320,
+)
+
+
+class TestMidstate(unittest.TestCase):
+    def test_resume_from_midstate(self):
+        prefix = bytes(range(256)) * 3 + b"tenant"
+        for algorithm in ALGORITHMS:
+            hasher = algorithm(backend="python")
+            hasher.update(prefix)
+            midstate = pickle.loads(pickle.dumps(hasher.export_midstate()))
+            self.assertLess(len(midstate.buffer), hasher.block_size)
+            for message in (b"", b"abc", b"x" * 200):
+                with self.subTest(algorithm.__name__, length=len(message)):
+                    resumed = algorithm.from_midstate(midstate)
+                    resumed.update(message)
+                    expected = algorithm()
+                    expected.update(prefix + message)
+                    self.assertEqual(resumed.digest(), expected.digest())
+                    self.assertEqual(resumed.active_backend, "python")
+
+    def test_import_into_existing_hasher(self):
+        hasher = SHA512(224, backend="python")
+        hasher.update(b"prefix")
+        resumed = SHA512(224)
+        resumed.update(b"discarded")
+        resumed.import_midstate(hasher.export_midstate())
+        resumed.update(b" message")
+        self.assertEqual(
+            resumed.digest(), SHA512(224).generate_digest("prefix message")
+        )
+
+    def test_assigned_backend(self):
+        # Assigning the backend of a fresh hash function takes effect without a reset
+        hasher = SHA256()
+        hasher.backend = "python"
+        hasher.update(b"x")
+        resumed = SHA256.from_midstate(hasher.export_midstate())
+        self.assertEqual(resumed.digest(), SHA256().generate_digest(b"x"))
+
+    def test_invalid_midstates(self):
+        midstate = SHA256(backend="python").export_midstate()
+        with self.assertRaises(ValueError):
+            SHA224.from_midstate(midstate)
+        with self.assertRaises(ValueError):
+            SHA256.from_midstate(midstate._replace(buffer=bytes(64)))
+        if SHA1().active_backend == "hashlib":
+            with self.assertRaises(ValueError):
+                SHA1().export_midstate()
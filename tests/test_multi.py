@@ -0,0 +1,97 @@
+import unittest
+import hashlib
+import zlib
+from functools import partial
+
+from hashbase import (
+    CRC,
+    CRC16,
+    MD4,
+    MD5,
+    SHA1,
+    SHA224,
+    SHA256,
+    SHA384,
+    SHA512,
+    MultiHasher,
+)
+
+MESSAGE = bytes(range(256)) * 20 + b"tail"
+
+
+class TestMultiHasher(unittest.TestCase):
+    def test_digests(self):
+        multi_hasher = MultiHasher([MD5, SHA1, SHA256, CRC16])
+        for i in range(0, len(MESSAGE), 1000):
+            multi_hasher.update(MESSAGE[i : i + 1000])
+        digests = multi_hasher.digests()
+        self.assertEqual(list(digests), ["MD5", "SHA1", "SHA256", "CRC16"])
+        self.assertEqual(bytes(digests["MD5"]), hashlib.md5(MESSAGE).digest())
+        self.assertEqual(bytes(digests["SHA1"]), hashlib.sha1(MESSAGE).digest())
+        self.assertEqual(digests["SHA256"].hex(), hashlib.sha256(MESSAGE).hexdigest())
+        self.assertEqual(int(digests["CRC16"]), int(CRC16().generate_hash(MESSAGE), 16))
+
+    def test_shared_blocks(self):
+        multi_hasher = MultiHasher(
+            {
+                "md4": partial(MD4, backend="python"),
+                "md5": partial(MD5, backend="python"),
+                "sha1": partial(SHA1, backend="python"),
+                "sha224": partial(SHA224, backend="python"),
+                "sha256": partial(SHA256, backend="python"),
+                "sha384": partial(SHA384, backend="python"),
+                "sha512": partial(SHA512, backend="python"),
+                "crc32": lambda: CRC.from_name("CRC-32"),
+            }
+        )
+        # SHA-1/SHA-224/SHA-256 and SHA-384/SHA-512 share their blocks, MD5 (alone), MD4 (no generated
+        # compression function) and the CRC do not
+        self.assertEqual(
+            sorted(len(group[0]) for group in multi_hasher.shared_groups), [2, 3]
+        )
+        self.assertEqual(len(multi_hasher.separate_hashers), 3)
+        for chunk_size in (1, 37, 64, 1000):
+            multi_hasher.reset()
+            for i in range(0, len(MESSAGE), chunk_size):
+                multi_hasher.update(MESSAGE[i : i + chunk_size])
+            digests = multi_hasher.hexdigests()
+            for name in ("md5", "sha1", "sha224", "sha256", "sha384", "sha512"):
+                self.assertEqual(digests[name], hashlib.new(name, MESSAGE).hexdigest())
+            self.assertEqual(digests["md4"], MD4().generate_hash(MESSAGE))
+            self.assertEqual(int(digests["crc32"], 16), zlib.crc32(MESSAGE))
+
+    def test_hashers_with_data_are_not_shared(self):
+        prefix = SHA256(backend="python")
+        prefix.update(MESSAGE[:100])
+        midstate = prefix.export_midstate()
+        multi_hasher = MultiHasher(
+            {
+                "resumed": lambda: SHA256.from_midstate(midstate),
+                "sha1": partial(SHA1, backend="python"),
+                "sha256": partial(SHA256, backend="python"),
+            }
+        )
+        # SHA-1 and SHA-256 share their blocks, the resumed SHA-256 is 100 bytes ahead
+        self.assertEqual([len(group[0]) for group in multi_hasher.shared_groups], [2])
+        multi_hasher.update(MESSAGE[100:])
+        digests = multi_hasher.hexdigests()
+        self.assertEqual(digests["resumed"], hashlib.sha256(MESSAGE).hexdigest())
+        self.assertEqual(digests["sha256"], hashlib.sha256(MESSAGE[100:]).hexdigest())
+        self.assertEqual(digests["sha1"], hashlib.sha1(MESSAGE[100:]).hexdigest())
+
+    def test_copy_and_generate_digests(self):
+        multi_hasher = MultiHasher([SHA256, MD5])
+        multi_hasher.update(MESSAGE[:100])
+        clone = multi_hasher.copy()
+        clone.update(MESSAGE[100:])
+        self.assertEqual(
+            multi_hasher.digests(),
+            MultiHasher([SHA256, MD5]).generate_digests(MESSAGE[:100]),
+        )
+        self.assertEqual(clone.digests()["SHA256"], hashlib.sha256(MESSAGE).digest())
+
+    def test_duplicate_names(self):
+        with self.assertRaises(ValueError):
+            MultiHasher(
+                [lambda: CRC.from_name("CRC-32"), lambda: CRC.from_name("CRC-32C")]
+            )
@@ -0,0 +1,58 @@
+import hashlib
+import unittest
+from functools import partial
+
+from hashbase import MD5, SHA256, RIPEMD160
+from hashbase.parallel import hash_many
+
+
+class TestParallel(unittest.TestCase):
+    def test_hash_many_in_order(self):
+        messages = [bytes([i % 256]) * (i % 300) for i in range(1000)]
+        expected = [hashlib.sha256(message).digest() for message in messages]
+        for executor in ("process", "thread"):
+            for workers in (1, 3):
+                with self.subTest(executor=executor, workers=workers):
+                    self.assertEqual(
+                        list(
+                            hash_many(
+                                iter(messages),
+                                SHA256,
+                                workers=workers,
+                                executor=executor,
+                                max_in_flight_bytes=10000,
+                            )
+                        ),
+                        expected,
+                    )
+
+    def test_python_backend_in_processes(self):
+        messages = ["message %d" % i for i in range(200)] + [bytearray(b"buffer")]
+        digests = list(hash_many(messages, partial(MD5, backend="python"), workers=2))
+        self.assertEqual(
+            digests,
+            [
+                hashlib.md5(
+                    message.encode() if isinstance(message, str) else message
+                ).digest()
+                for message in messages
+            ],
+        )
+
+    def test_stop_early(self):
+        def messages():
+            index = 0
+            while True:
+                yield index.to_bytes(8, "big")
+                index += 1
+
+        digests = hash_many(messages(), RIPEMD160, workers=2, executor="thread")
+        first = [next(digests) for _ in range(100)]
+        digests.close()
+        self.assertEqual(
+            first[99], RIPEMD160().generate_digest((99).to_bytes(8, "big"))
+        )
+
+    def test_unknown_executor(self):
+        with self.assertRaises(ValueError):
+            hash_many([b"abc"], SHA256, executor="cluster")
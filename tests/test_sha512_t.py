@@ -0,0 +1,82 @@
+import hashlib
+import pickle
+import subprocess
+import sys
+import unittest
+
+from hashbase import SHA512_224, SHA512_256, SHA512_t
+from hashbase import sha512_t
+from hashbase.parallel import hash_many
+
+
+class TestSHA512t(unittest.TestCase):
+    def test_derived_initial_register_values(self):
+        for t, algorithm in ((224, SHA512_224), (256, SHA512_256)):
+            with self.subTest(t=t):
+                self.assertEqual(
+                    SHA512_t(t).initial_register_values,
+                    algorithm.initial_register_values,
+                )
+
+    def test_hashes(self):
+        for t in (224, 256):
+            if f"sha512_{t}" in hashlib.algorithms_available:
+                for backend in ("auto", "python"):
+                    with self.subTest(t=t, backend=backend):
+                        hasher = SHA512_t(t)()
+                        hasher.backend = backend
+                        self.assertEqual(
+                            hasher.generate_hash("abc"),
+                            hashlib.new(f"sha512_{t}", b"abc").hexdigest(),
+                        )
+        sha512_192 = SHA512_t(192)()
+        self.assertEqual(type(sha512_192).__name__, "SHA512_192")
+        self.assertEqual(sha512_192.digest_size, 24)
+        self.assertEqual(sha512_192.active_backend, "python")
+        self.assertEqual(len(sha512_192.generate_hash("abc")), 48)
+        # A different IV, not a truncation of SHA-512/256
+        self.assertFalse(
+            SHA512_256()
+            .generate_hash("abc")
+            .startswith(sha512_192.generate_hash("abc"))
+        )
+
+    def test_classes_are_cached(self):
+        self.assertIs(SHA512_t(192), SHA512_t(192))
+
+    def test_invalid_sizes(self):
+        for t in (0, 12, 384, 512, 1024):
+            with self.subTest(t=t), self.assertRaises(ValueError):
+                SHA512_t(t)
+
+    def test_pickle(self):
+        sha512_192 = SHA512_t(192)
+        self.assertIs(pickle.loads(pickle.dumps(sha512_192)), sha512_192)
+        hasher = sha512_192()
+        hasher.update(b"prefix")
+        clone = pickle.loads(pickle.dumps(hasher))
+        self.assertIs(type(clone), sha512_192)
+        clone.update(b" message")
+        self.assertEqual(
+            clone.digest(), sha512_192().generate_digest(b"prefix message")
+        )
+        # A fresh process creates the class when pickle looks it up in the module
+        code = "import pickle, sys; print(pickle.loads(sys.stdin.buffer.read())().generate_hash('abc'))"
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            input=pickle.dumps(SHA512_t(136)),
+            stdout=subprocess.PIPE,
+            check=True,
+        ).stdout
+        self.assertEqual(output.decode().strip(), SHA512_t(136)().generate_hash("abc"))
+        self.assertIs(sha512_t.SHA512_136, SHA512_t(136))
+        with self.assertRaises(AttributeError):
+            sha512_t.SHA512_384
+
+    def test_hash_many_in_processes(self):
+        messages = [b"message %d" % i for i in range(20)]
+        sha512_192 = SHA512_t(192)
+        self.assertEqual(
+            list(hash_many(messages, sha512_192, workers=2)),
+            [sha512_192().generate_digest(message) for message in messages],
+        )
@@ -0,0 +1,112 @@
+import hashlib
+import unittest
+import json
+
+from hashbase import (
+    MD2,
+    MD4,
+    MD5,
+    SHA1,
+    SHA224,
+    SHA256,
+    SHA384,
+    SHA512,
+    SHA512_224,
+    SHA512_256,
+    RIPEMD128,
+    RIPEMD160,
+    RIPEMD256,
+    RIPEMD320,
+)
+
+HASH_FUNCTIONS = {
+    "MD2": MD2,
+    "MD4": MD4,
+    "MD5": MD5,
+    "SHA1": SHA1,
+    "SHA224": SHA224,
+    "SHA256": SHA256,
+    "SHA384": SHA384,
+    "SHA512": SHA512,
+    "SHA512_224": SHA512_224,
+    "SHA512_256": SHA512_256,
+    "RIPEMD128": RIPEMD128,
+    "RIPEMD160": RIPEMD160,
+    "RIPEMD256": RIPEMD256,
+    "RIPEMD320": RIPEMD320,
+}
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        with open("tests/test_cases.json", "r") as f:
+            self.test_cases = json.load(f)
+
+    def test_update_in_chunks(self):
+        for test_case in self.test_cases:
+            message = test_case["message"]
+            for name, hash_function in HASH_FUNCTIONS.items():
+                for chunk_size in (1, 7, 64, 129):
+                    hasher = hash_function()
+                    for i in range(0, len(message), chunk_size):
+                        hasher.update(message[i : i + chunk_size])
+                    self.assertEqual(
+                        hasher.hexdigest(), test_case["expected"][name], name
+                    )
+                    self.assertEqual(
+                        hasher.digest(), bytes.fromhex(test_case["expected"][name])
+                    )
+
+    def test_digest_does_not_modify_the_state(self):
+        for name, hash_function in HASH_FUNCTIONS.items():
+            hasher = hash_function()
+            hasher.update("a")
+            hasher.hexdigest()
+            hasher.update("bc")
+            self.assertEqual(hasher.hexdigest(), hash_function().generate_hash("abc"))
+
+    def test_copy(self):
+        for name, hash_function in HASH_FUNCTIONS.items():
+            hasher = hash_function()
+            hasher.update("a" * 100)
+            clone = hasher.copy()
+            clone.update("b")
+            hasher.update("c")
+            self.assertEqual(
+                clone.hexdigest(), hash_function().generate_hash("a" * 100 + "b")
+            )
+            self.assertEqual(
+                hasher.hexdigest(), hash_function().generate_hash("a" * 100 + "c")
+            )
+
+    def test_long_message(self):
+        message = "".join(chr(ord("a") + i % 26) for i in range(1000))
+        for name, hash_function in (
+            ("md5", MD5),
+            ("sha1", SHA1),
+            ("sha256", SHA256),
+            ("sha512", SHA512),
+        ):
+            hasher = hash_function()
+            for i in range(0, len(message), 100):
+                hasher.update(message[i : i + 100])
+            self.assertEqual(
+                hasher.hexdigest(), hashlib.new(name, message.encode()).hexdigest()
+            )
+
+    def test_reuse_instance(self):
+        for name, hash_function in HASH_FUNCTIONS.items():
+            hasher = hash_function()
+            for test_case in self.test_cases:
+                self.assertEqual(
+                    hasher.generate_hash(test_case["message"]),
+                    test_case["expected"][name],
+                )
+
+    def test_reset(self):
+        for name, hash_function in HASH_FUNCTIONS.items():
+            hasher = hash_function()
+            hasher.update("discarded")
+            hasher.reset()
+            hasher.update("abc")
+            self.assertEqual(hasher.hexdigest(), hash_function().generate_hash("abc"))
@@ -0,0 +1,97 @@
+import hashlib
+import unittest
+from functools import partial
+
+from hashbase import MD5, SHA256
+from hashbase.tree import TreeHasher
+
+
+def reference_tree_hash(leaves):
+    # The recursive definition of RFC 6962, section 2.1
+    if not leaves:
+        return hashlib.sha256().digest()
+    if len(leaves) == 1:
+        return hashlib.sha256(b"\x00" + leaves[0]).digest()
+    split = 1
+    while split * 2 < len(leaves):
+        split *= 2
+    return hashlib.sha256(
+        b"\x01"
+        + reference_tree_hash(leaves[:split])
+        + reference_tree_hash(leaves[split:])
+    ).digest()
+
+
+class TestTreeHasher(unittest.TestCase):
+    def test_root_matches_rfc_6962(self):
+        data = bytes(range(256)) * 4
+        for length in (0, 1, 7, 8, 9, 64, 65, 100, 1024):
+            with self.subTest(length=length):
+                leaves = [data[i : min(i + 8, length)] for i in range(0, length, 8)]
+                tree = TreeHasher(SHA256, leaf_size=8, workers=1)
+                self.assertEqual(
+                    tree.generate_digest(data[:length]), reference_tree_hash(leaves)
+                )
+
+    def test_incremental_updates(self):
+        data = bytes(range(256)) * 10
+        tree = TreeHasher(MD5, leaf_size=100, workers=1)
+        expected = tree.generate_digest(data)
+        tree.reset()
+        for start in range(0, len(data), 37):
+            tree.update(data[start : start + 37])
+            snapshot = tree.copy()
+        self.assertEqual(tree.digest(), expected)
+        self.assertEqual(snapshot.digest(), expected)
+        self.assertLessEqual(len(tree.frontier), tree.leaf_count.bit_length())
+
+    def test_copy_is_independent(self):
+        # Complete leaves wait in a list until 2 per worker are pending, which the copy must not share
+        python_sha256 = partial(SHA256, backend="python")
+        with TreeHasher(python_sha256, leaf_size=4, workers=4) as tree:
+            tree.update(b"abcd")
+            with tree.copy() as clone:
+                clone.update(b"efghijkl")
+                self.assertEqual(
+                    clone.digest(), reference_tree_hash([b"abcd", b"efgh", b"ijkl"])
+                )
+            self.assertEqual(tree.digest(), reference_tree_hash([b"abcd"]))
+            self.assertEqual(tree.leaf_count, 1)
+
+    def test_parallel_leaf_hashing(self):
+        data = bytes(range(256)) * 40
+        python_sha256 = partial(SHA256, backend="python")
+        with TreeHasher(python_sha256, leaf_size=64, workers=2) as tree:
+            tree.update(data)
+            root = tree.digest()
+            leaf_hashes = tree.leaf_hashes(data)
+        leaves = [data[i : i + 64] for i in range(0, len(data), 64)]
+        self.assertEqual(root, reference_tree_hash(leaves))
+        self.assertEqual(
+            leaf_hashes, [hashlib.sha256(b"\x00" + leaf).digest() for leaf in leaves]
+        )
+
+    def test_inclusion_proofs(self):
+        tree = TreeHasher(SHA256, leaf_size=4, workers=1)
+        for leaf_count in range(1, 18):
+            data = bytes(range(4 * leaf_count))
+            root = tree.generate_digest(data)
+            leaf_hashes = tree.leaf_hashes(data)
+            for index in range(leaf_count):
+                with self.subTest(leaf_count=leaf_count, index=index):
+                    leaf = data[4 * index : 4 * index + 4]
+                    proof = tree.inclusion_proof(leaf_hashes, index)
+                    self.assertTrue(
+                        tree.verify_inclusion(leaf, index, leaf_count, proof, root)
+                    )
+                    self.assertFalse(
+                        tree.verify_inclusion(b"fake", index, leaf_count, proof, root)
+                    )
+                    if proof:
+                        self.assertFalse(
+                            tree.verify_inclusion(
+                                leaf, index, leaf_count, proof[:-1], root
+                            )
+                        )
+        with self.assertRaises(IndexError):
+            tree.inclusion_proof(leaf_hashes, leaf_count)
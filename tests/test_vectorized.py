@@ -0,0 +1,61 @@
+import unittest
+import hashlib
+import json
+
+from hashbase import SHA224, SHA256, SHA384, SHA512, SHA512_224, SHA512_256
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+VECTORIZED_HASH_FUNCTIONS = {
+    "SHA224": SHA224,
+    "SHA256": SHA256,
+    "SHA384": SHA384,
+    "SHA512": SHA512,
+    "SHA512_224": SHA512_224,
+    "SHA512_256": SHA512_256,
+}
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestVectorized(unittest.TestCase):
+    def test_hash_many_matches_test_cases(self):
+        with open("tests/test_cases.json", "r") as f:
+            test_cases = json.load(f)
+
+        messages = [test_case["message"] for test_case in test_cases]
+        for name, hash_function in VECTORIZED_HASH_FUNCTIONS.items():
+            digests = hash_function.hash_many(messages)
+            self.assertEqual(
+                digests.shape, (len(messages), hash_function().digest_size)
+            )
+            self.assertTrue(digests.flags.c_contiguous)
+            self.assertEqual(digests.dtype, numpy.uint8)
+            for digest, test_case in zip(digests, test_cases):
+                self.assertEqual(digest.tobytes().hex(), test_case["expected"][name])
+
+    def test_hash_many_mixed_lengths(self):
+        # Messages of a different number of blocks, including the padding edge cases
+        messages = [
+            bytes(range(256))[:length]
+            for length in (0, 55, 56, 64, 111, 112, 119, 128, 200)
+        ]
+        messages += [bytearray(b"x" * 1000), memoryview(b"password")]
+        for name, hash_function in VECTORIZED_HASH_FUNCTIONS.items():
+            digests = hash_function.hash_many(messages)
+            for digest, message in zip(digests, messages):
+                if name.lower() in hashlib.algorithms_available:
+                    self.assertEqual(
+                        digest.tobytes(), hashlib.new(name.lower(), message).digest()
+                    )
+                self.assertEqual(
+                    digest.tobytes(), hash_function().generate_digest(message)
+                )
+
+    def test_hash_many_empty(self):
+        self.assertEqual(SHA256.hash_many([]).shape, (0, 32))
+        self.assertEqual(SHA224.hash_many(iter([])).shape, (0, 28))
+        self.assertEqual(SHA384.hash_many([]).shape, (0, 48))